@@ -43,16 +43,20 @@ def _split_le_te_paths(points_closed: np.ndarray,
     -----
     - Paths are built from the UNIQUE-vertex array P = points_closed[:-1].
     - Each path includes both endpoints (LE and TE) exactly once.
+    - Index validation is gated on `__debug__` and is stripped under `python -O`.
     """
     P = points_closed[:-1]  # unique vertices
     N = P.shape[0]
-    if le_idx == te_idx:
-        raise ValueError("LE and TE indices coincide; invalid geometry or indices.")
-    if not (0 <= le_idx < N and 0 <= te_idx < N):
-        raise ValueError("LE/TE indices out of range for the given loop.")
-    # FIX (optional): guard very short paths (adjacent indices); keep disabled if acceptable.
-    if (le_idx - te_idx) % N in (1, N-1):
-        raise ValueError("LE and TE are adjacent; paths are degenerate.")
+    if __debug__:
+        if le_idx == te_idx:
+            raise ValueError("LE and TE indices coincide; invalid geometry or indices.")
+        # bit-or of two ints is negative iff at least one of them is negative
+        if (le_idx | te_idx) < 0 or le_idx >= N or te_idx >= N:
+            raise ValueError("LE/TE indices out of range for the given loop.")
+        # FIX (optional): guard very short paths (adjacent indices); keep disabled if acceptable.
+        d = (le_idx - te_idx) % N
+        if d == 1 or d == N - 1:
+            raise ValueError("LE and TE are adjacent; paths are degenerate.")
 
     if le_idx < te_idx:
         path1 = P[le_idx:te_idx + 1]
@@ -45,6 +45,7 @@ def build_mesh(
     hybrid_bl: bool = True,
     force_algo_for_bl: bool = True,
     msh_format: str = "msh4",
+    num_threads: Optional[int] = None,
 ) -> str:
     """
     Build a 2D mesh with Gmsh for the airfoil far-field domain.
@@ -85,6 +86,8 @@ def build_mesh(
         Ignored if `gmsh_algo` is provided.
     msh_format : {"msh2","msh4"}, optional
         Mesh output format for the runner. Default "msh4".
+    num_threads : int, optional
+        Gmsh thread count. Default None (all cores).
 
     Returns
     -------
@@ -177,6 +180,7 @@ def build_mesh(
         algo=gmsh_algo,
         extra_cli=extra_cli_final if extra_cli_final else None,
         msh_format=msh_format,
+        num_threads=num_threads,
     )
     logger.info("[build_mesh] .msh written to %s", msh_path)
 
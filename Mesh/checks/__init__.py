@@ -14,7 +14,11 @@ for CLI/CI/GUI consumption.
 Main Tasks
 ----------
    - Provide defaults (`DEFAULTS`) for enable/disable policy and thresholds.
-   - Orchestrate registry-defined rules over a MeshView and shared cache.
+   - Orchestrate registry-defined rules over a MeshView and shared cache
+     (served from the on-disk cache in `disk_cache.py` when the input is unchanged),
+     optionally reusing memoized per-rule findings whose thresholds did not change
+     (`cache.rule_memo`), and optionally
+     running the heavy rules in worker processes (`parallel.py`).
    - Aggregate findings and compute a top-level `ok` status.
 
 Returned Schema:
@@ -24,16 +28,20 @@ Returned Schema:
   "rules": { <rule_id>: finding_dict, ... },
   "meta": {
     "mesh_path": str, "n_points": int, "n_tris": int, "n_quads": int,
-    "thresholds": dict, "enabled": dict
+    "thresholds": dict, "enabled": dict, "stopped_at": str | None
   }
 }
+
+With `policy.early_exit`, error rules run cheapest-first and the run stops at the first
+failing error rule: `ok` is still exact, but `rules` then holds only the rules that ran
+and `meta.stopped_at` names the rule that ended the run (None for a complete run).
 """
 
 
 from typing import Dict, Any, Optional
-import copy
-from .helpers import build_mesh_view, precompute_cache
-from .registry import REGISTRY, RULES_ORDER, get_enabled_ids
+from .disk_cache import _load_or_build, load_rule_memo, normalize_finding, rule_memo_key, store_rule_memo
+from .registry import REGISTRY, RULES_ORDER, HEAVY_RULES, get_enabled_ids, get_enabled_specs, order_for_early_exit
+from .parallel import run_rule, submit_rules, shutdown
 
 
 # -------------------------
@@ -69,12 +77,24 @@ DEFAULTS: Dict[str, Any] = {
         "tiny_area_rel": 1e-3,            # relative to mean area
         "tiny_area_abs": 0.0,             # absolute area floor (optional)
         "collinear_eps": 1e-12,
-        "overlap_grid_bins": 96,
+        "overlap_grid_bins": None,         # bins per axis; None = adaptive (~2 mean cell widths)
         "wall_name": "airfoil",
         "first_layer_target": None,        # set (float) to enable first_layer_height
         "required_groups": ["inlet", "outlet", "top", "bottom", "airfoil", "fluid"],
         "group_dims": None,                # e.g., {"fluid": 2, "airfoil": 1, ...}
         "strict_if_no_field_data": False,
+        "fp32_metrics": False,             # area/angle/size metrics in float32 (half the bandwidth)
+    },
+    "policy": {
+        "early_exit": False,               # stop at the first failing error rule (CI "ok" only)
+        "parallel": False,                 # run HEAVY_RULES in forked worker processes
+        "max_workers": None,               # default: os.cpu_count()
+    },
+    "cache": {
+        "enabled": True,                   # reuse MeshView + precompute cache across runs
+        "dir": None,                       # default: ~/.cache/flowxus
+        "max_mb": 1024,                    # evict least recently used entries beyond this (None: no cap)
+        "rule_memo": False,                # also persist per-rule findings (JSON: lists, not tuples)
     },
 }
 
@@ -82,32 +102,53 @@ DEFAULTS: Dict[str, Any] = {
 # -------------------------
 # Orchestrator
 # -------------------------
+def _clone(x: Any) -> Any:
+    """
+    Copy JSON-like config data (dicts/lists of immutables); much cheaper than `copy.deepcopy`.
+    """
+    if isinstance(x, dict):
+        return {k: _clone(v) for k, v in x.items()}
+    if isinstance(x, list):
+        return [_clone(v) for v in x]
+    return x
+
+
 def _deep_merge(base: Dict[str, Any], upd: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Deep-merge two nested dicts (right-biased), preserving types and not mutating inputs.
     """
+    out = _clone(base)
     if not upd:
-        return copy.deepcopy(base)
-    out = copy.deepcopy(base)
-    for k, v in upd.items():
-        if isinstance(v, dict) and isinstance(out.get(k), dict):
-            out[k] = _deep_merge(out[k], v)  # type: ignore[arg-type]
-        else:
-            out[k] = copy.deepcopy(v)
+        return out
+    # explicit stack of (destination, update) pairs instead of recursion
+    stack = [(out, upd)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict) and isinstance(dst.get(k), dict):
+                stack.append((dst[k], v))
+            else:
+                dst[k] = _clone(v)
     return out
 
 
-def _meta(mv, cfg):
+def _meta(mv, cfg, stopped_at: Optional[str] = None):
     """
     Assemble metadata snapshot (sizes, thresholds, enabled map) for the results payload.
+    `cfg` is the fresh merge from `run_checks`, so its sub-dicts are returned by reference.
     """
+    pts, tris, quads = mv.points, mv.tris, mv.quads
+    n_points = int(len(pts)) if pts is not None else 0
+    n_tris = int(len(tris)) if tris is not None else 0
+    n_quads = int(len(quads)) if quads is not None else 0
     return {
         "mesh_path": mv.mesh_path,
-        "n_points": int(len(mv.points) if mv.points is not None else 0),
-        "n_tris": int(len(mv.tris) if mv.tris is not None else 0),
-        "n_quads": int(len(mv.quads) if mv.quads is not None else 0),
-        "thresholds": copy.deepcopy(cfg.get("thresholds", {})),
-        "enabled": copy.deepcopy(cfg.get("enabled", {})),
+        "n_points": n_points,
+        "n_tris": n_tris,
+        "n_quads": n_quads,
+        "thresholds": cfg.get("thresholds", {}),
+        "enabled": cfg.get("enabled", {}),
+        "stopped_at": stopped_at,
     }
 
 
@@ -120,7 +161,7 @@ def run_checks(msh_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[s
     msh_path : str
         Path to the Gmsh mesh file.
     config : dict, optional
-        Overrides for `DEFAULTS` with the same structure (keys: "enabled", "thresholds").
+        Overrides for `DEFAULTS` with the same structure (keys: "enabled", "thresholds", "policy", "cache").
 
     Returns
     -------
@@ -128,36 +169,80 @@ def run_checks(msh_path: str, config: Optional[Dict[str, Any]] = None) -> Dict[s
         Payload with keys:
           - "ok": bool — False iff any ERROR-severity rule fails.
           - "rules": dict — rule_id -> finding dict.
-          - "meta": dict — mesh sizes, thresholds, enabled map, mesh path.
+          - "meta": dict — mesh sizes, thresholds, enabled map, mesh path, early-exit stop.
     """
     cfg = _deep_merge(DEFAULTS, config or {})
-    mv = build_mesh_view(msh_path)
-    cache = precompute_cache(mv, cfg.get("thresholds", {}))
-
-    results: Dict[str, Any] = {}
-    enabled_ids = get_enabled_ids(cfg.get("enabled"))
-
-    for rid in enabled_ids:
-        spec = REGISTRY.get(rid)
-        if spec is None:
-            # If a user enabled a rule that isn't registered (e.g., missing warnings.py), skip gracefully
-            continue
-        finding = spec.fn(mv, cfg.get("thresholds", {}), cache)
-        # enforce severity field consistency
-        finding["severity"] = spec.severity
-        # ensure id matches registry
-        finding["id"] = rid
+    mv, cache, mesh_key = _load_or_build(msh_path, cfg)
+    # per-run view of the shared entry: derived arrays the rules add (warnings._memo)
+    # stay with this run instead of being pinned in the in-process LRU
+    cache = dict(cache)
+    th = cfg.get("thresholds", {})
+    memo_on = mesh_key is not None and bool((cfg.get("cache", {}) or {}).get("rule_memo", False))
+    memo = load_rule_memo(mesh_key, cfg) if memo_on else {}
+    memo_dirty = False
+
+    results: Dict[str, Dict[str, Any]] = {}
+    enabled_map = cfg.get("enabled")
+    enabled_ids = get_enabled_ids(enabled_map)
+    policy = cfg.get("policy", {}) or {}
+    early_exit = bool(policy.get("early_exit", False))
+    if early_exit:
+        enabled_ids = order_for_early_exit(enabled_ids)
+    stopped_at: Optional[str] = None
+
+    def _record(rid: str, mkey: Optional[str], finding: Dict[str, Any], fresh: bool) -> bool:
+        """Store a finding (and its memo entry); True if early exit should stop the run."""
+        nonlocal memo_dirty
+        if fresh and mkey is not None:
+            finding = normalize_finding(finding)  # same data as a later memo hit
+            memo[mkey] = finding
+            memo_dirty = True
         results[rid] = finding
-
-    ok = True
-    for rid, f in results.items():
-        sev = REGISTRY[rid].severity
-        if sev == "error" and not f.get("ok", False):
-            ok = False
-            break
+        return early_exit and rid in error_set and not finding.get("ok", False)
+
+    # Only registered rules are dispatched (e.g. none from a missing warnings.py)
+    specs = [REGISTRY[rid] for rid in enabled_ids] if early_exit else get_enabled_specs(enabled_map)
+    error_ids = [s.id for s in specs if s.severity == "error"]
+    error_set = frozenset(error_ids)
+    mkeys = {s.id: (rule_memo_key(s, th) if memo_on else None) for s in specs}
+    misses = {s.id for s in specs if mkeys[s.id] is None or mkeys[s.id] not in memo}
+
+    # Heavy rules start in workers right away; everything else runs here meanwhile
+    pool, futures = None, {}
+    if policy.get("parallel", False):
+        heavy = [s.id for s in specs if s.id in misses and s.id in HEAVY_RULES]
+        pool, futures = submit_rules(heavy, mv, th, cache, policy.get("max_workers"))
+
+    try:
+        for spec in specs:
+            rid, mkey = spec.id, mkeys[spec.id]
+            if rid in futures:
+                continue  # collected below
+            if rid in misses:
+                stop = _record(rid, mkey, run_rule(spec, mv, th, cache), True)
+            else:
+                stop = _record(rid, mkey, memo[mkey], False)
+            if stop:
+                stopped_at = rid
+                break
+        if stopped_at is None:
+            for rid, fut in futures.items():
+                if _record(rid, mkeys[rid], fut.result(), True):
+                    stopped_at = rid
+                    break
+    finally:
+        shutdown(pool, terminate=stopped_at is not None)
+
+    # keep the execution order regardless of where each finding was computed
+    results = {rid: results[rid] for rid in enabled_ids if rid in results}
+
+    if memo_dirty:
+        store_rule_memo(mesh_key, cfg, memo)
+
+    ok = all(results[rid].get("ok", False) for rid in error_ids if rid in results)
 
     return {
         "ok": ok,
         "rules": results,
-        "meta": _meta(mv, cfg),
+        "meta": _meta(mv, cfg, stopped_at),
     }
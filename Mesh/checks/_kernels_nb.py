@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+# Flowxus/mesh/check/_kernels_nb.py
+
+"""
+Project: Flowxus
+Author: Erfan Vaezi
+Date: 8/29/2025
+
+Purpose:
+--------
+Numba-compiled kernels for the pairwise overlap test and the index-heavy parts of
+`precompute_cache`. Mirrors the predicates in `kernels.py` but works on raw float
+coordinates and packed connectivity so whole loops run in compiled code.
+
+Main Tasks:
+-----------
+   - Scalar predicates: orientation, segment intersection, point-in-triangle/quad.
+   - `overlap_mask_nb`: exact edge-edge + centroid-containment test over (K,2) pairs.
+   - `overlap_mask_par_nb`: same test split across threads (`prange`, GIL released).
+   - `overlap_mask`: dispatcher choosing the serial or parallel kernel by pair count.
+   - `cell_edge_keys` / `grid_memberships`: per-cell packed edge keys and grid bin
+     memberships in one compiled pass over cells (sorting/uniquing stays in NumPy).
+     Edge keys come from `_edges_k3` / `_edges_k4`, with the sides unrolled per element type.
+   - `tri_metrics` / `quad_metrics`: area, angles and size per cell in one fused pass over
+     the `MeshView.px` / `.py` coordinate arrays, shared by the WARN-tier quality rules.
+   - `_precompile_numba`: compile (or load from the on-disk cache) the serial kernels up front.
+
+Inputs/Contracts:
+-----------------
+   - `points`: (N,2) float64, C-contiguous.
+   - `conn`:   (C,4) int32 unified connectivity, tris padded with -1 in column 3.
+   - `lens`:   (C,) int32 vertex count per cell (3 or 4).
+   - `pairs`:  (K,2) int32 candidate cell pairs.
+
+Notes:
+------
+   - numba is optional: without it, `njit` is a no-op decorator so the scalar kernels
+     still import, and `overlap_mask` routes to the vectorized NumPy
+     `kernels.overlap_mask_batch` (precomputed per-cell edge coordinates) instead;
+     the precompute dispatchers likewise fall back to their `kernels.*_batch` twins.
+   - `parallel.submit_rules` calls `_precompile_numba` before forking so workers inherit
+     compiled dispatchers instead of each compiling their own.
+   - Only the overlap test uses `parallel=True`. Everything that runs in the parent before
+     `policy.parallel` forks (precompute, `_precompile_numba`) must stay serial: starting
+     numba's thread pool before fork() deadlocks the workers. Once it has started (e.g. an
+     earlier serial run in the same process), `parallel_layer_started` is True and
+     `parallel.submit_rules` declines to fork.
+"""
+
+import math
+import numpy as np
+from .kernels import (cell_edge_keys_batch, grid_memberships_batch, overlap_mask_batch,
+                      quad_metrics_batch, tri_metrics_batch)
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# Below this many candidate pairs, thread start-up outweighs the parallel gain
+PARALLEL_MIN_PAIRS = 10_000
+
+
+# ---------------------------
+# Scalar predicates
+# ---------------------------
+@njit(cache=True, inline="always")
+def _orient(ax, ay, bx, by, cx, cy):
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+@njit(cache=True, inline="always")
+def _on_segment(ux, uy, vx, vy, wx, wy, eps):
+    """w on segment uv (inclusive) assuming collinearity (non-short-circuit `&`: no branches)."""
+    return (min(ux, vx) - eps <= wx) & (wx <= max(ux, vx) + eps) & \
+           (min(uy, vy) - eps <= wy) & (wy <= max(uy, vy) + eps)
+
+
+@njit(cache=True)
+def segments_intersect_nb(px, py, qx, qy, rx, ry, sx, sy, eps):
+    """
+    Scalar twin of `kernels.segments_intersect` (touching counts as intersection).
+
+    The straddle test is a branchless `&` of both sign conditions: over random candidate
+    pairs the first condition is a coin flip, so a short-circuit `and` mispredicts often.
+    The collinear tests stay behind the (predictable, almost always false) near-zero check.
+    """
+    o1 = _orient(px, py, qx, qy, rx, ry)
+    o2 = _orient(px, py, qx, qy, sx, sy)
+    o3 = _orient(rx, ry, sx, sy, px, py)
+    o4 = _orient(rx, ry, sx, sy, qx, qy)
+
+    if (o1 * o2 < -eps) & (o3 * o4 < -eps):
+        return True
+    if (abs(o1) > eps) & (abs(o2) > eps) & (abs(o3) > eps) & (abs(o4) > eps):
+        return False
+
+    return ((abs(o1) <= eps) & _on_segment(px, py, qx, qy, rx, ry, eps)) | \
+           ((abs(o2) <= eps) & _on_segment(px, py, qx, qy, sx, sy, eps)) | \
+           ((abs(o3) <= eps) & _on_segment(rx, ry, sx, sy, px, py, eps)) | \
+           ((abs(o4) <= eps) & _on_segment(rx, ry, sx, sy, qx, qy, eps))
+
+
+@njit(cache=True)
+def point_in_triangle_nb(px, py, ax, ay, bx, by, cx, cy, eps):
+    """Scalar twin of `kernels.point_in_triangle` (boundary inclusive)."""
+    v0x = cx - ax; v0y = cy - ay
+    v1x = bx - ax; v1y = by - ay
+    v2x = px - ax; v2y = py - ay
+    den = v0x * v1y - v0y * v1x
+    if abs(den) < eps:
+        return False
+    u = (v2x * v1y - v2y * v1x) / den
+    v = (v2x * v0y - v2y * v0x) / -den
+    w = 1.0 - u - v
+    return (u >= -eps) and (v >= -eps) and (w >= -eps)
+
+
+@njit(cache=True)
+def _point_in_cell(px, py, points, conn, lens, c, eps):
+    """Point-in-tri, or point-in-quad as (0,1,2) ∪ (0,2,3), for unified cell `c`."""
+    a = conn[c, 0]; b = conn[c, 1]; d = conn[c, 2]
+    if point_in_triangle_nb(px, py, points[a, 0], points[a, 1], points[b, 0], points[b, 1],
+                            points[d, 0], points[d, 1], eps):
+        return True
+    if lens[c] == 4:
+        e = conn[c, 3]
+        return point_in_triangle_nb(px, py, points[a, 0], points[a, 1], points[d, 0], points[d, 1],
+                                    points[e, 0], points[e, 1], eps)
+    return False
+
+
+# ---------------------------
+# Pairwise overlap
+# ---------------------------
+@njit(cache=True)
+def _pair_overlaps(points, conn, lens, i, j, eps, eps_in):
+    """Exact overlap test for one pair: any edge-edge hit, else either centroid inside the other."""
+    ki = lens[i]; kj = lens[j]
+    for a in range(ki):
+        u0 = conn[i, a]; u1 = conn[i, (a + 1) % ki]
+        for b in range(kj):
+            w0 = conn[j, b]; w1 = conn[j, (b + 1) % kj]
+            if segments_intersect_nb(points[u0, 0], points[u0, 1], points[u1, 0], points[u1, 1],
+                                     points[w0, 0], points[w0, 1], points[w1, 0], points[w1, 1], eps):
+                return True
+
+    cix = 0.0; ciy = 0.0
+    for a in range(ki):
+        cix += points[conn[i, a], 0]; ciy += points[conn[i, a], 1]
+    cix /= ki; ciy /= ki
+    cjx = 0.0; cjy = 0.0
+    for b in range(kj):
+        cjx += points[conn[j, b], 0]; cjy += points[conn[j, b], 1]
+    cjx /= kj; cjy /= kj
+
+    return _point_in_cell(cix, ciy, points, conn, lens, j, eps_in) or \
+        _point_in_cell(cjx, cjy, points, conn, lens, i, eps_in)
+
+
+@njit(cache=True, nogil=True)
+def overlap_mask_nb(points, conn, lens, pairs, eps, eps_in=1e-14):
+    """
+    Boolean mask over `pairs` marking cell pairs whose polygons intersect or contain
+    one another (edge-edge test with `eps`, centroid containment with `eps_in`).
+    """
+    K = pairs.shape[0]
+    out = np.zeros(K, dtype=np.bool_)
+    for k in range(K):
+        out[k] = _pair_overlaps(points, conn, lens, pairs[k, 0], pairs[k, 1], eps, eps_in)
+    return out
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def overlap_mask_par_nb(points, conn, lens, pairs, eps, eps_in=1e-14):
+    """
+    Thread-parallel `overlap_mask_nb`; each pair writes only its own output slot.
+    """
+    K = pairs.shape[0]
+    out = np.zeros(K, dtype=np.bool_)
+    for k in prange(K):
+        out[k] = _pair_overlaps(points, conn, lens, pairs[k, 0], pairs[k, 1], eps, eps_in)
+    return out
+
+
+def parallel_layer_started() -> bool:
+    """True once numba's parallel thread pool is running in this process (fork is then unsafe)."""
+    if not HAS_NUMBA:
+        return False
+    try:
+        from numba.np.ufunc import parallel as _npar
+    except Exception:
+        return False
+    return bool(getattr(_npar, "_is_initialized", False))
+
+
+def overlap_mask(points, conn, lens, pairs, eps, eps_in=1e-14):
+    """
+    Run the exact overlap test, in parallel only when numba is present and the
+    candidate set is large enough to amortize threading; NumPy batch without numba.
+    """
+    if not HAS_NUMBA:
+        return overlap_mask_batch(points, conn, lens, pairs, eps, eps_in)
+    if pairs.shape[0] >= PARALLEL_MIN_PAIRS:
+        return overlap_mask_par_nb(points, conn, lens, pairs, eps, eps_in)
+    return overlap_mask_nb(points, conn, lens, pairs, eps, eps_in)
+
+
+# ---------------------------
+# Per-cell quality metrics
+# ---------------------------
+@njit(cache=True, inline="always")
+def _corner(px, py, cx, cy, nx, ny):
+    """Interior angle at C between CP and CN: atan2(|u×v|, u·v), radians."""
+    ux = px - cx; uy = py - cy
+    vx = nx - cx; vy = ny - cy
+    return math.atan2(abs(ux*vy - uy*vx), ux*vx + uy*vy)
+
+
+@njit(cache=True, nogil=True)
+def tri_metrics_nb(px, py, tris, out_area, out_minang, out_size):
+    """One pass over `tris`: |area|, min interior angle (rad) and sqrt(|area|) per triangle."""
+    for t in range(tris.shape[0]):
+        i0 = tris[t, 0]; i1 = tris[t, 1]; i2 = tris[t, 2]
+        x0 = px[i0]; y0 = py[i0]
+        x1 = px[i1]; y1 = py[i1]
+        x2 = px[i2]; y2 = py[i2]
+        a = abs((x1 - x0)*(y2 - y0) - (y1 - y0)*(x2 - x0)) * 0.5
+        out_area[t] = a
+        out_size[t] = math.sqrt(a)
+        out_minang[t] = min(_corner(x2, y2, x0, y0, x1, y1),
+                            _corner(x0, y0, x1, y1, x2, y2),
+                            _corner(x1, y1, x2, y2, x0, y0))
+
+
+@njit(cache=True, nogil=True)
+def quad_metrics_nb(px, py, quads, out_area, out_ang, out_size):
+    """One pass over `quads`: split-triangle area, 4 interior angles (deg) and shoelace size."""
+    x = np.empty(4); y = np.empty(4)
+    for q in range(quads.shape[0]):
+        for k in range(4):
+            x[k] = px[quads[q, k]]; y[k] = py[quads[q, k]]
+        a1 = abs((x[1] - x[0])*(y[2] - y[0]) - (y[1] - y[0])*(x[2] - x[0]))
+        a2 = abs((x[3] - x[0])*(y[2] - y[0]) - (y[3] - y[0])*(x[2] - x[0]))
+        out_area[q] = (a1 + a2) * 0.5
+        s = x[0]*y[1] - y[0]*x[1]
+        for k in range(1, 4):
+            s += x[k]*y[(k + 1) % 4] - y[k]*x[(k + 1) % 4]
+        out_size[q] = math.sqrt(abs(s) / 2)
+        for k in range(4):
+            out_ang[q, k] = math.degrees(_corner(x[k - 1], y[k - 1], x[k], y[k],
+                                                 x[(k + 1) % 4], y[(k + 1) % 4]))
+
+
+def tri_metrics(px, py, tris):
+    """
+    (area, min_angle_rad, size) per triangle; one compiled pass when numba is present.
+    Outputs take the dtype of `px`/`py` (float32 in `fp32_metrics` mode).
+    """
+    if not HAS_NUMBA:
+        return tri_metrics_batch(px, py, tris)
+    T = tris.shape[0]
+    dt = np.result_type(px.dtype, py.dtype)
+    area = np.empty(T, dt); minang = np.empty(T, dt); size = np.empty(T, dt)
+    tri_metrics_nb(np.ascontiguousarray(px), np.ascontiguousarray(py), np.ascontiguousarray(tris),
+                   area, minang, size)
+    return area, minang, size
+
+
+def quad_metrics(px, py, quads):
+    """(area, angles_deg (Q,4), size) per quad; one compiled pass when numba is present."""
+    if not HAS_NUMBA:
+        return quad_metrics_batch(px, py, quads)
+    Q = quads.shape[0]
+    dt = np.result_type(px.dtype, py.dtype)
+    area = np.empty(Q, dt); ang = np.empty((Q, 4), dt); size = np.empty(Q, dt)
+    quad_metrics_nb(np.ascontiguousarray(px), np.ascontiguousarray(py), np.ascontiguousarray(quads),
+                    area, ang, size)
+    return area, ang, size
+
+
+# ---------------------------
+# Precompute index kernels
+# ---------------------------
+@njit(cache=True, inline="always")
+def _pack(a, b):
+    """Undirected edge key `min<<32 | max` of int64 node ids."""
+    return (min(a, b) << 32) | max(a, b)
+
+
+@njit(cache=True, nogil=True)
+def _edges_k3(cells, rows, out):
+    """Packed keys of the 3 sides of each tri in `rows`, written to `out[c, :3]` (unrolled)."""
+    for i in range(rows.shape[0]):
+        c = rows[i]
+        v0 = np.int64(cells[c, 0]); v1 = np.int64(cells[c, 1]); v2 = np.int64(cells[c, 2])
+        out[c, 0] = _pack(v0, v1)
+        out[c, 1] = _pack(v1, v2)
+        out[c, 2] = _pack(v2, v0)
+
+
+@njit(cache=True, nogil=True)
+def _edges_k4(cells, rows, out):
+    """Packed keys of the 4 sides of each quad in `rows`, written to `out[c, :4]` (unrolled)."""
+    for i in range(rows.shape[0]):
+        c = rows[i]
+        v0 = np.int64(cells[c, 0]); v1 = np.int64(cells[c, 1])
+        v2 = np.int64(cells[c, 2]); v3 = np.int64(cells[c, 3])
+        out[c, 0] = _pack(v0, v1)
+        out[c, 1] = _pack(v1, v2)
+        out[c, 2] = _pack(v2, v3)
+        out[c, 3] = _pack(v3, v0)
+
+
+@njit(cache=True, nogil=True)
+def grid_memberships_nb(ix, iy, offs):
+    """Fill (cell, bx, by) for every bin covered by each cell; cell c writes from `offs[c]`."""
+    C = ix.shape[0]
+    n = offs[C]
+    cid = np.empty(n, dtype=np.int64)
+    bx = np.empty(n, dtype=np.int64)
+    by = np.empty(n, dtype=np.int64)
+    for c in range(C):
+        p = offs[c]
+        for x in range(ix[c, 0], ix[c, 1] + 1):
+            for y in range(iy[c, 0], iy[c, 1] + 1):
+                cid[p] = c; bx[p] = x; by[p] = y
+                p += 1
+    return cid, bx, by
+
+
+def cell_edge_keys(cells, nverts):
+    """Per-cell packed edge keys (C,4) int64; compiled when numba is present."""
+    if not HAS_NUMBA:
+        return cell_edge_keys_batch(cells, nverts)
+    cells = np.ascontiguousarray(cells)
+    out = np.full((cells.shape[0], 4), -1, dtype=np.int64)
+    tri = (np.asarray(nverts) == 3)
+    _edges_k3(cells, np.flatnonzero(tri), out)
+    _edges_k4(cells, np.flatnonzero(~tri), out)
+    return out
+
+
+def grid_memberships(ix, iy):
+    """(cell, bx, by) for every bin each cell's range [ix, iy] covers, cell-major."""
+    if not HAS_NUMBA:
+        return grid_memberships_batch(ix, iy)
+    cnt = (ix[:, 1] - ix[:, 0] + 1) * (iy[:, 1] - iy[:, 0] + 1)
+    offs = np.zeros(len(ix) + 1, dtype=np.int64)
+    np.cumsum(cnt, out=offs[1:])
+    return grid_memberships_nb(np.ascontiguousarray(ix, dtype=np.int64),
+                               np.ascontiguousarray(iy, dtype=np.int64), offs)
+
+
+def _precompile_numba() -> None:
+    """
+    Trigger compilation (or on-disk cache load) of the serial kernels on tiny inputs.
+    `overlap_mask_par_nb` is left to compile in the workers (see Notes).
+    """
+    if not HAS_NUMBA:
+        return
+    pts = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    conn = np.array([[0, 1, 2, -1], [1, 3, 2, -1]], dtype=np.int32)
+    lens = np.array([3, 3], dtype=np.int32)
+    pairs = np.array([[0, 1]], dtype=np.int32)
+    overlap_mask_nb(pts, conn, lens, pairs, 1e-12, 1e-14)
+    quad = np.array([[0, 1, 3, 2]], dtype=np.int32)
+    cell_edge_keys(np.vstack([conn, quad]), np.array([3, 3, 4], dtype=np.int32))
+    px = np.ascontiguousarray(pts[:, 0]); py = np.ascontiguousarray(pts[:, 1])
+    tri_metrics(px, py, conn[:, :3])
+    quad_metrics(px, py, quad)
+    grid_memberships(np.zeros((1, 2), dtype=np.int64), np.zeros((1, 2), dtype=np.int64))
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+# Flowxus/mesh/check/disk_cache.py
+
+"""
+Project: Flowxus
+Author: Erfan Vaezi
+Date: 8/29/2025
+
+Purpose:
+--------
+On-disk cache of the deterministic part of a check run: the `MeshView` and the array core
+of `precompute_cache`. Both are pure functions of the .msh bytes and a few geometry-affecting
+thresholds, so a re-run on unchanged input deserializes them instead of rebuilding.
+
+Main Tasks:
+-----------
+   - `cache_key`: blake2b of the file bytes + canonical JSON of the geometry thresholds.
+   - `_load_or_build`: return `(mv, cache, key)` from `<cache_dir>/<key>.npz`, or build and store.
+   - In-process LRU in front of the disk tier, keyed by (path, mtime_ns, size, geometry
+     thresholds): repeated runs in one process skip hashing and deserializing entirely.
+   - Per-rule memo (opt-in, `cfg["cache"]["rule_memo"]`): findings keyed by (mesh key,
+     rule id, checks fingerprint, slice of `th` the rule touches), persisted next to the
+     arrays as `<key>.rules.json`.
+
+Inputs/Contracts:
+-----------------
+   - Cache location: `cfg["cache"]["dir"]` if set, else `~/.cache/flowxus`.
+   - Disabled with `cfg["cache"]["enabled"] = False`.
+   - Size cap `cfg["cache"]["max_mb"]` (default 1024, None = unbounded): after each store,
+     least recently used entries (by mtime, refreshed on every hit) are deleted.
+   - Stored with `np.savez_compressed` (no pickles): points, tris, quads, tag index arrays,
+     CSR arrays for edge/node incidence, cell adjacency, centroids, cell bboxes and
+     boundary edges as sorted packed int64 keys.
+
+Notes:
+------
+   - Invalidation is automatic: any change to the file bytes or to `_GEOMETRY_KEYS`
+     thresholds changes the key. Rule-only thresholds (e.g. `min_angle_deg`) are excluded.
+   - Any failure reading an entry (read-only home, corrupt/truncated file) falls back to
+     a fresh build.
+   - The spatial grid and dict views are rebuilt from the stored arrays on load.
+   - The in-process tier trusts `os.stat`: a rewrite that keeps both mtime and size is not
+     seen until the entry is evicted. Entries are shared: `run_checks` hands rules a shallow
+     per-run copy of the cache dict, so rules may add keys (e.g. `warnings._memo`) but
+     must not mutate the stored arrays.
+   - Findings are JSON (not part of the .npz, which cannot hold them without pickling);
+     fresh findings of memoized rules go through the same round-trip (`normalize_finding`),
+     so a run returns identical data (lists, not tuples, in `examples`) hit or miss.
+   - The memo key includes a fingerprint of every source file in this package and of the
+     optional dependencies (meshio, numba) that change findings, so editing any rule,
+     helper or kernel, or installing/removing a dependency, invalidates all entries.
+"""
+
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from .helpers import MeshView, as_edge_keys, build_mesh_view, precompute_cache, cache_from_arrays
+
+
+# Bump when the stored layout changes so stale files are never read
+_FORMAT_VERSION = 4
+
+# Thresholds that change the cached structures (everything else only affects rules)
+_GEOMETRY_KEYS = ("overlap_grid_bins",)
+
+# In-process tier: stat key -> (mv, cache, key), most recently used last
+_MEMO: "OrderedDict[Tuple[Any, ...], Tuple[MeshView, Dict[str, Any], Optional[str]]]" = OrderedDict()
+_MEMO_SIZE = 8
+
+# Default size cap of the cache directory (`cfg["cache"]["max_mb"]`, None = unbounded)
+_DEFAULT_MAX_MB = 1024
+
+
+def cache_dir(override: Optional[str] = None) -> str:
+    """Directory holding cached `.npz` files (created on demand)."""
+    path = override or os.path.join(os.path.expanduser("~"), ".cache", "flowxus")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_key(msh_path: str, th: Dict[str, Any]) -> str:
+    """
+    16-hex-digit key from the mesh file content and the geometry-affecting thresholds.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(msh_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    geo = {k: th.get(k) for k in _GEOMETRY_KEYS}
+    h.update(json.dumps({"v": _FORMAT_VERSION, "th": geo}, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+# -------------------------
+# (De)serialization
+# -------------------------
+def _flatten_tags(kind: str, tags: Dict[str, Any], arrays: Dict[str, np.ndarray], manifest: list) -> None:
+    """Store tag index arrays as `tag<i>`; values may be arrays or {cell_type: array} dicts."""
+    for name, val in tags.items():
+        items = val.items() if isinstance(val, dict) else [(None, val)]
+        for sub, idx in items:
+            arrays["tag%d" % len(manifest)] = np.asarray(idx)
+            manifest.append([kind, name, sub])
+
+
+def _save(path: str, mv: MeshView, cache: Dict[str, Any]) -> None:
+    """Atomically write the mesh view and cache array core to `path`."""
+    arrays: Dict[str, np.ndarray] = {"points": mv.points}
+    if mv.tris is not None:
+        arrays["tris"] = mv.tris
+    if mv.quads is not None:
+        arrays["quads"] = mv.quads
+
+    manifest: list = []
+    _flatten_tags("cell", mv.cell_tags, arrays, manifest)
+    _flatten_tags("line", mv.line_tags, arrays, manifest)
+
+    edges, e_ptr, e_cells = cache["edge_cells_csr"]
+    arrays.update(edge_csr_edges=edges, edge_csr_indptr=e_ptr, edge_csr_cells=e_cells)
+    arrays["cell_edge_ids"] = cache["cell_edge_ids"]
+    n_ptr, n_cells = cache["node_cells_csr"]
+    arrays.update(node_csr_indptr=n_ptr, node_csr_cells=n_cells)
+    a_ptr, a_nbrs = cache["cell_adjacency"]
+    arrays.update(adj_indptr=a_ptr, adj_nbrs=a_nbrs)
+    for k, v in cache["centroids"].items():
+        arrays["centroids_" + k] = v
+    arrays["cell_bboxes"] = cache["cell_bboxes"]
+
+    bnd = as_edge_keys(cache.get("boundary_edges", None))
+    if bnd is not None:
+        arrays["boundary_edges"] = bnd
+
+    # the member list guards the optional arrays: the zip directory itself is not checksummed
+    files = sorted(arrays) + ["meta"]
+    arrays["meta"] = np.array(json.dumps({"bbox": list(mv.as_tuple()), "tags": manifest, "files": files}))
+
+    fd, tmp = tempfile.mkstemp(suffix=".npz", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _load(path: str, msh_path: str, th: Dict[str, Any]) -> Tuple[MeshView, Dict[str, Any]]:
+    """Rebuild `(mv, cache)` from a file written by `_save`."""
+    with np.load(path, allow_pickle=False) as z:
+        meta = json.loads(str(z["meta"]))
+        if sorted(z.files) != sorted(meta["files"]):
+            raise ValueError("cache entry members do not match its manifest")
+        tags: Dict[str, Dict[str, Any]] = {"cell": {}, "line": {}}
+        for i, (kind, name, sub) in enumerate(meta["tags"]):
+            idx = z["tag%d" % i]
+            if sub is None:
+                tags[kind][name] = idx
+            else:
+                tags[kind].setdefault(name, {})[sub] = idx
+
+        mv = MeshView(
+            mesh_path=msh_path,
+            points=z["points"],
+            tris=z["tris"] if "tris" in z else None,
+            quads=z["quads"] if "quads" in z else None,
+            cell_tags=tags["cell"],
+            line_tags=tags["line"],
+            bbox=np.asarray(meta["bbox"], dtype=np.float64),
+        )
+
+        bnd = z["boundary_edges"] if "boundary_edges" in z else None
+        arrays = {
+            "edge_cells_csr": (z["edge_csr_edges"], z["edge_csr_indptr"], z["edge_csr_cells"]),
+            "cell_edge_ids": z["cell_edge_ids"],
+            "node_cells_csr": (z["node_csr_indptr"], z["node_csr_cells"]),
+            "cell_adjacency": (z["adj_indptr"], z["adj_nbrs"]),
+            "centroids": {k[len("centroids_"):]: z[k] for k in z.files if k.startswith("centroids_")},
+            "cell_bboxes": z["cell_bboxes"],
+            "boundary_edges": bnd,
+        }
+    return mv, cache_from_arrays(mv, th, arrays)
+
+
+def _prune(d: str, max_bytes: int) -> None:
+    """Delete the least recently used cache files in `d` until they total at most `max_bytes`."""
+    entries = []
+    with os.scandir(d) as it:
+        for e in it:
+            if e.name.endswith((".npz", ".rules.json")) and e.is_file():
+                st = e.stat()
+                entries.append((st.st_mtime_ns, st.st_size, e.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(p)
+            total -= size
+        except OSError:
+            pass
+
+
+# -------------------------
+# Entry point
+# -------------------------
+def _load_or_build(msh_path: str, cfg: Dict[str, Any]) -> Tuple[MeshView, Dict[str, Any], Optional[str]]:
+    """
+    Return `(mv, cache, key)` for `msh_path`: from the in-process LRU if the file is
+    unchanged since it was last seen, else from the disk cache when the key matches.
+    `key` is None when caching is disabled or the cache directory is unusable.
+    """
+    th = cfg.get("thresholds", {})
+    opts = cfg.get("cache", {}) or {}
+    skey = _stat_key(msh_path, th, opts) if opts.get("enabled", True) else None
+    if skey is not None and skey in _MEMO:
+        _MEMO.move_to_end(skey)
+        return _MEMO[skey]
+
+    mv, cache, key = _load_or_build_disk(msh_path, th, opts)
+    if skey is not None:
+        _MEMO[skey] = (mv, cache, key)
+        if len(_MEMO) > _MEMO_SIZE:
+            _MEMO.popitem(last=False)
+    return mv, cache, key
+
+
+def _stat_key(msh_path: str, th: Dict[str, Any], opts: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """(abspath, mtime_ns, size, geometry thresholds, cache dir) for the in-process tier."""
+    try:
+        st = os.stat(msh_path)
+    except OSError:
+        return None
+    geo = json.dumps({k: th.get(k) for k in _GEOMETRY_KEYS}, sort_keys=True)
+    return (os.path.abspath(msh_path), st.st_mtime_ns, st.st_size, geo, opts.get("dir"))
+
+
+def _load_or_build_disk(msh_path: str, th: Dict[str, Any],
+                        opts: Dict[str, Any]) -> Tuple[MeshView, Dict[str, Any], Optional[str]]:
+    """Disk tier of `_load_or_build`: `<cache_dir>/<key>.npz`, or build and store."""
+    key = path = None
+    if opts.get("enabled", True):
+        try:
+            key = cache_key(msh_path, th)
+            path = os.path.join(cache_dir(opts.get("dir")), key + ".npz")
+        except OSError:
+            key = path = None
+
+    if path is not None and os.path.isfile(path):
+        try:
+            out = _load(path, msh_path, th) + (key,)
+        except Exception:
+            # Any failure reading the entry is a miss: besides I/O errors, a corrupt .npz
+            # raises zlib.error, EOFError or numpy header-parse errors. Rebuild and overwrite.
+            pass
+        else:
+            try:
+                os.utime(path)  # recency for `_prune`
+            except OSError:
+                pass
+            return out
+
+    mv = build_mesh_view(msh_path)
+    cache = precompute_cache(mv, th)
+    if path is not None:
+        try:
+            _save(path, mv, cache)
+            max_mb = opts.get("max_mb", _DEFAULT_MAX_MB)
+            if max_mb is not None:
+                _prune(os.path.dirname(path), int(max_mb * (1 << 20)))
+        except OSError:
+            pass
+    return mv, cache, key
+
+
+# -------------------------
+# Per-rule finding memo
+# -------------------------
+def _jsonable(x: Any) -> Any:
+    """json.dumps fallback for numpy scalars/arrays and sets inside findings."""
+    if isinstance(x, np.generic):
+        return x.item()
+    if isinstance(x, (np.ndarray, set, frozenset)):
+        return sorted(x) if isinstance(x, (set, frozenset)) else x.tolist()
+    return str(x)
+
+
+@lru_cache(maxsize=1)
+def _checks_fingerprint() -> Optional[str]:
+    """
+    blake2b of this package's .py sources plus optional-dependency availability
+    (None if the sources cannot be read, which disables the memo).
+    """
+    from . import errors as _err, _kernels_nb as _nb  # deferred: both import the helpers chain
+    h = hashlib.blake2b(digest_size=8)
+    pkg = os.path.dirname(os.path.abspath(__file__))
+    try:
+        for name in sorted(os.listdir(pkg)):
+            if name.endswith(".py"):
+                with open(os.path.join(pkg, name), "rb") as f:
+                    h.update(name.encode("utf-8") + b"\0" + f.read())
+    except OSError:
+        return None
+    h.update(json.dumps({"meshio": bool(_err._HAS_MESHIO), "numba": bool(_nb.HAS_NUMBA)}).encode("utf-8"))
+    return h.hexdigest()
+
+
+def rule_memo_key(spec, th: Dict[str, Any]) -> Optional[str]:
+    """
+    Memo key for one rule: id, checks fingerprint and the `th` slice in `spec.touches_th`.
+    None if the rule did not opt in (or no fingerprint is available).
+    """
+    if spec.touches_th is None:
+        return None
+    digest = _checks_fingerprint()
+    if digest is None:
+        return None
+    sl = [(k, th.get(k)) for k in sorted(spec.touches_th)]
+    return json.dumps([spec.id, digest, sl], sort_keys=True, default=_jsonable)
+
+
+def normalize_finding(finding: Dict[str, Any]) -> Dict[str, Any]:
+    """The finding as it reads back from the memo (JSON round-trip)."""
+    return json.loads(json.dumps(finding, default=_jsonable))
+
+
+def load_rule_memo(key: Optional[str], cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Memoized findings for mesh `key` ({} if none or unreadable)."""
+    if key is None:
+        return {}
+    try:
+        with open(os.path.join(cache_dir((cfg.get("cache", {}) or {}).get("dir")), key + ".rules.json"),
+                  "r", encoding="utf-8") as f:
+            memo = json.load(f)
+        return memo if isinstance(memo, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def store_rule_memo(key: Optional[str], cfg: Dict[str, Any], memo: Dict[str, Any]) -> None:
+    """Atomically persist memoized findings for mesh `key` (best effort)."""
+    if key is None:
+        return
+    try:
+        d = cache_dir((cfg.get("cache", {}) or {}).get("dir"))
+        fd, tmp = tempfile.mkstemp(suffix=".json", dir=d)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(memo, f, default=_jsonable)
+        os.replace(tmp, os.path.join(d, key + ".rules.json"))
+    except OSError:
+        pass
@@ -29,7 +29,7 @@ Inputs/Contracts:
     `strict_if_no_field_data`, `wall_name`, etc. Unknown keys are ignored.
 - `cache` : dict (precomputations from `helpers.precompute_cache(mv, th)`)
     Example entries: `edge_cells`, `boundary_edges`, `node_cells`,
-    `unified_cells`, `centroids`, `spatial_grid`, `cell_edges`.
+    `cells`/`cell_nverts`, `centroids`, `spatial_grid`, `cell_edges`.
 
 Finding Schema:
 ---------------
@@ -51,21 +51,29 @@ Notes:
      separately from degeneracy (see `surface_orientation` vs `negative_jacobians`).
    - Soft deps: Physical-group checks use `meshio` if available; otherwise they
      skip with `ok=True` and a `details["skipped"]` message.
+   - Soft deps: exact overlap tests are JIT-compiled with `numba` when installed
+     (`_kernels_nb.py`); otherwise the same kernels run as plain Python.
    - Performance: Pairwise overlap checks use bbox-based neighbor candidates from
      a spatial grid provided via `cache["spatial_grid"]`.
 """
 
 
-from .kernels import segments_intersect, point_in_triangle, point_in_quad
-from typing import Dict, List
+from .kernels import segments_intersect_batch, signed_area_tri_batch, poly_area_batch
+from ._kernels_nb import overlap_mask
+from .helpers import build_boundary_mask
+from typing import Dict, List, Tuple
 import numpy as np
 
 try:
     from mesh.tools.validate import check_physical_groups as _check_pg  # existing module
+    from mesh.tools.validate import PhysicalGroupMissing
     _HAS_MESHIO = True
 except Exception:
     _HAS_MESHIO = False
 
+    class PhysicalGroupMissing(RuntimeError):  # type: ignore[no-redef]
+        missing: List[str] = []
+
     def _check_pg(*_args, **_kwargs):
         return
 
@@ -89,7 +97,8 @@ def _poly_area_xy(coords: np.ndarray) -> float:
     """
     x = coords[:, 0]
     y = coords[:, 1]
-    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    # shoelace with the wrap-around term split out (slices are views; no rolled copies)
+    return 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(y[:-1], x[1:]) + x[-1] * y[0] - y[-1] * x[0])
 
 
 def _tri_area_xy(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> float:
@@ -146,45 +155,90 @@ def _point_in_quad(pt, q4, eps=1e-14) -> bool:
     return _point_in_triangle(pt, a, b, c, eps) or _point_in_triangle(pt, a, c, d, eps)
 
 
+def _bbox_overlap_mask(pairs: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized AABB overlap test for (K,2) cell pairs; bboxes rows are (x0, y0, x1, y1).
+    """
+    A = bboxes[pairs[:, 0]]
+    B = bboxes[pairs[:, 1]]
+    return np.logical_and.reduce((A[:, 2] >= B[:, 0], B[:, 2] >= A[:, 0],
+                                  A[:, 3] >= B[:, 1], B[:, 3] >= A[:, 1]))
+
+
+def _shares_edge_mask(pairs: np.ndarray, indptr: np.ndarray, nbrs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized adjacency test for (K,2) cell pairs against the `cell_adjacency` CSR.
+    Rows are sorted, so `row*C + nbr` is globally sorted and membership is one searchsorted.
+    """
+    C = len(indptr) - 1
+    if len(pairs) == 0 or len(nbrs) == 0:
+        return np.zeros(len(pairs), dtype=bool)
+    adj_keys = np.repeat(np.arange(C, dtype=np.int64), np.diff(indptr)) * C + nbrs
+    keys = pairs[:, 0].astype(np.int64) * C + pairs[:, 1]
+    pos = np.minimum(np.searchsorted(adj_keys, keys), len(adj_keys) - 1)
+    return adj_keys[pos] == keys
+
+
+def _reject_pairs(pairs: np.ndarray, bboxes, adjacency) -> np.ndarray:
+    """
+    Overlap stage 2: drop pairs with disjoint AABBs, then true neighbors (shared edge),
+    which are adjacency rather than overlap. Either filter is skipped if its input is None.
+    """
+    if bboxes is not None:
+        pairs = pairs[_bbox_overlap_mask(pairs, bboxes)]
+    if adjacency is not None:
+        pairs = pairs[~_shares_edge_mask(pairs, *adjacency)]
+    return pairs
+
+
+def _exact_overlap(pairs: np.ndarray, pts: np.ndarray, conn: np.ndarray, lens: np.ndarray,
+                   eps: float) -> List[Tuple[int, int]]:
+    """
+    Overlap stage 3: exact edge-edge and centroid-containment tests (compiled kernel) over
+    the dense (C,4) connectivity `conn` and vertex counts `lens`.
+    """
+    mask = overlap_mask(np.ascontiguousarray(pts[:, :2], dtype=np.float64), conn, lens, pairs, eps)
+    return [(int(i), int(j)) for i, j in pairs[mask].tolist()]
+
+
+def _boundary_mask(cache, edges: np.ndarray, boundary_edges) -> np.ndarray:
+    """
+    Boundary flags for `edge_cells_csr` rows: the cached mask, or rebuilt if absent.
+    """
+    mask = cache.get("boundary_mask", None)
+    if mask is None:
+        mask = build_boundary_mask(edges, boundary_edges)
+    return mask
+
+
 # ------------------------------------------------------------------------------------
 # 1) duplicate_elements
 # ------------------------------------------------------------------------------------
+def _duplicate_rows(conn: np.ndarray) -> np.ndarray:
+    """
+    Indices of rows whose node set repeats an earlier row (first occurrence is kept).
+    Exact: rows are sorted per-cell, lexsorted, and compared to their sorted neighbour.
+    """
+    cs = np.sort(conn, axis=1)
+    order = np.lexsort(cs.T[::-1])  # stable -> first occurrence leads each run
+    css = cs[order]
+    same = np.all(css[1:] == css[:-1], axis=1)
+    return np.sort(order[np.nonzero(same)[0] + 1])
+
+
 def duplicate_elements(mv, th, cache) -> Dict:
     """
     Identify duplicate elements with identical node sets.
-    Implements hash-based dedup for tris/quads (lexicographically sorted nodes).
+    Lexsorts per-cell sorted connectivity for tris/quads and flags repeated rows.
     Returns examples as ("tri"/"quad", local_index).
     """
     dup_ids = []
 
-    # Triangles
     if mv.tris is not None and len(mv.tris):
-        tri_sorted = np.sort(mv.tris, axis=1)
-        # lexicographic hashing
-        keys = tri_sorted[:, 0].astype(np.int64) * 73856093 \
-             ^ tri_sorted[:, 1].astype(np.int64) * 19349663 \
-             ^ tri_sorted[:, 2].astype(np.int64) * 83492791
-        _, first_idx, counts = np.unique(keys, return_index=True, return_counts=True)
-        dup_mask = np.zeros(len(tri_sorted), dtype=bool)
-        # mark duplicates (all beyond the first occurrence per key)
-        for idx, cnt in zip(first_idx, counts):
-            if cnt > 1:
-                dup_mask[idx+1: idx+cnt] = True
-        dup_ids.extend([("tri", i) for i in np.nonzero(dup_mask)[0].tolist()])
-
-    # Quads
+        dup_ids.extend([("tri", i) for i in _duplicate_rows(mv.tris).tolist()])
+
     if mv.quads is not None and len(mv.quads):
-        q_sorted = np.sort(mv.quads, axis=1)
-        keys = q_sorted[:, 0].astype(np.int64) * 73856093 \
-             ^ q_sorted[:, 1].astype(np.int64) * 19349663 \
-             ^ q_sorted[:, 2].astype(np.int64) * 83492791 \
-             ^ q_sorted[:, 3].astype(np.int64) * 2654435761
-        _, first_idx, counts = np.unique(keys, return_index=True, return_counts=True)
-        dup_mask = np.zeros(len(q_sorted), dtype=bool)
-        for idx, cnt in zip(first_idx, counts):
-            if cnt > 1:
-                dup_mask[idx+1: idx+cnt] = True
-        dup_ids.extend([("quad", i) for i in np.nonzero(dup_mask)[0].tolist()])
+        dup_ids.extend([("quad", i) for i in _duplicate_rows(mv.quads).tolist()])
 
     ok = len(dup_ids) == 0
     return _finding(
@@ -209,16 +263,11 @@ def surface_orientation(mv, th, cache) -> Dict:
     bad = []
 
     if mv.tris is not None and len(mv.tris):
-        tri_pts = mv.points[mv.tris]  # (T,3,2)
-        areas = 0.5 * ( (tri_pts[:,1,0]-tri_pts[:,0,0])*(tri_pts[:,2,1]-tri_pts[:,0,1])
-                      - (tri_pts[:,1,1]-tri_pts[:,0,1])*(tri_pts[:,2,0]-tri_pts[:,0,0]) )
+        areas = signed_area_tri_batch(mv.points[mv.tris])  # (T,)
         bad.extend([("tri", i) for i in np.nonzero(areas < 0.0)[0].tolist()])
 
     if mv.quads is not None and len(mv.quads):
-        q_pts = mv.points[mv.quads]  # (Q,4,2)
-        # polygon signed area
-        x = q_pts[..., 0]; y = q_pts[..., 1]
-        areas = 0.5 * ((x * np.roll(y, -1, axis=1)) - (y * np.roll(x, -1, axis=1))).sum(axis=1)
+        areas = poly_area_batch(mv.points[mv.quads])  # (Q,) shoelace
         bad.extend([("quad", i) for i in np.nonzero(areas < 0.0)[0].tolist()])
 
     ok = len(bad) == 0
@@ -251,11 +300,7 @@ def negative_jacobians(mv, th, cache):
 
     # --- Triangles: area near zero means degenerate
     if mv.tris is not None and len(mv.tris):
-        tri = pts[mv.tris]  # (T,3,2)
-        a = 0.5 * np.abs(
-            (tri[:, 1, 0] - tri[:, 0, 0]) * (tri[:, 2, 1] - tri[:, 0, 1])
-            - (tri[:, 1, 1] - tri[:, 0, 1]) * (tri[:, 2, 0] - tri[:, 0, 0])
-        )
+        a = np.abs(signed_area_tri_batch(pts[mv.tris]))  # (T,)
         bad_tris = np.nonzero(a <= eps)[0]
         for i in bad_tris:
             bad.append(("tri", int(i)))
@@ -263,24 +308,15 @@ def negative_jacobians(mv, th, cache):
     # --- Quads: area near zero OR self-intersecting edges (bow-tie)
     if mv.quads is not None and len(mv.quads):
         Q = pts[mv.quads]  # (Q,4,2)
-        # shoelace area
-        area = (
-            Q[:, 0, 0] * Q[:, 1, 1] - Q[:, 0, 1] * Q[:, 1, 0]
-            + Q[:, 1, 0] * Q[:, 2, 1] - Q[:, 1, 1] * Q[:, 2, 0]
-            + Q[:, 2, 0] * Q[:, 3, 1] - Q[:, 2, 1] * Q[:, 3, 0]
-            + Q[:, 3, 0] * Q[:, 0, 1] - Q[:, 3, 1] * Q[:, 0, 0]
-        ) * 0.5
+        area = poly_area_batch(Q)  # shoelace
         degenerate = np.nonzero(np.abs(area) <= eps)[0]
 
         # bow-tie: opposite edges cross -> (0-1) with (2-3) or (1-2) with (3-0)
-        bow = []
-        for qi, P in enumerate(Q):
-            p0, p1, p2, p3 = P[0], P[1], P[2], P[3]
-            if segments_intersect(p0, p1, p2, p3, eps) or segments_intersect(p1, p2, p3, p0, eps):
-                bow.append(qi)
-
-        bad_quads = set(map(int, degenerate)) | set(map(int, bow))
-        for i in sorted(bad_quads):
+        P0, P1, P2, P3 = Q[:, 0], Q[:, 1], Q[:, 2], Q[:, 3]
+        bow_mask = segments_intersect_batch(P0, P1, P2, P3, eps) | segments_intersect_batch(P1, P2, P3, P0, eps)
+        bow = np.nonzero(bow_mask)[0]
+
+        for i in np.union1d(degenerate, bow).tolist():
             bad.append(("quad", int(i)))
 
     ok = len(bad) == 0
@@ -306,8 +342,6 @@ def overlapping_elements(mv, th, cache):
     """
 
     pts = mv.points
-    unified = cache.get("unified_cells", [])
-    cell_edges = cache.get("cell_edges", {})
     grid = cache.get("spatial_grid", None)
     if grid is None:
         return {
@@ -320,72 +354,14 @@ def overlapping_elements(mv, th, cache):
             "fixable": True,
         }
 
-    # helper: does cell have an edge (u,v)?
-    def _share_edge(i, j):
-        ei = set(cell_edges.get(i, []))
-        ej = set(cell_edges.get(j, []))
-        return len(ei.intersection(ej)) > 0
-
-    # helper: iterate polygon edge segments
-    def _edges_of(conn):
-        k = len(conn)
-        for t in range(k):
-            u = int(conn[t])
-            v = int(conn[(t + 1) % k])
-            yield (u, v), pts[u], pts[v]
-
-    overlaps = []
-
-    # We’ll also need simple point-in-polygon using our helpers for tri/quad
-    def _centroid_coords(conn):
-        P = pts[conn]
-        return P.mean(axis=0)
-
-    for i, conn_i in enumerate(unified):
-        for j in grid.neighbors(i):  # j > i by construction
-            conn_j = unified[j]
-
-            # Skip true neighbors (shared edge): not an overlap, just adjacency
-            if _share_edge(i, j):
-                continue
-
-            # Edge-edge intersection?
-            edge_hit = False
-            for (_, a0, a1) in _edges_of(conn_i):
-                for (_, b0, b1) in _edges_of(conn_j):
-                    # If they merely touch at a point, it's still an intersection;
-                    # that's usually benign, but for non-adjacent cells it indicates conflict.
-                    if segments_intersect(a0, a1, b0, b1, th.get("collinear_eps", 1e-12)):
-                        edge_hit = True
-                        break
-                if edge_hit:
-                    break
-
-            if edge_hit:
-                overlaps.append((i, j))
-                continue
-
-            # Containment test (either centroid inside the other)
-            ci = _centroid_coords(conn_i)
-            cj = _centroid_coords(conn_j)
-
-            inside = False
-            if len(conn_i) == 3 and len(conn_j) == 3:
-                inside = point_in_triangle(ci, pts[conn_j[0]], pts[conn_j[1]], pts[conn_j[2]]) or \
-                         point_in_triangle(cj, pts[conn_i[0]], pts[conn_i[1]], pts[conn_i[2]])
-            elif len(conn_i) == 4 and len(conn_j) == 4:
-                inside = point_in_quad(ci, pts[conn_j]) or point_in_quad(cj, pts[conn_i])
-            else:
-                # mixed tri-quad: test both ways using tri/quad helpers
-                if len(conn_i) == 3 and len(conn_j) == 4:
-                    inside = point_in_quad(ci, pts[conn_j]) or \
-                             point_in_triangle(cj, pts[conn_i[0]], pts[conn_i[1]], pts[conn_i[2]])
-                elif len(conn_i) == 4 and len(conn_j) == 3:
-                    inside = point_in_triangle(ci, pts[conn_j[0]], pts[conn_j[1]], pts[conn_j[2]]) or \
-                             point_in_quad(cj, pts[conn_i])
-
-            if inside:
-                overlaps.append((i, j))
+    eps = float(th.get("collinear_eps", 1e-12))
+
+    # Stage 1: candidate enumeration from the spatial grid, (K,2) with j > i
+    pairs = grid.all_pairs()
+    # Stage 2: cheap rejection (disjoint AABBs, shared-edge neighbors)
+    pairs = _reject_pairs(pairs, cache.get("cell_bboxes", None), cache.get("cell_adjacency", None))
+    # Stage 3: exact edge-edge / containment tests on the survivors only
+    overlaps = _exact_overlap(pairs, pts, cache["cells"], cache["cell_nverts"], eps)
 
     ok = len(overlaps) == 0
     return {
@@ -405,9 +381,8 @@ def overlapping_elements(mv, th, cache):
 def uncovered_faces(mv, th, cache):
     """
     Edges with degree 1 that are NOT marked as boundary edges.
-    Requires `boundary_edges` and `edge_cells` in cache; otherwise skipped.
+    Requires `boundary_edges` and `edge_cells_csr` in cache; otherwise skipped.
     """
-    edge_cells = cache.get("edge_cells", {})
     boundary_edges = cache.get("boundary_edges", None)
 
     if boundary_edges is None:
@@ -421,10 +396,10 @@ def uncovered_faces(mv, th, cache):
             "fixable": True,
         }
 
-    uncovered = []
-    for e, cells in edge_cells.items():
-        if len(cells) == 1 and e not in boundary_edges:
-            uncovered.append(e)
+    edges, indptr, _ = cache["edge_cells_csr"]
+    degrees = np.diff(indptr)
+    bmask = _boundary_mask(cache, edges, boundary_edges)
+    uncovered = [tuple(e) for e in edges[(degrees == 1) & ~bmask].tolist()]
 
     ok = len(uncovered) == 0
     return {
@@ -445,9 +420,8 @@ def missing_internal_faces(mv, th, cache):
     """
     Internal edges must be shared by exactly two cells.
     Flags edges with degree ≠ 2 after excluding boundary edges.
-    Requires `boundary_edges` and `edge_cells` in cache.
+    Requires `boundary_edges` and `edge_cells_csr` in cache.
     """
-    edge_cells = cache.get("edge_cells", {})
     boundary_edges = cache.get("boundary_edges", None)
 
     if boundary_edges is None:
@@ -461,12 +435,11 @@ def missing_internal_faces(mv, th, cache):
             "fixable": True,
         }
 
-    bad = []
-    for e, cells in edge_cells.items():
-        if e in boundary_edges:
-            continue  # boundary can be degree 1
-        if len(cells) != 2:
-            bad.append((e, tuple(cells)))
+    edges, indptr, cells = cache["edge_cells_csr"]
+    degrees = np.diff(indptr)
+    # boundary can be degree 1
+    bad = np.nonzero((degrees != 2) & ~_boundary_mask(cache, edges, boundary_edges))[0]
+    examples = [(tuple(edges[i].tolist()), tuple(cells[indptr[i]:indptr[i + 1]].tolist())) for i in bad[:20]]
 
     ok = len(bad) == 0
     return {
@@ -474,7 +447,7 @@ def missing_internal_faces(mv, th, cache):
         "severity": "error",
         "ok": ok,
         "count": len(bad),
-        "examples": bad[:20],
+        "examples": examples,
         "details": {"note": "internal edges must be shared by exactly two cells"},
         "fixable": True,
     }
@@ -485,14 +458,15 @@ def missing_internal_faces(mv, th, cache):
 # ------------------------------------------------------------------------------------
 def multiple_edges(mv, th, cache) -> Dict:
     """
-    Duplicate undirected topological edges between the same node pair (u < v).
-    Aggregates counts from `edge_cells` keys and flags edges with count > 1.
+    Duplicate undirected topological edges between the same node pair (u < v):
+    edges used by more than two cells (a conforming 2D edge has ≤ 2), read from
+    `edge_cells_csr` in cache.
+
+    Note: this is the same edge test as `nonmanifold` (`edges_incident_gt2`), so one
+    such edge fails both rules; `nonmanifold` additionally flags high-incidence nodes.
     """
-    edge_cells = cache.get("edge_cells", {})
-    counts = {}
-    for e in edge_cells.keys():
-        counts[e] = counts.get(e, 0) + 1
-    dups = [e for e, c in counts.items() if c > 1]
+    edges, indptr, _ = cache["edge_cells_csr"]
+    dups = [tuple(e) for e in edges[np.diff(indptr) > 2].tolist()]
 
     ok = len(dups) == 0
     return _finding(
@@ -500,7 +474,7 @@ def multiple_edges(mv, th, cache) -> Dict:
         ok=ok,
         count=len(dups),
         examples=dups[:20],
-        details={"note": "More than one topological edge between the same two nodes."},
+        details={"note": "More than one topological edge between the same two nodes (edge used by > 2 cells)."},
         fixable=True,
     )
 
@@ -513,23 +487,23 @@ def nonmanifold(mv, th, cache) -> Dict:
     Non-manifold configurations:
       • Edges incident to > 2 cells.
       • Nodes with abnormally high cell incidence (heuristic: > mean + 5σ and ≥ 8).
-    Uses `edge_cells` and optionally `node_cells` from cache.
+    Uses `edge_cells_csr` and optionally `node_cells_csr` from cache.
     """
-    edge_cells = cache.get("edge_cells", {})
-    node_cells = cache.get("node_cells", None)
+    edges, indptr, _ = cache["edge_cells_csr"]
+    node_csr = cache.get("node_cells_csr", None)
 
-    edges_gt2 = [e for e, cells in edge_cells.items() if len(cells) > 2]
+    edges_gt2 = [tuple(e) for e in edges[np.diff(indptr) > 2].tolist()]
 
     high_nodes = []
-    if node_cells is not None:
+    if node_csr is not None:
         # heuristic: nodes with cell incidence >> average (e.g., > mean + 5*std)
-        incidences = np.array([len(v) for v in node_cells.values()], dtype=int)
+        node_deg = np.diff(node_csr[0])
+        incidences = node_deg[node_deg > 0]  # nodes referenced by at least one cell
         if len(incidences) > 0:
             mu, sd = float(incidences.mean()), float(incidences.std() + 1e-9)
             thr = mu + 5.0 * sd
-            for n, cells in node_cells.items():
-                if len(cells) > thr and len(cells) >= 8:  # require a minimum absolute level
-                    high_nodes.append(n)
+            # require a minimum absolute level
+            high_nodes = np.nonzero((node_deg > thr) & (node_deg >= 8))[0].tolist()
 
     ok = (len(edges_gt2) == 0) and (len(high_nodes) == 0)
     return _finding(
@@ -619,14 +593,22 @@ def missing_physical_groups(mv, th, cache) -> Dict:
             details={"checked": list(required)},
             fixable=False,
         )
+    except PhysicalGroupMissing as e:
+        missing = list(e.missing)
+        return _finding(
+            "missing_physical_groups",
+            ok=False,
+            count=len(missing) if missing else 1,
+            examples=missing[:10],
+            details={"message": str(e), "missing": missing},
+            fixable=False,  # fix requires re-tagging or re-export
+        )
     except Exception as e:
-        # Parse missing names from the error message crudely
+        # Unstructured failure (dim mismatch, unreadable file, foreign validator):
+        # fall back to reading names out of the message
         msg = str(e)
         details = {"message": msg}
-        missing = []
-        for name in required:
-            if name in msg and "Missing" in msg:
-                missing.append(name)
+        missing = [name for name in required if name in msg] if "Missing" in msg else []
         if missing:
             details["missing"] = missing
         return _finding(
@@ -14,15 +14,32 @@ fast, consistent access to connectivity, adjacency, and geometry.
 
 Main Tasks:
 -----------
-- MeshView: immutable container built from `mesh.stats.data.reader.read(msh_path)`.
-- precompute_cache: build adjacency/geometry maps reused across rules:
-    * edge_cells:  {(u,v): [cell_ids]} with u < v (undirected edges).
-    * cell_edges:  {cell_id: [(u,v), ...]} for unified cell indexing.
-    * node_cells:  {node_id: [cell_ids]} (node → incident cells).
+- MeshView: immutable container built from `mesh.stats.data.reader.read(msh_path)`;
+  also exposes the point coordinates as separate `px` / `py` arrays (SoA).
+- precompute_cache: build adjacency/geometry maps reused across rules
+  (`cache_from_arrays` rebuilds the same dict from a persisted array core):
+    * tris, quads:  (T,3) / (Q,4) int32 connectivity (empty arrays if absent).
+    * n_tris, n_cells: T and T+Q.
+    * cells, cell_nverts: (C,4) int32 unified connectivity (tris padded with -1 in column 3)
+                          and (C,) int32 vertex counts; `unified_conn(cache, cid)` slices one cell.
+    * edge_cells:  `EdgeCells` read-only {(u,v): [cell_ids]} facade (u < v) over `edge_cells_csr`.
+    * cell_edges:  {cell_id: [(u,v), ...]} for unified cell indexing (lazy, see `_Lazy`).
+    * node_cells:  {node_id: [cell_ids]} (node → incident cells; lazy).
+    * node_edges:  {node_id: [(u,v), ...]} (node → incident edges; lazy).
+    * edge_cells_csr: (edges (E,2) int32, indptr (E+1,), cells int32) — CSR form of
+                      `edge_cells`; rows sorted by (u,v), same order as the dict.
+    * cell_edge_ids:  (C,4) int32 row of `edge_cells_csr` per cell side (-1 in tri column 3).
+    * node_cells_csr: (indptr (N+1,), cells int32) — CSR form of `node_cells` over all node ids.
+    * boundary_mask:  (E,) bool over `edge_cells_csr` rows, or None without boundary edges.
+    * cell_adjacency: (indptr, nbrs) CSR of edge-sharing neighbors per unified cell
+                      (rows sorted ascending).
     * centroids:   {"tri": (T,2), "quad": (Q,2)} arrays of XY centroids.
     * cell_bboxes: (C,4) array of AABBs (ax0, ay0, ax1, ay1) per unified cell.
-    * spatial_grid: spatial hash / grid for neighbor candidate lookup.
-    * boundary_edges (optional): set{(u,v)} if line connectivity is available.
+    * spatial_grid: spatial hash / grid for neighbor candidate lookup
+                    (`_Grid`: `neighbors(cid)` per cell, `all_pairs()` as a (K,2) array
+                    from its CSR bin arrays).
+    * boundary_edges (optional): sorted (B,) int64 edge keys `u<<32 | v` (u < v) if line
+                      connectivity is available; see `edge_key`/`pack_edge_keys`.
 
 Unification Convention:
 -----------------------
@@ -37,11 +54,13 @@ Notes:
 """
 
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Iterable
+from dataclasses import dataclass, field
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Tuple, Optional
 import numpy as np
 from typing import Any, cast
 from mesh.stats.data.reader import read as _read_mesh
+from ._kernels_nb import cell_edge_keys, grid_memberships
 
 
 # -------------------------
@@ -52,15 +71,30 @@ def hash_edge(u: int, v: int) -> Tuple[int, int]:
     return (u, v) if u < v else (v, u)
 
 
-def _bbox_xy(coords: np.ndarray) -> Tuple[float, float, float, float]:
-    """Axis-aligned bounding box (minx, miny, maxx, maxy) for (k,2) coords."""
-    x = coords[:, 0]; y = coords[:, 1]
-    return (float(x.min()), float(y.min()), float(x.max()), float(y.max()))
+def edge_key(u: int, v: int) -> int:
+    """Undirected edge packed into one int: (min << 32) | max."""
+    return (u << 32) | v if u < v else (v << 32) | u
 
 
-def _centroid(coords: np.ndarray) -> np.ndarray:
-    """Average of vertices as a simple centroid (works for tri/quad)."""
-    return coords.mean(axis=0)
+def pack_edge_keys(edges: np.ndarray) -> np.ndarray:
+    """Vectorized `edge_key` over (E,2) endpoints → (E,) int64."""
+    e = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    lo = np.minimum(e[:, 0], e[:, 1]); hi = np.maximum(e[:, 0], e[:, 1])
+    return (lo << 32) | hi
+
+
+def as_edge_keys(boundary_edges) -> Optional[np.ndarray]:
+    """
+    Normalize boundary edges to a sorted unique (B,) int64 key array. Accepts that array
+    itself, an (B,2) endpoint array, or any iterable of (u,v) pairs (legacy set form).
+    """
+    if boundary_edges is None:
+        return None
+    if isinstance(boundary_edges, np.ndarray) and boundary_edges.ndim == 1:
+        return boundary_edges
+    if not isinstance(boundary_edges, np.ndarray):
+        boundary_edges = list(boundary_edges)
+    return np.unique(pack_edge_keys(np.asarray(boundary_edges, dtype=np.int64).reshape(-1, 2)))
 
 
 # -------------------------
@@ -70,39 +104,106 @@ class _Grid:
     """
     Lightweight uniform spatial grid over cell AABBs for candidate neighbor queries.
 
-    Build once with all cell bboxes; neighbors(i) yields candidate j ≠ i that
-    share at least one grid bin with i (not guaranteed intersecting—just candidates).
+    Bins are compact-hashed into `m` (power of two) buckets, `h = ((P1*ix) ^ (P2*iy)) & (m-1)`,
+    stored SoA/CSR: bucket `h` holds `bin_cells[bin_indptr[h]:bin_indptr[h+1]]` (ascending
+    cell ids), and every cell is registered in each bin its AABB spans (`cell_bins`: (C,4)
+    int32 ix0, iy0, ix1, iy1). Storage scales with the memberships, not with nx*ny;
+    distinct bins sharing a bucket only add candidates, which the AABB filter removes.
+    `all_pairs()` enumerates cells sharing a bin fully vectorized; pairs are candidates only.
+    `neighbors(cid)` visits only the bins in `cid`'s range and filters by AABB overlap.
+
+    With `nx=None` the bin size adapts to the mesh: ~2 mean cell extents per bin, so each
+    bin holds O(1) cells regardless of mesh size.
     """
 
-    __slots__ = ("_bins", "_nx", "_ny", "_x0", "_y0", "_dx", "_dy", "_n")
+    __slots__ = ("bin_indptr", "bin_cells", "cell_bins", "_bboxes",
+                 "_nx", "_ny", "_x0", "_y0", "_dx", "_dy", "_n", "_mask")
+
+    # spatial-hash primes (Teschner et al.)
+    P1 = 73856093
+    P2 = 19349663
 
-    def __init__(self, bboxes: np.ndarray, nx: int = 96, ny: Optional[int] = None):
+    def __init__(self, bboxes: np.ndarray, nx: Optional[int] = None, ny: Optional[int] = None):
         if bboxes is None or len(bboxes) == 0:
             # empty mesh
-            self._bins = {}
+            self._bboxes = np.zeros((0, 4), dtype=float)
+            self.bin_indptr = np.zeros(2, dtype=np.int64)
+            self.bin_cells = np.zeros(0, dtype=np.int32)
+            self.cell_bins = np.zeros((0, 4), dtype=np.int32)
             self._nx = self._ny = 1
             self._x0 = self._y0 = 0.0
             self._dx = self._dy = 1.0
             self._n = 0
+            self._mask = 0
             return
 
         self._n = int(len(bboxes))
+        self._bboxes = bboxes
         x0 = float(bboxes[:, 0].min()); y0 = float(bboxes[:, 1].min())
         x1 = float(bboxes[:, 2].max()); y1 = float(bboxes[:, 3].max())
         self._x0, self._y0 = x0, y0
+        if nx is None:
+            # adaptive: bins ~2 mean cell widths/heights wide, floored to keep counts bounded
+            nx, ny = self._adaptive_bins(bboxes, x1 - x0, y1 - y0)
         self._nx = int(max(1, nx))
         self._ny = int(max(1, ny if ny is not None else nx))
         self._dx = (x1 - x0) / self._nx if self._nx > 0 else 1.0
         self._dy = (y1 - y0) / self._ny if self._ny > 0 else 1.0
 
-        bins: Dict[Tuple[int, int], List[int]] = {}
-        for cid, (ax0, ay0, ax1, ay1) in enumerate(bboxes):
-            ix0 = self._clamp_x(ax0); iy0 = self._clamp_y(ay0)
-            ix1 = self._clamp_x(ax1); iy1 = self._clamp_y(ay1)
-            for ix in range(ix0, ix1 + 1):
-                for iy in range(iy0, iy1 + 1):
-                    bins.setdefault((ix, iy), []).append(cid)
-        self._bins = bins
+        # Per-cell bin ranges (same truncation + clamp as _clamp_x/_clamp_y)
+        dx = self._dx if self._dx != 0.0 else 1.0
+        dy = self._dy if self._dy != 0.0 else 1.0
+        ix = np.clip(((bboxes[:, [0, 2]] - x0) / dx).astype(np.int64), 0, self._nx - 1)
+        iy = np.clip(((bboxes[:, [1, 3]] - y0) / dy).astype(np.int64), 0, self._ny - 1)
+        self.cell_bins = np.column_stack([ix[:, 0], iy[:, 0], ix[:, 1], iy[:, 1]]).astype(np.int32)
+
+        # Expand every (cell, covered bin) membership, then group by bin (CSR)
+        cid, bx, by = grid_memberships(ix, iy)
+        m = 1 << max(0, int(len(cid) - 1).bit_length())  # >= memberships: load factor <= 1
+        self._mask = m - 1
+        bid = self._hash(bx, by)
+        order = np.argsort(bid, kind="stable")  # stable: cells stay ascending within a bucket
+        self.bin_cells = cid[order].astype(np.int32)
+        self.bin_indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(bid, minlength=m), out=self.bin_indptr[1:])
+
+    def _hash(self, ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+        """Bucket ids of bins (ix, iy) as int32."""
+        return (((self.P1 * ix) ^ (self.P2 * iy)) & self._mask).astype(np.int32)
+
+    @staticmethod
+    def _adaptive_bins(bboxes: np.ndarray, span_x: float, span_y: float,
+                       max_bins: int = 1 << 22) -> Tuple[int, int]:
+        """Bin counts (nx, ny) for bins of ~2 mean cell extents, capped at `max_bins` total."""
+        floor = 1e-9 * max(span_x, span_y, 1e-300)
+        dx = max(2.0 * float(np.mean(bboxes[:, 2] - bboxes[:, 0])), floor)
+        dy = max(2.0 * float(np.mean(bboxes[:, 3] - bboxes[:, 1])), floor)
+        nx = max(1, int(np.ceil(span_x / dx)))
+        ny = max(1, int(np.ceil(span_y / dy)))
+        if nx * ny > max_bins:
+            f = (nx * ny / max_bins) ** 0.5
+            nx, ny = max(1, int(nx / f)), max(1, int(ny / f))
+        return nx, ny
+
+    def all_pairs(self) -> np.ndarray:
+        """
+        Unique candidate pairs (i, j), i < j, sharing at least one bucket, as a sorted (K,2) int32 array.
+        """
+        ptr = self.bin_indptr
+        sizes = np.diff(ptr)
+        # for entry p of a bin ending at `end`, partner entries are p+1 .. end-1
+        end = np.repeat(ptr[1:], sizes)
+        pos = np.arange(len(self.bin_cells), dtype=np.int64)
+        n_part = end - pos - 1
+        first = np.repeat(pos, n_part)
+        second = first + 1 + (np.arange(int(n_part.sum()), dtype=np.int64)
+                              - np.repeat(np.cumsum(n_part) - n_part, n_part))
+        i = self.bin_cells[first].astype(np.int64)
+        j = self.bin_cells[second].astype(np.int64)
+        keep = i != j  # a cell spanning two bins that hash to one bucket meets itself
+        # a pair sharing several bins appears once per shared bin: dedupe on packed i<<32 | j
+        key = np.unique((i[keep] << 32) | j[keep])
+        return np.column_stack([key >> 32, key & 0xFFFFFFFF]).astype(np.int32).reshape(-1, 2)
 
     def _clamp_x(self, x: float) -> int:
         """Map X to integer grid column index, clamped to [0, _nx-1] (robust to zero `_dx`)."""
@@ -114,19 +215,22 @@ class _Grid:
         iy = int((y - self._y0) / (self._dy if self._dy != 0.0 else 1.0))
         return max(0, min(self._ny - 1, iy))
 
-    def neighbors(self, cid: int) -> Iterable[int]:
-        """Candidate neighbors for cell cid (excluding cid)."""
-        # find bins this bbox occupies; union their contents
-        # we don't store per-cell bin list; compute on the fly
-        # (cheap: only a few divisions/ints)
-        # This relies on the caller having access to the global bboxes.
-        # We'll keep bboxes external; orchestrator passes a partial to checks that need it.
-        # For simplicity in v1, we iterate over adjacent bins by scanning all bins—still fast for moderate meshes.
-        # For better perf, pass bboxes into grid and cache per-cell bins; omitted in v1 for brevity.
-        # Here we just return all cells; checks can deduplicate or filter if needed.
-        # To make neighbors useful, we will override neighbors in precompute_cache to a closure
-        # that uses the actual bboxes; see precompute_cache().
-        raise NotImplementedError("Use the neighbors closure from precompute_cache()")
+    def neighbors(self, cid: int) -> np.ndarray:
+        """
+        Cells j > cid whose AABB overlaps cell `cid`'s, as an ascending int32 array.
+        Only the bins in `cid`'s stored range are visited.
+        """
+        ix0, iy0, ix1, iy1 = (int(v) for v in self.cell_bins[cid])
+        bx, by = np.meshgrid(np.arange(ix0, ix1 + 1, dtype=np.int64),
+                             np.arange(iy0, iy1 + 1, dtype=np.int64), indexing="ij")
+        bins = np.unique(self._hash(bx.ravel(), by.ravel()))
+        ptr = self.bin_indptr
+        cand = np.unique(np.concatenate([self.bin_cells[ptr[b]:ptr[b + 1]] for b in bins]))
+        cand = cand[cand > cid]
+        a = self._bboxes[cid]
+        o = self._bboxes[cand]
+        keep = ~((a[2] < o[:, 0]) | (o[:, 2] < a[0]) | (a[3] < o[:, 1]) | (o[:, 3] < a[1]))
+        return cand[keep]
 
 
 # -------------------------
@@ -135,12 +239,33 @@ class _Grid:
 @dataclass(frozen=True)
 class MeshView:
     mesh_path: str
-    points: np.ndarray            # (N,2)
-    tris: Optional[np.ndarray]    # (T,3) or None
-    quads: Optional[np.ndarray]   # (Q,4) or None
+    points: np.ndarray            # (N,2) float64, C-contiguous
+    tris: Optional[np.ndarray]    # (T,3) int32 or None
+    quads: Optional[np.ndarray]   # (Q,4) int32 or None
     cell_tags: Dict[str, np.ndarray]   # name -> cell indices (per cell block)
     line_tags: Dict[str, np.ndarray]   # name -> line indices (if available)
-    bbox: Tuple[float, float, float, float]
+    bbox: np.ndarray              # (4,) float64: xmin, ymin, xmax, ymax
+    # SoA copies of points[:, 0] / points[:, 1], (N,) C-contiguous, for unit-stride gathers
+    px: np.ndarray = field(init=False, repr=False, compare=False)
+    py: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pts = np.asarray(self.points)
+        object.__setattr__(self, "px", np.ascontiguousarray(pts[:, 0], dtype=np.float64))
+        object.__setattr__(self, "py", np.ascontiguousarray(pts[:, 1], dtype=np.float64))
+
+    def as_tuple(self) -> Tuple[float, float, float, float]:
+        """`bbox` as a plain (xmin, ymin, xmax, ymax) tuple of floats."""
+        b = np.asarray(self.bbox, dtype=float)
+        return (float(b[0]), float(b[1]), float(b[2]), float(b[3]))
+
+
+def _as_index32(conn) -> np.ndarray:
+    """C-contiguous int32 connectivity (no copy if already so); ValueError if ids overflow int32."""
+    a = np.asarray(conn)
+    if a.size and a.dtype.itemsize > 4 and int(a.max()) > np.iinfo(np.int32).max:
+        raise ValueError("node ids exceed the int32 range")
+    return np.ascontiguousarray(a, dtype=np.int32)
 
 
 def build_mesh_view(msh_path: str) -> MeshView:
@@ -151,20 +276,23 @@ def build_mesh_view(msh_path: str) -> MeshView:
     # The reader returns points (N,3 or N,2?) — we assume XY; drop Z if present
     pts = np.asarray(m.points, dtype=float)
     if pts.shape[1] > 2:
-        pts = pts[:, :2].copy()
+        pts = pts[:, :2]
+    pts = np.ascontiguousarray(pts)
 
     tris = None
     quads = None
     if getattr(m, "tris", None) is not None and len(m.tris):
-        tris = np.asarray(m.tris, dtype=np.int64)
+        tris = _as_index32(m.tris)
     if getattr(m, "quads", None) is not None and len(m.quads):
-        quads = np.asarray(m.quads, dtype=np.int64)
+        quads = _as_index32(m.quads)
 
     # Tags are already dicts of name -> indices (per reader contract)
     cell_tags = dict(getattr(m, "cell_tags", {}) or {})
     line_tags = dict(getattr(m, "line_tags", {}) or {})
-    bbox = tuple(getattr(m, "bbox", (float(pts[:,0].min()), float(pts[:,1].min()),
-                                     float(pts[:,0].max()), float(pts[:,1].max()))))
+    # one reduction per bound over the (N,2) points (the reader's bbox is ordered xmin, xmax, ymin, ymax)
+    mn = pts.min(axis=0)
+    mx = pts.max(axis=0)
+    bbox = np.array([mn[0], mn[1], mx[0], mx[1]], dtype=np.float64)
 
     return MeshView(
         mesh_path=msh_path,
@@ -173,83 +301,252 @@ def build_mesh_view(msh_path: str) -> MeshView:
         quads=quads,
         cell_tags=cell_tags,
         line_tags=line_tags,
-        bbox=(float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3])),
+        bbox=bbox,
     )
 
 
 # -------------------------
 # Precomputations (cache)
 # -------------------------
-def _build_unified_cells(tris: Optional[np.ndarray], quads: Optional[np.ndarray]) -> List[np.ndarray]:
+def _build_cells(tris: Optional[np.ndarray], quads: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Return list of connectivity arrays for unified indexing: all tris then all quads.
+    Dense unified connectivity: (C,4) int32 with tris first (column 3 padded with -1),
+    plus (C,) int32 vertex counts.
     """
-    items: List[np.ndarray] = []
-    if tris is not None and len(tris):
-        for conn in tris:
-            items.append(np.asarray(conn, dtype=np.int64))
-    if quads is not None and len(quads):
-        for conn in quads:
-            items.append(np.asarray(conn, dtype=np.int64))
-    return items
+    T = len(tris) if tris is not None else 0
+    Q = len(quads) if quads is not None else 0
+    cells = np.full((T + Q, 4), -1, dtype=np.int32)
+    if T:
+        cells[:T, :3] = tris
+    if Q:
+        cells[T:, :] = quads
+    nverts = np.full(T + Q, 4, dtype=np.int32)
+    nverts[:T] = 3
+    return cells, nverts
+
+
+def unified_conn(cache: Dict[str, Any], cid: int) -> np.ndarray:
+    """Connectivity of unified cell `cid` (3 or 4 node ids); for legacy per-cell callers."""
+    return cache["cells"][cid, :cache["cell_nverts"][cid]]
+
+
+def _build_cell_bboxes(points: np.ndarray, tris: Optional[np.ndarray], quads: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Compute per-cell AABBs (ax0, ay0, ax1, ay1) in XY for all unified cells (tris, then quads),
+    as one min/max reduction per cell type over the gathered (n,k,2) corner coordinates.
+    """
+    blocks = []
+    for conn in (tris, quads):
+        if conn is not None and len(conn):
+            c = points[conn][..., :2]
+            blocks.append(np.concatenate([c.min(axis=1), c.max(axis=1)], axis=1))
+    if not blocks:
+        return np.zeros((0, 4), dtype=float)
+    return np.vstack(blocks).astype(float, copy=False)
+
+
+def _build_edges(cells: np.ndarray, nverts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unique undirected edges of all unified cells, vectorized (sort + unique on packed keys).
+
+    Returns
+    -------
+    edges         : (E,2) int32, u < v, sorted by (u, v)
+    cell_edge_ids : (C,4) int32 row into `edges` per cell side (-1 in tri column 3)
+    indptr, ecells: CSR edge → incident cells (int64 / int32, cells ascending per edge;
+                    a cell using the same edge twice is listed twice)
+    """
+    C = len(cells)
+    keys = cell_edge_keys(cells, nverts)  # (C,4), -1 in tri column 3
+    valid = keys >= 0
+
+    # boolean masking is row-major, so slots come out cell-major in side order
+    ukeys, inv = np.unique(keys[valid], return_inverse=True)
+    inv = inv.reshape(-1)
+    E = len(ukeys)
+    edges = np.stack([ukeys >> 32, ukeys & 0xFFFFFFFF], axis=1).astype(np.int32).reshape(E, 2)
+
+    cell_edge_ids = np.full((C, 4), -1, dtype=np.int32)
+    cell_edge_ids[valid] = inv
+
+    slot_cell = np.repeat(np.arange(C, dtype=np.int32), nverts)
+    indptr = np.zeros(E + 1, dtype=np.int64)
+    np.cumsum(np.bincount(inv, minlength=E), out=indptr[1:])
+    ecells = slot_cell[np.argsort(inv, kind="stable")]
+    return edges, cell_edge_ids, indptr, ecells
+
+
+class EdgeCells(Mapping):
+    """
+    Read-only dict-like facade {(u,v): [cell_ids]} over the edge → cells CSR arrays.
+
+    `edges` rows are sorted by (u,v), so a lookup is one binary search over the packed keys;
+    iteration follows row order. Prefer the arrays themselves (`edges`, `indptr`, `cells`)
+    in vectorized code.
+    """
+
+    __slots__ = ("edges", "indptr", "cells", "_keys")
+
+    def __init__(self, edges: np.ndarray, indptr: np.ndarray, cells: np.ndarray):
+        self.edges = edges
+        self.indptr = indptr
+        self.cells = cells
+        self._keys = pack_edge_keys(edges)
+
+    def _row(self, e) -> int:
+        """Row of edge `e` = (u,v) with u <= v (the stored orientation), or -1 if absent."""
+        try:
+            u, v = int(e[0]), int(e[1])
+        except (TypeError, IndexError, ValueError):
+            return -1
+        if u > v or len(self._keys) == 0:
+            return -1
+        k = (u << 32) | v
+        i = int(np.searchsorted(self._keys, k))
+        return i if i < len(self._keys) and self._keys[i] == k else -1
+
+    def __getitem__(self, e) -> List[int]:
+        i = self._row(e)
+        if i < 0:
+            raise KeyError(e)
+        return self.cells[self.indptr[i]:self.indptr[i + 1]].tolist()
+
+    def __contains__(self, e) -> bool:
+        return self._row(e) >= 0
+
+    def __iter__(self):
+        return iter([tuple(e) for e in self.edges.tolist()])
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def items(self):
+        cl = self.cells.tolist()
+        ptr = self.indptr.tolist()
+        return [((u, v), cl[ptr[i]:ptr[i + 1]]) for i, (u, v) in enumerate(self.edges.tolist())]
+
+    def values(self):
+        cl = self.cells.tolist()
+        ptr = self.indptr.tolist()
+        return [cl[ptr[i]:ptr[i + 1]] for i in range(len(ptr) - 1)]
+
+
+class _Lazy(Mapping):
+    """
+    Read-only mapping whose dict is built by `builder()` on first access, then kept.
+    Used for the legacy dict views that no built-in rule reads.
+    """
+
+    __slots__ = ("_builder", "_data")
+
+    def __init__(self, builder: Callable[[], Dict[Any, Any]]):
+        self._builder = builder
+        self._data: Optional[Dict[Any, Any]] = None
+
+    def _get(self) -> Dict[Any, Any]:
+        if self._data is None:
+            self._data = self._builder()
+            self._builder = None
+        return self._data
+
+    def __getitem__(self, k):
+        return self._get()[k]
+
+    def __contains__(self, k) -> bool:
+        return k in self._get()
+
+    def __iter__(self):
+        return iter(self._get())
 
+    def __len__(self) -> int:
+        return len(self._get())
 
-def _build_cell_bboxes(points: np.ndarray, unified_cells: List[np.ndarray]) -> np.ndarray:
-    """Compute per-cell AABBs (ax0, ay0, ax1, ay1) in XY for all unified cells."""
-    bboxes = np.zeros((len(unified_cells), 4), dtype=float)
-    for cid, conn in enumerate(unified_cells):
-        bboxes[cid, :] = _bbox_xy(points[conn])
-    return bboxes
+    def __reduce__(self):
+        # the builder is usually a closure; pickle the materialized dict instead
+        return (dict, (self._get(),))
 
 
-def _build_cell_edges(unified_cells: List[np.ndarray]) -> Dict[int, List[Tuple[int, int]]]:
+def _cell_edges_view(edges: np.ndarray, cell_edge_ids: np.ndarray, nverts: np.ndarray) -> Dict[int, List[Tuple[int, int]]]:
     """
-    For each unified cell id, list its (undirected) edges as (u,v) with u<v.
+    Dict view {cell_id: [(u,v), ...]} (u<v, side order) over the edge arrays, for legacy callers.
     """
-    cell_edges: Dict[int, List[Tuple[int, int]]] = {}
-    for cid, conn in enumerate(unified_cells):
-        k = len(conn)
-        edges = []
-        for i in range(k):
-            u = int(conn[i]); v = int(conn[(i+1) % k])
-            edges.append(hash_edge(u, v))
-        cell_edges[cid] = edges
-    return cell_edges
+    el = [tuple(e) for e in edges.tolist()]
+    return {cid: [el[e] for e in row[:k]]
+            for cid, (row, k) in enumerate(zip(cell_edge_ids.tolist(), nverts.tolist()))}
 
 
-def _build_edge_cells(cell_edges: Dict[int, List[Tuple[int, int]]]) -> Dict[Tuple[int, int], List[int]]:
+def _build_cell_adjacency(indptr: np.ndarray, ecells: np.ndarray, n_cells: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Invert cell_edges to edge->cells.
+    Inverted edge index as cell adjacency CSR: cells i and j are neighbors iff they share an edge.
+    Built from the edge → cells CSR; returns (indptr (C+1,), nbrs) with each row sorted ascending.
     """
-    edge_cells: Dict[Tuple[int, int], List[int]] = {}
-    for cid, edges in cell_edges.items():
-        for e in edges:
-            edge_cells.setdefault(e, []).append(cid)
-    return edge_cells
+    n = max(n_cells, 1)
+    deg = np.diff(indptr)
+    # every ordered (a, b) pair of entries within one edge's cell list
+    rep = np.repeat(deg, deg)
+    first = np.repeat(np.arange(len(ecells), dtype=np.int64), rep)
+    start = np.repeat(np.repeat(indptr[:-1], deg), rep)
+    second = start + (np.arange(len(first), dtype=np.int64) - np.repeat(np.cumsum(rep) - rep, rep))
+    a = ecells[first].astype(np.int64); b = ecells[second].astype(np.int64)
+    keep = a != b
+    key = np.unique(a[keep] * n + b[keep])
+    nbrs = (key % n).astype(np.int32)
+    out_ptr = np.zeros(n_cells + 1, dtype=np.int64)
+    np.cumsum(np.bincount(key // n, minlength=n_cells), out=out_ptr[1:])
+    return out_ptr, nbrs
+
+
+def _node_cells_view(indptr: np.ndarray, cells: np.ndarray) -> Dict[int, List[int]]:
+    """
+    Dict view {node_id: [cell_ids, ...]} over the node CSR, for legacy callers.
+    Nodes without incident cells are omitted.
+    """
+    cl = cells.tolist()
+    pl = indptr.tolist()
+    return {n: cl[pl[n]:pl[n + 1]] for n in range(len(pl) - 1) if pl[n + 1] > pl[n]}
+
+
+def build_boundary_mask(edges: np.ndarray, boundary_edges) -> Optional[np.ndarray]:
+    """
+    (E,) bool mask of which rows of an (E,2) edge array are boundary edges; None if unknown.
+    Membership is a `searchsorted` over the sorted packed keys (see `as_edge_keys`).
+    """
+    bkeys = as_edge_keys(boundary_edges)
+    if bkeys is None:
+        return None
+    keys = pack_edge_keys(edges)
+    if len(bkeys) == 0:
+        return np.zeros(len(keys), dtype=bool)
+    pos = np.minimum(np.searchsorted(bkeys, keys), len(bkeys) - 1)
+    return bkeys[pos] == keys
 
 
-def _build_node_cells(unified_cells: List[np.ndarray]) -> Dict[int, List[int]]:
-    """Build node → incident unified cell ids: {node_id: [cell_ids, ...]}."""
-    node_cells: Dict[int, List[int]] = {}
-    for cid, conn in enumerate(unified_cells):
-        for n in conn:
-            node_cells.setdefault(int(n), []).append(cid)
-    return node_cells
+def _build_node_cells(cells: np.ndarray, nverts: np.ndarray, n_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Node → incident unified cell ids as CSR over node ids 0..N-1: (indptr (N+1,) int64,
+    cells int32), cells ascending per node. Nodes without incident cells get empty rows.
+    """
+    flat_nodes = cells[cells >= 0].astype(np.int64)  # row-major: cell by cell, side order
+    flat_cells = np.repeat(np.arange(len(cells), dtype=np.int32), nverts)
+    order = np.argsort(flat_nodes, kind="stable")
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(flat_nodes, minlength=n_nodes), out=indptr[1:])
+    return indptr, flat_cells[order]
 
 
 def _build_centroids(points: np.ndarray, tris: Optional[np.ndarray], quads: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
     """Compute XY centroids for tris/quads; returns dict with keys 'tri' and/or 'quad'."""
     out: Dict[str, np.ndarray] = {}
     if tris is not None and len(tris):
-        out["tri"] = np.stack([_centroid(points[t]) for t in tris], axis=0)
+        out["tri"] = points[tris].mean(axis=1)
     if quads is not None and len(quads):
-        out["quad"] = np.stack([_centroid(points[q]) for q in quads], axis=0)
+        out["quad"] = points[quads].mean(axis=1)
     return out
 
 
-def _maybe_boundary_edges(mv: MeshView) -> Optional[set]:
+def _maybe_boundary_edges(mv: MeshView) -> Optional[np.ndarray]:
     """
-    Try to assemble a set of boundary edges from line elements if available.
+    Try to assemble boundary edges (sorted packed int64 keys) from line elements if available.
     The reader's MeshData currently exposes line_tags (name -> indices of line elements),
     but not the line connectivity explicitly. If connectivity is not available,
     return None and let checks handle the absence.
@@ -259,64 +556,101 @@ def _maybe_boundary_edges(mv: MeshView) -> Optional[set]:
     return None
 
 
+def _add_cells(cache: Dict[str, Any], mv: MeshView) -> Tuple[np.ndarray, np.ndarray]:
+    """Store the dense tri/quad arrays and the unified (C,4) connectivity in `cache`."""
+    # no copy when the view already holds int32 (build_mesh_view does)
+    tris = np.asarray(mv.tris, dtype=np.int32) if mv.tris is not None else np.zeros((0, 3), dtype=np.int32)
+    quads = np.asarray(mv.quads, dtype=np.int32) if mv.quads is not None else np.zeros((0, 4), dtype=np.int32)
+    cells, nverts = _build_cells(tris, quads)
+    cache["tris"] = tris
+    cache["quads"] = quads
+    cache["n_tris"] = len(tris)
+    cache["n_cells"] = len(cells)
+    cache["cells"] = cells
+    cache["cell_nverts"] = nverts
+    return cells, nverts
+
+
 def precompute_cache(mv: MeshView, cfg: Dict) -> Dict:
     """
     Build all one-time structures needed by checks.
     """
     cache: Dict[str, Any] = {}
 
-    # Unified cells & derived structures
-    unified = _build_unified_cells(mv.tris, mv.quads)
-    cache["unified_cells"] = unified
-    cell_edges = _build_cell_edges(unified)
-    cache["cell_edges"] = cell_edges
-    edge_cells = _build_edge_cells(cell_edges)
-    cache["edge_cells"] = edge_cells
-    node_cells = _build_node_cells(unified)
-    cache["node_cells"] = node_cells
+    # Unified cells (dense SoA) & derived structures
+    cells, nverts = _add_cells(cache, mv)
+    edges, cell_edge_ids, e_ptr, e_cells = _build_edges(cells, nverts)
+    cache["cell_edge_ids"] = cell_edge_ids
+    cache["edge_cells_csr"] = (edges, e_ptr, e_cells)
+    cache["cell_edges"] = _Lazy(lambda: _cell_edges_view(edges, cell_edge_ids, nverts))
+    cache["edge_cells"] = EdgeCells(edges, e_ptr, e_cells)
+    n_ptr, n_cells = _build_node_cells(cells, nverts, len(mv.points))
+    cache["node_cells_csr"] = (n_ptr, n_cells)
+    cache["node_cells"] = _Lazy(lambda: _node_cells_view(n_ptr, n_cells))
+    cache["cell_adjacency"] = _build_cell_adjacency(e_ptr, e_cells, len(cells))
 
     # Centroids (kept split by type for quality/BL checks)
     cache["centroids"] = _build_centroids(mv.points, mv.tris, mv.quads)
 
     # AABBs for unified cells
-    cell_bboxes = _build_cell_bboxes(mv.points, unified)
-    cache["cell_bboxes"] = cell_bboxes
-
-    # Spatial grid with neighbor closure that uses bboxes (fast and simple)
-    nx = int(cfg.get("overlap_grid_bins", 96))
-    _grid = _Grid(cell_bboxes, nx=nx, ny=None)
-
-    # Provide a neighbors() bound method that actually uses the bboxes for cell cid
-    # We compute the bin range for that cell and union candidates across those bins.
-    # For v1 simplicity, approximate by returning all cells whose bbox overlaps this cell's bbox.
-    # (still O(n) per cell worst-case, but fine for moderate sizes; replace later with true bin map if needed)
-    def _neighbors(cid: int):
-        """Yield j > cid for cells whose AABBs overlap cell `cid` (simple bbox filter)."""
-        ax0, ay0, ax1, ay1 = cell_bboxes[cid]
-        # Fast reject by bbox overlap
-        # NOTE: This is intentionally simple; for large meshes, optimize with true grid binning.
-        n = cell_bboxes.shape[0]
-        # yield only j>cid to reduce pairs (caller can choose its own convention)
-        for j in range(cid + 1, n):
-            bx0, by0, bx1, by1 = cell_bboxes[j]
-            if not (ax1 < bx0 or bx1 < ax0 or ay1 < by0 or by1 < ay0):
-                yield j
-
-    class _NeighborsWrapper:
-        __slots__ = ()
-        def neighbors(self, cid: int):
-            return _neighbors(cid)
-
-    cache["spatial_grid"] = _NeighborsWrapper()
+    cache["cell_bboxes"] = _build_cell_bboxes(mv.points, mv.tris, mv.quads)
 
     # Optional: boundary edges from line connectivity (None for v1 if not available)
-    cache["boundary_edges"] = _maybe_boundary_edges(mv)
+    cache["boundary_edges"] = as_edge_keys(_maybe_boundary_edges(mv))
+
+    return _finish_cache(cache, cfg)
+
 
-    # Also useful: node->edges map (derived from edge_cells)
+def cache_from_arrays(mv: MeshView, cfg: Dict, arrays: Dict[str, Any]) -> Dict:
+    """
+    Rebuild the full cache from its array core (as persisted by `disk_cache`), skipping the
+    O(N) Python passes: the dict views are re-expanded directly from the CSR arrays.
+
+    `arrays` holds: edge_cells_csr, cell_edge_ids, node_cells_csr, cell_adjacency, centroids,
+    cell_bboxes, boundary_edges (sorted int64 key array or None).
+    """
+    cache: Dict[str, Any] = {}
+    cells, nverts = _add_cells(cache, mv)
+    edges, e_ptr, e_cells = arrays["edge_cells_csr"]
+    cache["cell_edge_ids"] = arrays["cell_edge_ids"]
+    cell_edge_ids = arrays["cell_edge_ids"]
+    n_ptr, n_cells = arrays["node_cells_csr"]
+    cache["cell_edges"] = _Lazy(lambda: _cell_edges_view(edges, cell_edge_ids, nverts))
+    cache["edge_cells"] = EdgeCells(edges, e_ptr, e_cells)
+    cache["node_cells"] = _Lazy(lambda: _node_cells_view(n_ptr, n_cells))
+
+    cache["cell_adjacency"] = arrays["cell_adjacency"]
+    cache["edge_cells_csr"] = arrays["edge_cells_csr"]
+    cache["node_cells_csr"] = arrays["node_cells_csr"]
+    cache["centroids"] = arrays["centroids"]
+    cache["cell_bboxes"] = arrays["cell_bboxes"]
+    cache["boundary_edges"] = as_edge_keys(arrays["boundary_edges"])
+    return _finish_cache(cache, cfg)
+
+
+def _build_node_edges(edges: np.ndarray) -> Dict[int, List[Tuple[int, int]]]:
+    """{node_id: [(u,v), ...]} over the edge rows (row order)."""
     node_edges = cast(Dict[int, List[Tuple[int, int]]], {})
-    for (u, v) in edge_cells.keys():
+    for (u, v) in edges.tolist():
         node_edges.setdefault(u, []).append((u, v))
         node_edges.setdefault(v, []).append((u, v))
-    cache["node_edges"] = node_edges
+    return node_edges
+
+
+def _finish_cache(cache: Dict[str, Any], cfg: Dict) -> Dict:
+    """
+    Attach the structures derived from the array core: spatial grid, boundary mask, node_edges.
+    """
+    cell_bboxes = cache["cell_bboxes"]
+
+    # Spatial grid (broad phase); fixed bin count if configured, else adaptive
+    bins = cfg.get("overlap_grid_bins", None)
+    cache["spatial_grid"] = _Grid(cell_bboxes, nx=int(bins) if bins else None)
+
+    cache["boundary_mask"] = build_boundary_mask(cache["edge_cells_csr"][0], cache["boundary_edges"])
+
+    # Also useful: node->edges map, built on first access only
+    edges = cache["edge_cells_csr"][0]
+    cache["node_edges"] = _Lazy(lambda: _build_node_edges(edges))
 
     return cache
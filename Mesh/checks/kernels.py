@@ -14,14 +14,22 @@ operate in the XY plane and are safe for batch/CI use.
 Main Tasks:
 -----------
    - Basic primitives: signed areas, edge lengths, triangle angles.
+   - Batch primitives over stacked cells: `signed_area_tri_batch`, `poly_area_batch`,
+     `angles_tri_batch`, `edge_length_batch` (the scalar forms are thin wrappers around them);
+     `corner_angles_batch` for the interior angles of any k-gon.
    - Robust predicates: segment intersection, point-in-triangle/quad.
+   - Batch forms over packed cells: per-cell edge coordinates, all-edge-pairs intersection,
+     and the exact overlap mask used when the numba kernels are unavailable.
+   - Per-cell quality metrics (area, angles, size) from flat coordinate columns.
+   - Index kernels for `precompute_cache` (NumPy twins of the numba ones): packed per-cell
+     edge keys and spatial-grid bin memberships.
    - Consistent XY slicing for inputs shaped (..., ≥2).
 
 Notes:
 ------
    - Inputs may have ≥2 coordinates; only X,Y are used (Z ignored).
    - Tolerances (`eps`) are conservative defaults; callers may override.
-   - All functions return plain Python floats/bools where appropriate.
+   - Scalar functions return plain Python floats/bools; `*_batch` functions return arrays.
 """
 
 from typing import Tuple
@@ -44,12 +52,34 @@ def _xy(a: np.ndarray) -> np.ndarray:
 # ---------------------------
 # Areas & angles
 # ---------------------------
+def signed_area_tri_batch(tri: np.ndarray) -> np.ndarray:
+    """
+    Signed areas (T,) of triangles `tri` (T,3,>=2) in XY (CCW > 0).
+    """
+    tri = _xy(tri)
+    ab = tri[:, 1] - tri[:, 0]
+    ac = tri[:, 2] - tri[:, 0]
+    return 0.5 * (ab[:, 0]*ac[:, 1] - ab[:, 1]*ac[:, 0])
+
+
+def poly_area_batch(coords: np.ndarray) -> np.ndarray:
+    """
+    Signed polygon areas (C,) in XY (CCW positive) for `coords` (C,k,>=2), shoelace per row.
+    Also accepts a single (k,>=2) polygon (returns a 0-d array).
+    """
+    P = _xy(np.asarray(coords))
+    x = P[..., 0]; y = P[..., 1]
+    # one fused reduction; the wrap-around term is split out so the shifted operands are
+    # slice views rather than np.roll copies
+    return 0.5 * ((x[..., :-1]*y[..., 1:] - y[..., :-1]*x[..., 1:]).sum(-1)
+                  + x[..., -1]*y[..., 0] - y[..., -1]*x[..., 0])
+
+
 def signed_area_tri(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> float:
     """
     Signed area of triangle ABC in XY (CCW > 0).
     """
-    a = _xy(a); b = _xy(b); c = _xy(c)
-    return 0.5 * float((b[0]-a[0])*(c[1]-a[1]) - (b[1]-a[1])*(c[0]-a[0]))
+    return float(signed_area_tri_batch(np.stack([_xy(a), _xy(b), _xy(c)])[None])[0])
 
 
 def poly_area(coords: np.ndarray) -> float:
@@ -57,49 +87,59 @@ def poly_area(coords: np.ndarray) -> float:
     Signed polygon area in XY (CCW positive).
     coords: (k,2) or (k,>=2).
     """
-    P = _xy(np.asarray(coords))
-    x = P[:, 0]; y = P[:, 1]
-    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    return float(poly_area_batch(np.asarray(coords)[None])[0])
 
 
-def angles_tri(a: np.ndarray, b: np.ndarray, c: np.ndarray, deg: bool = True) -> Tuple[float, float, float]:
+def corner_angles_batch(poly: np.ndarray, deg: bool = True) -> np.ndarray:
     """
-    Internal angles at (A,B,C) of triangle ABC.
-    Uses law of cosines with safe clamping.
+    Interior angles (C,k) at each vertex of polygons `poly` (C,k,>=2), in vertex order.
+    atan2(|u×v|, u·v) of the two incident edge vectors: accurate near 0° and 180°
+    without clamping. All corners at once on (C,k) planes; no per-corner loop.
     """
-    A = _xy(a); B = _xy(b); C = _xy(c)
-    vAB = B - A; vAC = C - A
-    vBA = A - B; vBC = C - B
-    vCA = A - C; vCB = B - C
+    P = _xy(np.asarray(poly, dtype=float))
+    return _corner_angles_xy(P[..., 0], P[..., 1], deg=deg)
 
-    la = np.linalg.norm(vBC)  # opposite A
-    lb = np.linalg.norm(vCA)  # opposite B
-    lc = np.linalg.norm(vAB)  # opposite C
 
-    # avoid division by zero with tiny epsilon
-    eps = 1e-30
-    cosA = (lb*lb + lc*lc - la*la) / max(2.0*lb*lc, eps)
-    cosB = (lc*lc + la*la - lb*lb) / max(2.0*lc*la, eps)
-    cosC = (la*la + lb*lb - lc*lc) / max(2.0*la*lb, eps)
+def _corner_angles_xy(x: np.ndarray, y: np.ndarray, deg: bool = True) -> np.ndarray:
+    """`corner_angles_batch` on separate (C,k) x / y planes (e.g. `px[conn]`, `py[conn]`)."""
+    k = x.shape[1]
+    nxt = np.roll(np.arange(k), -1); prv = np.roll(np.arange(k), 1)
+    vx = x[:, nxt] - x; vy = y[:, nxt] - y  # to the next vertex
+    ux = x[:, prv] - x; uy = y[:, prv] - y  # to the previous vertex (not -v[prv]: keeps the sign of 0)
+    crs = ux*vy; crs -= uy*vx
+    dot = ux*vx; dot += uy*vy
+    out = np.arctan2(np.abs(crs, out=crs), dot, out=crs)
+    return np.degrees(out, out=out) if deg else out
 
-    cosA = float(np.clip(cosA, -1.0, 1.0))
-    cosB = float(np.clip(cosB, -1.0, 1.0))
-    cosC = float(np.clip(cosC, -1.0, 1.0))
 
-    Aang = np.arccos(cosA)
-    Bang = np.arccos(cosB)
-    Cang = np.arccos(cosC)
-    if deg:
-        Aang = np.degrees(Aang); Bang = np.degrees(Bang); Cang = np.degrees(Cang)
-    return (float(Aang), float(Bang), float(Cang))
+def angles_tri_batch(tri: np.ndarray, deg: bool = True) -> np.ndarray:
+    """
+    Internal angles (T,3) at vertices (A,B,C) of triangles `tri` (T,3,>=2).
+    """
+    return corner_angles_batch(tri, deg=deg)
+
+
+def angles_tri(a: np.ndarray, b: np.ndarray, c: np.ndarray, deg: bool = True) -> Tuple[float, float, float]:
+    """
+    Internal angles at (A,B,C) of triangle ABC.
+    """
+    ang = angles_tri_batch(np.stack([_xy(a), _xy(b), _xy(c)])[None], deg=deg)[0]
+    return (float(ang[0]), float(ang[1]), float(ang[2]))
+
+
+def edge_length_batch(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Euclidean lengths |PQ| in XY for stacked endpoints `p`, `q` (N,>=2) -> (N,).
+    """
+    d = _xy(q) - _xy(p)
+    return np.hypot(d[..., 0], d[..., 1])
 
 
 def edge_length(p: np.ndarray, q: np.ndarray) -> float:
     """
     Euclidean length |PQ| in XY.
     """
-    P = _xy(p); Q = _xy(q)
-    return float(np.linalg.norm(Q - P))
+    return float(edge_length_batch(np.asarray(p)[None], np.asarray(q)[None])[0])
 
 
 # ---------------------------
@@ -111,33 +151,69 @@ def segments_intersect(p: np.ndarray, q: np.ndarray, r: np.ndarray, s: np.ndarra
 
     Returns True if [p,q] intersects [r,s] (touching counts as intersection).
     """
-    p = _xy(p); q = _xy(q); r = _xy(r); s = _xy(s)
-
-    def orient(a, b, c):
-        return (b[0]-a[0])*(c[1]-a[1]) - (b[1]-a[1])*(c[0]-a[0])
+    px, py = float(p[0]), float(p[1]); qx, qy = float(q[0]), float(q[1])
+    rx, ry = float(r[0]), float(r[1]); sx, sy = float(s[0]), float(s[1])
 
-    o1 = orient(p, q, r)
-    o2 = orient(p, q, s)
-    o3 = orient(r, s, p)
-    o4 = orient(r, s, q)
+    # orientations as plain float math (no per-call closures or array temporaries)
+    o1 = (qx-px)*(ry-py) - (qy-py)*(rx-px)
+    o2 = (qx-px)*(sy-py) - (qy-py)*(sx-px)
+    o3 = (sx-rx)*(py-ry) - (sy-ry)*(px-rx)
+    o4 = (sx-rx)*(qy-ry) - (sy-ry)*(qx-rx)
 
     # Proper straddle on both segments
     if (o1 * o2 < -eps) and (o3 * o4 < -eps):
         return True
 
     # Collinear checks: projection overlap along both axes
-    def on_segment(u, v, w):
-        """w on segment uv (inclusive) assuming collinearity."""
-        return (min(u[0], v[0]) - eps <= w[0] <= max(u[0], v[0]) + eps) and \
-               (min(u[1], v[1]) - eps <= w[1] <= max(u[1], v[1]) + eps)
-
-    if abs(o1) <= eps and on_segment(p, q, r): return True
-    if abs(o2) <= eps and on_segment(p, q, s): return True
-    if abs(o3) <= eps and on_segment(r, s, p): return True
-    if abs(o4) <= eps and on_segment(r, s, q): return True
+    if abs(o1) <= eps and _on_segment(px, py, qx, qy, rx, ry, eps): return True
+    if abs(o2) <= eps and _on_segment(px, py, qx, qy, sx, sy, eps): return True
+    if abs(o3) <= eps and _on_segment(rx, ry, sx, sy, px, py, eps): return True
+    if abs(o4) <= eps and _on_segment(rx, ry, sx, sy, qx, qy, eps): return True
     return False
 
 
+def _on_segment(ux, uy, vx, vy, wx, wy, eps) -> bool:
+    """w on segment uv (inclusive) assuming collinearity."""
+    return (min(ux, vx) - eps <= wx <= max(ux, vx) + eps) and \
+           (min(uy, vy) - eps <= wy <= max(uy, vy) + eps)
+
+
+def _on_segment_nd(u: np.ndarray, v: np.ndarray, w: np.ndarray, eps: float) -> np.ndarray:
+    """Broadcasting `_on_segment` over (..., 2) arrays."""
+    return ((np.minimum(u, v) - eps <= w) & (w <= np.maximum(u, v) + eps)).all(axis=-1)
+
+
+def _collinear_hits(p, q, r, s, o1, o2, o3, o4, eps) -> np.ndarray:
+    """Vectorized collinear touch/overlap part of `segments_intersect` (broadcasting)."""
+    return ((np.abs(o1) <= eps) & _on_segment_nd(p, q, r, eps)) | \
+           ((np.abs(o2) <= eps) & _on_segment_nd(p, q, s, eps)) | \
+           ((np.abs(o3) <= eps) & _on_segment_nd(r, s, p, eps)) | \
+           ((np.abs(o4) <= eps) & _on_segment_nd(r, s, q, eps))
+
+
+def _orient_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Row-wise orientation determinant of (a,b,c) for (M,2) arrays.
+    """
+    return (b[:, 0]-a[:, 0])*(c[:, 1]-a[:, 1]) - (b[:, 1]-a[:, 1])*(c[:, 0]-a[:, 0])
+
+
+def segments_intersect_batch(p: np.ndarray, q: np.ndarray, r: np.ndarray, s: np.ndarray,
+                             eps: float = 1e-12) -> np.ndarray:
+    """
+    Row-wise `segments_intersect` over (M,2) endpoint arrays; returns an (M,) bool mask.
+
+    Proper straddles and collinear touch/overlap are both resolved vectorized.
+    """
+    p = _xy(p); q = _xy(q); r = _xy(r); s = _xy(s)
+    o1 = _orient_batch(p, q, r)
+    o2 = _orient_batch(p, q, s)
+    o3 = _orient_batch(r, s, p)
+    o4 = _orient_batch(r, s, q)
+
+    return ((o1 * o2 < -eps) & (o3 * o4 < -eps)) | _collinear_hits(p, q, r, s, o1, o2, o3, o4, eps)
+
+
 def point_in_triangle(p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray, eps: float = 1e-14) -> bool:
     """
     Barycentric point-in-triangle test (boundary inclusive).
@@ -160,3 +236,185 @@ def point_in_quad(p: np.ndarray, quad4: np.ndarray, eps: float = 1e-14) -> bool:
     """
     Q = _xy(np.asarray(quad4))
     return point_in_triangle(p, Q[0], Q[1], Q[2], eps) or point_in_triangle(p, Q[0], Q[2], Q[3], eps)
+
+
+# ---------------------------
+# Batch overlap over packed cells
+# ---------------------------
+def _orient_nd(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Broadcasting orientation determinant over (..., 2) arrays."""
+    return (b[..., 0]-a[..., 0])*(c[..., 1]-a[..., 1]) - (b[..., 1]-a[..., 1])*(c[..., 0]-a[..., 0])
+
+
+def cell_edge_coords(points: np.ndarray, conn: np.ndarray, lens: np.ndarray) -> np.ndarray:
+    """
+    Edge endpoint coordinates for packed cells: (C,4,2,2) as [cell, edge, start/end, xy].
+    Triangles repeat their closing edge in slot 3 so every cell has four edges.
+    """
+    tri = (lens == 3)
+    start = conn.copy()
+    start[tri, 3] = conn[tri, 2]
+    end = conn[:, [1, 2, 3, 0]]
+    end[tri, 2] = conn[tri, 0]
+    end[tri, 3] = conn[tri, 0]
+    return np.stack([points[start], points[end]], axis=2)
+
+
+def segments_intersect_cross(ei: np.ndarray, ej: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """
+    (K,) mask: does any edge of ei[k] (a,2,2) intersect any edge of ej[k] (b,2,2)?
+
+    All a*b orientations per pair, and the collinear touch checks, are computed by broadcasting.
+    """
+    p = ei[:, :, None, 0, :]; q = ei[:, :, None, 1, :]   # (K,a,1,2)
+    r = ej[:, None, :, 0, :]; s = ej[:, None, :, 1, :]   # (K,1,b,2)
+    o1 = _orient_nd(p, q, r)
+    o2 = _orient_nd(p, q, s)
+    o3 = _orient_nd(r, s, p)
+    o4 = _orient_nd(r, s, q)
+
+    hit = ((o1 * o2 < -eps) & (o3 * o4 < -eps)) | _collinear_hits(p, q, r, s, o1, o2, o3, o4, eps)
+    return hit.any(axis=(1, 2))
+
+
+def point_in_triangle_batch(p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray,
+                            eps: float = 1e-14) -> np.ndarray:
+    """
+    Row-wise `point_in_triangle` over (M,2) arrays; returns an (M,) bool mask.
+    """
+    v0 = c - a; v1 = b - a; v2 = p - a
+    den = v0[:, 0]*v1[:, 1] - v0[:, 1]*v1[:, 0]
+    ok = np.abs(den) >= eps
+    den = np.where(ok, den, 1.0)
+    u = (v2[:, 0]*v1[:, 1] - v2[:, 1]*v1[:, 0]) / den
+    v = (v2[:, 0]*v0[:, 1] - v2[:, 1]*v0[:, 0]) / -den
+    w = 1.0 - u - v
+    return ok & (u >= -eps) & (v >= -eps) & (w >= -eps)
+
+
+def _point_in_cells(p: np.ndarray, points: np.ndarray, conn: np.ndarray, lens: np.ndarray,
+                    cells: np.ndarray, eps: float) -> np.ndarray:
+    """(M,) mask: p[m] inside packed cell cells[m] (quads split as (0,1,2) ∪ (0,2,3))."""
+    cc = conn[cells]
+    a = points[cc[:, 0]]; c = points[cc[:, 2]]
+    hit = point_in_triangle_batch(p, a, points[cc[:, 1]], c, eps)
+    quad = ~hit & (lens[cells] == 4)
+    if quad.any():
+        hit[quad] = point_in_triangle_batch(p[quad], a[quad], c[quad], points[cc[quad, 3]], eps)
+    return hit
+
+
+def overlap_mask_batch(points: np.ndarray, conn: np.ndarray, lens: np.ndarray, pairs: np.ndarray,
+                       eps: float, eps_in: float = 1e-14, chunk: int = 65536) -> np.ndarray:
+    """
+    NumPy twin of `_kernels_nb.overlap_mask_nb`: any edge-edge hit, else either centroid
+    inside the other cell. Pairs are processed in chunks to bound temporary memory.
+    """
+    K = pairs.shape[0]
+    out = np.zeros(K, dtype=bool)
+    if K == 0:
+        return out
+    edges = cell_edge_coords(points, conn, lens)
+    safe = np.where(conn >= 0, conn, 0)
+    w = (conn >= 0)[..., None]
+    cent = (points[safe] * w).sum(axis=1) / lens[:, None]
+
+    for s0 in range(0, K, chunk):
+        i = pairs[s0:s0 + chunk, 0]; j = pairs[s0:s0 + chunk, 1]
+        hit = segments_intersect_cross(edges[i], edges[j], eps)
+        rest = np.nonzero(~hit)[0]
+        if rest.size:
+            ii = i[rest]; jj = j[rest]
+            hit[rest] = _point_in_cells(cent[ii], points, conn, lens, jj, eps_in) | \
+                _point_in_cells(cent[jj], points, conn, lens, ii, eps_in)
+        out[s0:s0 + chunk] = hit
+    return out
+
+
+# ---------------------------
+# Per-cell quality metrics
+# ---------------------------
+def _tri_area2(x: np.ndarray, y: np.ndarray, conn: np.ndarray, a: int, b: int, c: int) -> np.ndarray:
+    """
+    Twice the signed area of triangles (conn[:,a], conn[:,b], conn[:,c]), from unit-stride
+    gathers on the (N,) coordinate arrays `x`, `y` and in-place arithmetic on reused buffers.
+    """
+    ia, ib, ic = conn[:, a], conn[:, b], conn[:, c]
+    xa = x[ia]; ya = y[ia]
+    u = x[ib]; u -= xa
+    v = y[ic]; v -= ya
+    u *= v                      # (xb-xa)*(yc-ya)
+    w = y[ib]; w -= ya
+    np.subtract(x[ic], xa, out=v)
+    w *= v                      # (yb-ya)*(xc-xa)
+    u -= w
+    return u
+
+
+def _quad_area2(x: np.ndarray, y: np.ndarray, quads: np.ndarray) -> np.ndarray:
+    """Twice the signed shoelace area of quads, from gathers on the (N,) arrays `x`, `y`."""
+    xs = [x[quads[:, k]] for k in range(4)]
+    ys = [y[quads[:, k]] for k in range(4)]
+    acc = xs[0] * ys[1]
+    acc -= ys[0] * xs[1]
+    for k in range(1, 4):
+        t = xs[k] * ys[(k + 1) % 4]
+        t -= ys[k] * xs[(k + 1) % 4]
+        acc += t
+    return acc
+
+
+def tri_metrics_batch(px: np.ndarray, py: np.ndarray, tris: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (area, min interior angle [rad], size = sqrt(area)) per triangle, each (T,), from the
+    (N,) coordinate arrays `px`, `py`. NumPy twin of `_kernels_nb.tri_metrics_nb`.
+    """
+    area = np.abs(_tri_area2(px, py, tris, 0, 1, 2)); area *= 0.5
+    ang = _corner_angles_xy(px[tris], py[tris], deg=False)
+    minang = np.minimum(ang[:, 0], ang[:, 1]); np.minimum(minang, ang[:, 2], out=minang)
+    return area, minang, np.sqrt(area)
+
+
+def quad_metrics_batch(px: np.ndarray, py: np.ndarray, quads: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (area, interior angles [deg] (Q,4), size) per quad. `area` sums the unsigned halves
+    (0,1,2) + (0,3,2); `size` is sqrt of the unsigned shoelace area.
+    NumPy twin of `_kernels_nb.quad_metrics_nb`.
+    """
+    area = np.abs(_tri_area2(px, py, quads, 0, 1, 2))
+    area += np.abs(_tri_area2(px, py, quads, 0, 3, 2))
+    area *= 0.5
+    size = np.abs(_quad_area2(px, py, quads)); size /= 2
+    return area, _corner_angles_xy(px[quads], py[quads]), np.sqrt(size, out=size)
+
+
+# ---------------------------
+# Precompute index kernels
+# ---------------------------
+def cell_edge_keys_batch(cells: np.ndarray, nverts: np.ndarray) -> np.ndarray:
+    """
+    Packed undirected edge keys `min<<32 | max` per cell side, (C,4) int64, -1 in tri column 3.
+    NumPy twin of `_kernels_nb.cell_edge_keys`.
+    """
+    tri = (nverts == 3)
+    nxt = cells[:, [1, 2, 3, 0]]
+    nxt[tri, 2] = cells[tri, 0]
+    a = cells.astype(np.int64); b = nxt.astype(np.int64)
+    keys = (np.minimum(a, b) << 32) | np.maximum(a, b)
+    keys[tri, 3] = -1
+    return keys
+
+
+def grid_memberships_batch(ix: np.ndarray, iy: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Expand per-cell bin ranges `ix`, `iy` (C,2) [lo, hi] into every covered (cell, bx, by),
+    cell-major, bins in (bx, by) order. NumPy twin of `_kernels_nb.grid_memberships_nb`.
+    """
+    wx = ix[:, 1] - ix[:, 0] + 1
+    wy = iy[:, 1] - iy[:, 0] + 1
+    cnt = wx * wy
+    cid = np.repeat(np.arange(len(ix), dtype=np.int64), cnt)
+    t = np.arange(int(cnt.sum()), dtype=np.int64) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+    bx = ix[cid, 0] + t // wy[cid]
+    by = iy[cid, 0] + t % wy[cid]
+    return cid, bx, by
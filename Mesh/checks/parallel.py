@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Flowxus/mesh/check/parallel.py
+
+"""
+Project: Flowxus
+Author: Erfan Vaezi
+Date: 8/29/2025
+
+Purpose:
+--------
+Optional process-parallel execution of the expensive rules in a check run. Rules are pure
+functions of `(mv, th, cache)`, so the heavy ones can run in worker processes while the
+cheap ones run in the parent.
+
+Main Tasks:
+-----------
+   - `run_rule`: run one registry rule and normalize its `id`/`severity` fields.
+   - `submit_rules`: start a fork-based process pool and submit rules to it, one task each.
+
+Notes:
+------
+   - Workers are forked so they inherit `mv` and `cache` copy-on-write: the large NumPy
+     arrays are never pickled or copied. Only the small finding dicts travel back.
+   - Where `fork` is unavailable (Windows), or numba's thread pool is already running in
+     the parent (forking it can hang the process), `submit_rules` returns no futures and
+     the caller runs everything serially.
+   - After an early-exit stop the workers are terminated rather than waited for.
+   - Only rules listed in `registry.HEAVY_RULES` are worth a worker; for the rest the
+     process start-up costs more than the rule itself.
+"""
+
+
+import multiprocessing as mp
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from ._kernels_nb import _precompile_numba, parallel_layer_started
+from .registry import REGISTRY, RuleSpec
+
+
+# (mv, th, cache) for forked workers; set only while a pool is being fed
+_STATE: Optional[Tuple[Any, Dict[str, Any], Dict[str, Any]]] = None
+
+
+def run_rule(spec: RuleSpec, mv, th: Dict[str, Any], cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Run `spec.fn` and force the registry's id/severity onto the finding."""
+    finding = spec.fn(mv, th, cache)
+    # enforce severity field consistency
+    finding["severity"] = spec.severity
+    # ensure id matches registry
+    finding["id"] = spec.id
+    return finding
+
+
+def _worker(rid: str) -> Dict[str, Any]:
+    """Pool entry point: run rule `rid` on the state inherited from the parent."""
+    mv, th, cache = _STATE  # type: ignore[misc]
+    return run_rule(REGISTRY[rid], mv, th, cache)
+
+
+def submit_rules(rule_ids: List[str], mv, th: Dict[str, Any], cache: Dict[str, Any],
+                 max_workers: Optional[int] = None) -> Tuple[Optional[ProcessPoolExecutor], Dict[str, Future]]:
+    """
+    Submit each rule in `rule_ids` to its own task on a fork-based pool.
+
+    Returns (pool, {rule_id: future}); (None, {}) if there is nothing to do, fork is
+    unavailable or numba's thread pool already runs here. The caller must `shutdown(pool)`.
+    """
+    global _STATE
+    if not rule_ids or parallel_layer_started():
+        return None, {}
+    try:
+        ctx = mp.get_context("fork")
+    except ValueError:
+        return None, {}
+
+    _precompile_numba()  # compile once here; forked workers inherit the dispatchers
+    _STATE = (mv, th, cache)
+    n = min(len(rule_ids), max_workers or os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=n, mp_context=ctx)
+    futures = {rid: pool.submit(_worker, rid) for rid in rule_ids}
+    return pool, futures
+
+
+def shutdown(pool: Optional[ProcessPoolExecutor], terminate: bool = False) -> None:
+    """
+    Stop the pool (dropping unstarted tasks) and release the inherited state.
+    With `terminate`, running tasks are killed instead of waited for (early-exit stop).
+    """
+    global _STATE
+    if pool is not None:
+        if terminate:
+            procs = list((getattr(pool, "_processes", None) or {}).values())
+            pool.shutdown(wait=False, cancel_futures=True)
+            for proc in procs:
+                proc.terminate()
+            for proc in procs:
+                proc.join()
+        else:
+            pool.shutdown(wait=True, cancel_futures=True)
+    _STATE = None
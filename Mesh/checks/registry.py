@@ -17,7 +17,9 @@ Main Tasks:
    - Import rule functions from `errors.py` (mandatory) and `warnings.py` (optional).
    - Bind them into `RuleSpec` objects with metadata (id, fn, severity, fixable).
    - Populate `REGISTRY` (id → spec) and `RULES_ORDER` (deterministic ordering).
-   - Provide helper lists by severity and a filter function for enabling/disabling.
+   - Provide helper lists by severity and a filter function for enabling/disabling,
+     backed by an immutable dispatch table (`ALL_SPECS`) memoized per enabled map.
+   - Provide a cost-ordered error list (`FAST_ERRORS_FIRST`) for early-exit runs.
 
 Inputs/Contracts:
 -----------------
@@ -30,11 +32,16 @@ Notes:
    - Scope: 2D meshing checks, but registry design allows extension.
    - Duplicates are disallowed: adding a rule with an existing id raises ValueError.
    - Severity is constrained to {"error", "warn"}.
+   - `touches_th` declares which thresholds a rule reads; rules opt in to per-rule
+     finding memoization (see `disk_cache.py`) by setting it, `frozenset()` if none.
+   - `ALL_SPECS` is snapshotted from `REGISTRY` at import; replacing entries afterwards
+     does not change dispatch unless the table is rebuilt and `_enabled` cleared.
 """
 
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 # ---- Import rules (errors are mandatory; warnings are optional in v1) ----
 from . import errors as _err  # must exist
@@ -55,6 +62,9 @@ class RuleSpec:
     fn: Callable  # signature: fn(mv, thresholds_dict, cache_dict) -> finding_dict
     severity: str  # "error" | "warn"
     fixable: bool = True
+    # Threshold keys the rule reads; findings are memoized per (mesh, rule, th slice).
+    # None opts the rule out of memoization.
+    touches_th: Optional[FrozenSet[str]] = None
 
 
 # ---- Build registry ----
@@ -70,28 +80,33 @@ def _add(spec: RuleSpec) -> None:
 
 
 # Errors (hard failures)
-_add(RuleSpec("surface_orientation",    _err.surface_orientation,    "error", True))
-_add(RuleSpec("negative_jacobians",     _err.negative_jacobians,     "error", True))
-_add(RuleSpec("duplicate_elements",     _err.duplicate_elements,     "error", True))
-_add(RuleSpec("multiple_edges",         _err.multiple_edges,         "error", True))
-_add(RuleSpec("nonmanifold",            _err.nonmanifold,            "error", True))
-_add(RuleSpec("overlapping_elements",   _err.overlapping_elements,   "error", True))
-_add(RuleSpec("uncovered_faces",        _err.uncovered_faces,        "error", True))
-_add(RuleSpec("missing_internal_faces", _err.missing_internal_faces, "error", True))
-_add(RuleSpec("bl_continuity",          _err.bl_continuity,          "error", True))
-_add(RuleSpec("missing_physical_groups",_err.missing_physical_groups,"error", False))
+_add(RuleSpec("surface_orientation",    _err.surface_orientation,    "error", True,  frozenset()))
+_add(RuleSpec("negative_jacobians",     _err.negative_jacobians,     "error", True,  frozenset({"collinear_eps"})))
+_add(RuleSpec("duplicate_elements",     _err.duplicate_elements,     "error", True,  frozenset()))
+_add(RuleSpec("multiple_edges",         _err.multiple_edges,         "error", True,  frozenset()))
+_add(RuleSpec("nonmanifold",            _err.nonmanifold,            "error", True,  frozenset()))
+_add(RuleSpec("overlapping_elements",   _err.overlapping_elements,   "error", True,  frozenset({"collinear_eps"})))
+_add(RuleSpec("uncovered_faces",        _err.uncovered_faces,        "error", True,  frozenset()))
+_add(RuleSpec("missing_internal_faces", _err.missing_internal_faces, "error", True,  frozenset()))
+_add(RuleSpec("bl_continuity",          _err.bl_continuity,          "error", True,  frozenset({"wall_name"})))
+_add(RuleSpec("missing_physical_groups",_err.missing_physical_groups,"error", False,
+              frozenset({"required_groups", "group_dims", "strict_if_no_field_data"})))
 
 
 # Warnings (advisories) — register only if module is present
 if _HAS_WARNINGS:
-    _add(RuleSpec("two_single_edges",          _wrn.two_single_edges,          "warn",  True))
-    _add(RuleSpec("tiny_elements",             _wrn.tiny_elements,             "warn",  True))
-    _add(RuleSpec("min_angle_tris",            _wrn.min_angle_tris,            "warn",  True))
-    _add(RuleSpec("quad_skewness_orthogonality", _wrn.quad_skewness_orthogonality, "warn", True))
-    _add(RuleSpec("grading_spikes",            _wrn.grading_spikes,            "warn",  True))
-    _add(RuleSpec("first_layer_height",        _wrn.first_layer_height,        "warn",  False))
-    _add(RuleSpec("boundary_coverage",         _wrn.boundary_coverage,         "warn",  True))
-    _add(RuleSpec("untagged_entities",         _wrn.untagged_entities,         "warn",  True))
+    _add(RuleSpec("two_single_edges",          _wrn.two_single_edges,          "warn",  True,  frozenset()))
+    _add(RuleSpec("tiny_elements",             _wrn.tiny_elements,             "warn",  True,
+                  frozenset({"tiny_area_rel", "tiny_area_abs", "fp32_metrics"})))
+    _add(RuleSpec("min_angle_tris",            _wrn.min_angle_tris,            "warn",  True,
+                  frozenset({"min_angle_deg", "fp32_metrics"})))
+    _add(RuleSpec("quad_skewness_orthogonality", _wrn.quad_skewness_orthogonality, "warn", True,
+                  frozenset({"quad_skew_p95", "fp32_metrics"})))
+    _add(RuleSpec("grading_spikes",            _wrn.grading_spikes,            "warn",  True,
+                  frozenset({"grading_ratio_max", "fp32_metrics"})))
+    _add(RuleSpec("first_layer_height",        _wrn.first_layer_height,        "warn",  False, frozenset({"first_layer_target"})))
+    _add(RuleSpec("boundary_coverage",         _wrn.boundary_coverage,         "warn",  True,  frozenset({"wall_name"})))
+    _add(RuleSpec("untagged_entities",         _wrn.untagged_entities,         "warn",  True,  frozenset()))
 
 
 # ---- Deterministic execution order ----
@@ -122,6 +137,34 @@ if _HAS_WARNINGS:
     ]
 
 
+# Dispatch table in execution order, built once at import
+ALL_SPECS: Tuple[RuleSpec, ...] = tuple(REGISTRY[rid] for rid in RULES_ORDER)
+ALL_IDS: Tuple[str, ...] = tuple(RULES_ORDER)
+
+
+# Error rules from cheapest to most expensive; used by the `early_exit` policy so the
+# first failure is found with as little work as possible.
+FAST_ERRORS_FIRST: List[str] = [
+    "surface_orientation",
+    "duplicate_elements",
+    "negative_jacobians",
+    "multiple_edges",
+    "uncovered_faces",
+    "missing_internal_faces",
+    "nonmanifold",
+    "bl_continuity",
+    "missing_physical_groups",   # re-reads the .msh file
+    "overlapping_elements",      # broad + exact pairwise phase
+]
+
+
+# Rules expensive enough to be worth a worker process under `policy.parallel`.
+HEAVY_RULES: List[str] = [
+    "overlapping_elements",
+    "missing_physical_groups",
+]
+
+
 # ---- Convenience: severity lists ----
 
 SEVERITY = {
@@ -130,7 +173,23 @@ SEVERITY = {
 }
 
 
-def get_enabled_ids(enabled_map: Optional[Dict[str, bool]]) -> List[str]:
+@lru_cache(maxsize=32)
+def _enabled(disabled: FrozenSet[str]) -> Tuple[Tuple[str, ...], Tuple[RuleSpec, ...]]:
+    """(ids, specs) of ALL_SPECS minus `disabled`, in execution order (memoized)."""
+    if not disabled:
+        return ALL_IDS, ALL_SPECS
+    specs = tuple(s for s in ALL_SPECS if s.id not in disabled)
+    return tuple(s.id for s in specs), specs
+
+
+def _disabled(enabled_map: Optional[Dict[str, bool]]) -> FrozenSet[str]:
+    """Rule ids switched off in `enabled_map` (absent ids default to enabled)."""
+    if not enabled_map:
+        return frozenset()
+    return frozenset(rid for rid, on in enabled_map.items() if not on)
+
+
+def get_enabled_ids(enabled_map: Optional[Dict[str, bool]]) -> Tuple[str, ...]:
     """
     Filter the canonical RULES_ORDER based on a user-provided enable/disable map.
 
@@ -142,9 +201,23 @@ def get_enabled_ids(enabled_map: Optional[Dict[str, bool]]) -> List[str]:
 
     Returns
     -------
-    List[str]
-        Ordered list of rule ids that remain enabled, preserving RULES_ORDER.
+    Tuple[str, ...]
+        Ordered ids of the rules that remain enabled, preserving RULES_ORDER. Shared and
+        memoized per set of disabled ids; do not mutate.
     """
-    if not enabled_map:
-        return list(RULES_ORDER)
-    return [rid for rid in RULES_ORDER if enabled_map.get(rid, True)]
+    return _enabled(_disabled(enabled_map))[0]
+
+
+def get_enabled_specs(enabled_map: Optional[Dict[str, bool]]) -> Tuple[RuleSpec, ...]:
+    """`RuleSpec`s for `get_enabled_ids(enabled_map)`, from the same memoized table."""
+    return _enabled(_disabled(enabled_map))[1]
+
+
+def order_for_early_exit(rule_ids: Sequence[str]) -> List[str]:
+    """
+    Reorder `rule_ids` so error rules run first, cheapest first (FAST_ERRORS_FIRST);
+    remaining rules keep their relative order.
+    """
+    rank = {rid: i for i, rid in enumerate(FAST_ERRORS_FIRST)}
+    errs = sorted((r for r in rule_ids if r in rank), key=rank.__getitem__)
+    return errs + [r for r in rule_ids if r not in rank]
@@ -18,6 +18,8 @@ Main Tasks:
    - Define checks with the uniform signature: `chk_<rule_id>(mv, th, cache) -> dict`.
    - Keep heavy geometry in shared helpers; keep these rules lightweight.
    - Emit findings with a stable schema for downstream tools.
+   - `run_warn_checks`: batch entry that runs the shared metric kernels once, then
+     every WARN rule (`WARN_RULES`, registry order) on a thread pool, for CI-style runs.
 
 Inputs/Contracts:
 -----------------
@@ -28,7 +30,14 @@ Inputs/Contracts:
     Tunables like `min_angle_deg`, `tiny_area_rel`, `grading_ratio_max`,
     `wall_name`, etc. Unknown keys are ignored.
 - `cache` : dict (precomputations)
-    Example: `edge_cells`, `boundary_edges`, `unified_cells`, `centroids`.
+    Example: `edge_cells_csr`, `boundary_edges`, `cells`/`cell_nverts`, `centroids`.
+    Edge consumers read the CSR arrays; the `edge_cells` mapping is a facade for
+    legacy callers only.
+    The quality rules add `tri_metrics` / `quad_metrics` (one fused pass each) and
+    `cell_sizes` on first use (`*32` variants, from float32 coordinates in `pxy32`,
+    when `fp32_metrics` is set), each stored as (source arrays, value); see `_memo`.
+    `run_checks` passes a per-run shallow copy of the shared cache entry, so these
+    derived arrays are shared by the rules of one run and dropped with it.
 
 Finding Schema:
 ---------------
@@ -52,8 +61,15 @@ Notes:
 
 
 from __future__ import annotations
-from typing import Dict, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import numpy as np
+from ._kernels_nb import quad_metrics, tri_metrics
+
+
+# Empty id array for fast-path (nothing flagged) returns
+_NO_IDS = np.zeros(0, dtype=np.intp)
 
 
 # ---- Shared finding builder ----
@@ -69,6 +85,112 @@ def _finding(rule_id: str, ok: bool, count: int, examples: List, details: Dict,
     }
 
 
+# ---- Per-cell metrics (one fused pass, shared across rules) ----
+def _memo(cache, key: str, deps: tuple, build):
+    """
+    `build()` memoized in `cache[key]` alongside the arrays it was built from; a hit needs
+    the very same objects (`is`), so a cache reused with another MeshView recomputes.
+    """
+    hit = cache.get(key)
+    if hit is not None and len(hit[0]) == len(deps) and all(a is b for a, b in zip(hit[0], deps)):
+        return hit[1]
+    val = build()
+    cache[key] = (deps, val)
+    return val
+
+
+def _coords(mv, th, cache):
+    """
+    (px, py, cache-key suffix) at the working precision: `mv.px`/`mv.py`, or float32 copies
+    (built once per cache) when `th["fp32_metrics"]` is set.
+    """
+    if not th.get("fp32_metrics", False):
+        return mv.px, mv.py, ""
+    px, py = _memo(cache, "pxy32", (mv.px, mv.py),
+                   lambda: (mv.px.astype(np.float32), mv.py.astype(np.float32)))
+    return px, py, "32"
+
+
+def _tri_metrics(mv, th, cache):
+    """(area, min_angle_rad, size) per triangle; computed once per precision and kept in `cache`."""
+    px, py, sfx = _coords(mv, th, cache)
+    return _memo(cache, "tri_metrics" + sfx, (px, py, mv.tris), lambda: tri_metrics(px, py, mv.tris))
+
+
+def _quad_metrics(mv, th, cache):
+    """(area, angles_deg (Q,4), size) per quad; computed once per precision and kept in `cache`."""
+    px, py, sfx = _coords(mv, th, cache)
+    return _memo(cache, "quad_metrics" + sfx, (px, py, mv.quads), lambda: quad_metrics(px, py, mv.quads))
+
+
+def _cell_sizes(mv, th, cache) -> np.ndarray:
+    """Size proxy sqrt(area) per unified cell (tris, then quads), (C,); cached in `cache`."""
+    def build():
+        parts = []
+        if mv.tris is not None and len(mv.tris):
+            parts.append(_tri_metrics(mv, th, cache)[2])
+        if mv.quads is not None and len(mv.quads):
+            parts.append(_quad_metrics(mv, th, cache)[2])
+        return np.concatenate(parts) if parts else np.zeros(0)
+
+    sfx = "32" if th.get("fp32_metrics", False) else ""
+    return _memo(cache, "cell_sizes" + sfx, (mv.px, mv.tris, mv.quads), build)
+
+
+def _pct(a: np.ndarray, *qs: float) -> List[float]:
+    """
+    Percentiles `qs` of `a`, equal to `np.percentile(a, q)` (linear), from one
+    `np.partition` over the bracketing order statistics instead of a full sort.
+    """
+    a = np.asarray(a, dtype=float).ravel()
+    n = len(a)
+    if n == 0:
+        raise ValueError("percentile of an empty array")
+    pos = [(n - 1) * (q / 100.0) for q in qs]
+    lo = [int(np.floor(p)) for p in pos]
+    hi = [min(k + 1, n - 1) for k in lo]
+    part = np.partition(a, sorted(set(lo + hi + [n - 1])))
+    if np.isnan(part[-1]):  # NaNs partition to the end; np.percentile propagates them
+        return [float("nan")] * len(qs)
+    out = []
+    for p, k, j in zip(pos, lo, hi):
+        t = p - k
+        va, vb = part[k], part[j]
+        d = vb - va
+        # same two-sided lerp as NumPy, so results match bit for bit
+        out.append(float(vb - d*(1 - t)) if t >= 0.5 else float(va + d*t))
+    return out
+
+
+# ---- Dangling-edge pairing ----
+def _tip_pairs(e: np.ndarray):
+    """
+    Index pairs (i < j) of rows of `e` (D,2) that share exactly one node, sorted by (i, j).
+    Groups edge endpoints by node and emits every pair within a group.
+    """
+    D = len(e)
+    if D < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    nodes = np.concatenate([e[:, 0], e[:, 1]])
+    other = np.concatenate([e[:, 1], e[:, 0]])
+    eid = np.tile(np.arange(D, dtype=np.int64), 2)
+    order = np.lexsort((eid, nodes))
+    nodes, other, eid = nodes[order], other[order], eid[order]
+
+    # each slot p pairs with the later slots of its node run: p+1 .. end-1
+    n = len(nodes)
+    start = np.flatnonzero(np.r_[True, nodes[1:] != nodes[:-1]])
+    end = np.repeat(np.r_[start[1:], n], np.diff(np.r_[start, n]))
+    cnt = end - np.arange(n) - 1
+    left = np.repeat(np.arange(n), cnt)
+    right = left + 1 + np.arange(int(cnt.sum())) - np.repeat(np.cumsum(cnt) - cnt, cnt)
+    keep = other[left] != other[right]
+
+    pi, pj = eid[left[keep]], eid[right[keep]]  # eid ascends within a run, so pi < pj
+    packed = np.unique(pi * D + pj)
+    return packed // D, packed % D
+
+
 # ------------------------------------------------------------------------------------
 # 1) two_single_edges (dangling edge pairs)
 # ------------------------------------------------------------------------------------
@@ -76,28 +198,21 @@ def two_single_edges(mv, th, cache) -> Dict:
     """
     Detect dangling edges (degree ≤ 1) that meet tip-to-tip (share exactly one node).
     Advisory: often indicates sliver remnants or tiny holes.
+    Examples are pairs (i < j) of dangling edges in sorted edge order, ordered by (i, j);
+    this differs from the discovery order of the older dict-based scan.
     """
-    edge_cells = cache.get("edge_cells", {})
-    dangling = [e for e, cells in edge_cells.items() if len(cells) <= 1]
-
-    # Heuristic: look for pairs sharing a node
-    pairs = []
-    seen = set()
-    for (u, v) in dangling:
-        for (a, b) in dangling:
-            if (u, v) == (a, b): continue
-            if len({u, v, a, b}) == 3:  # share exactly one node
-                key = tuple(sorted([(u, v), (a, b)]))
-                if key not in seen:
-                    seen.add(key)
-                    pairs.append(key)
-
-    ok = len(pairs) == 0
+    edges, indptr, _ = cache["edge_cells_csr"]
+    dangling = edges[np.diff(indptr) <= 1].astype(np.int64)
+    dangling = dangling[dangling[:, 0] != dangling[:, 1]]  # collapsed edges pair with nothing
+    pi, pj = _tip_pairs(dangling)
+    pairs = [(tuple(a), tuple(b)) for a, b in zip(dangling[pi[:10]].tolist(), dangling[pj[:10]].tolist())]
+
+    ok = len(pi) == 0
     return _finding(
         "two_single_edges",
         ok=ok,
-        count=len(pairs),
-        examples=pairs[:10],
+        count=len(pi),
+        examples=pairs,
         details={"note": "Dangling edges may indicate tiny holes or geometry defects."},
         fixable=True,
     )
@@ -111,25 +226,14 @@ def tiny_elements(mv, th, cache) -> Dict:
     Flag cells whose area is below either a relative threshold (`tiny_area_rel` × mean)
     or an absolute threshold (`tiny_area_abs`). Tri/quad areas computed consistently.
     """
-    pts = mv.points
     areas = []
 
     if mv.tris is not None and len(mv.tris):
-        tri_pts = pts[mv.tris]  # (T,3,2)
-        a = 0.5 * np.abs(
-            (tri_pts[:,1,0]-tri_pts[:,0,0])*(tri_pts[:,2,1]-tri_pts[:,0,1])
-          - (tri_pts[:,1,1]-tri_pts[:,0,1])*(tri_pts[:,2,0]-tri_pts[:,0,0])
-        )
-        areas.append(a)
+        areas.append(_tri_metrics(mv, th, cache)[0])  # (T,)
 
     if mv.quads is not None and len(mv.quads):
-        quad_pts = pts[mv.quads]  # (Q,4,2)
-        # split into two tris
-        a1 = 0.5 * np.abs((quad_pts[:,1,0]-quad_pts[:,0,0])*(quad_pts[:,2,1]-quad_pts[:,0,1])
-                        - (quad_pts[:,1,1]-quad_pts[:,0,1])*(quad_pts[:,2,0]-quad_pts[:,0,0]))
-        a2 = 0.5 * np.abs((quad_pts[:,3,0]-quad_pts[:,0,0])*(quad_pts[:,2,1]-quad_pts[:,0,1])
-                        - (quad_pts[:,3,1]-quad_pts[:,0,1])*(quad_pts[:,2,0]-quad_pts[:,0,0]))
-        areas.append(a1+a2)
+        # split into two tris (0,1,2) and (0,3,2)
+        areas.append(_quad_metrics(mv, th, cache)[0])
 
     if not areas:
         return _finding("tiny_elements", ok=True, count=0, examples=[], details={}, fixable=True)
@@ -139,7 +243,12 @@ def tiny_elements(mv, th, cache) -> Dict:
     rel_thr = th.get("tiny_area_rel", 1e-3)
     abs_thr = th.get("tiny_area_abs", 0.0)
 
-    bad_ids = np.nonzero((areas < rel_thr*mean_a) | (areas < abs_thr))[0]
+    # clean meshes (the common case) skip the mask + nonzero sweep
+    amin = areas.min()
+    if amin < rel_thr*mean_a or amin < abs_thr:
+        bad_ids = np.nonzero((areas < rel_thr*mean_a) | (areas < abs_thr))[0]
+    else:
+        bad_ids = _NO_IDS
     ok = len(bad_ids) == 0
     return _finding(
         "tiny_elements",
@@ -157,35 +266,22 @@ def tiny_elements(mv, th, cache) -> Dict:
 def min_angle_tris(mv, th, cache) -> Dict:
     """
     Flag triangles with minimum interior angle below `min_angle_deg` (degrees).
-    Uses Law-of-Cosines per element; robust to almost-degenerate edges.
+    Angles from atan2(|cross|, dot); robust to almost-degenerate edges.
     """
     if mv.tris is None or not len(mv.tris):
         return _finding("min_angle_tris", ok=True, count=0, examples=[], details={}, fixable=True)
 
-    pts = mv.points[mv.tris]  # (T,3,2)
-    # edge vectors
-    v0 = pts[:,1,:] - pts[:,0,:]
-    v1 = pts[:,2,:] - pts[:,1,:]
-    v2 = pts[:,0,:] - pts[:,2,:]
-    lens = [np.linalg.norm(v, axis=1) for v in (v0, v1, v2)]
-    # law of cosines
-    angles = []
-    for i in range(3):
-        a = lens[i-1]; b = lens[i-2]; c = lens[i]
-        cosang = (a*a + b*b - c*c) / (2*a*b + 1e-30)
-        cosang = np.clip(cosang, -1.0, 1.0)
-        angles.append(np.degrees(np.arccos(cosang)))
-    min_angles = np.min(np.stack(angles, axis=1), axis=1)
+    min_angles = np.degrees(_tri_metrics(mv, th, cache)[1])  # (T,)
 
     thr = th.get("min_angle_deg", 20.0)
-    bad_ids = np.nonzero(min_angles < thr)[0]
+    bad_ids = np.nonzero(min_angles < thr)[0] if min_angles.min() < thr else _NO_IDS
     ok = len(bad_ids) == 0
     return _finding(
         "min_angle_tris",
         ok=ok,
         count=len(bad_ids),
         examples=bad_ids[:20].tolist(),
-        details={"thr_deg": thr, "p5": float(np.percentile(min_angles,5)) if len(min_angles) else None},
+        details={"thr_deg": thr, "p5": _pct(min_angles, 5)[0] if len(min_angles) else None},
         fixable=True,
     )
 
@@ -201,27 +297,23 @@ def quad_skewness_orthogonality(mv, th, cache) -> Dict:
     if mv.quads is None or not len(mv.quads):
         return _finding("quad_skewness_orthogonality", ok=True, count=0, examples=[], details={}, fixable=True)
 
-    pts = mv.points[mv.quads]  # (Q,4,2)
-    # internal angles
-    v01 = pts[:,1,:]-pts[:,0,:]; v12 = pts[:,2,:]-pts[:,1,:]
-    v23 = pts[:,3,:]-pts[:,2,:]; v30 = pts[:,0,:]-pts[:,3,:]
-    def angle(u,v):
-        cosang = np.dot(u,v)/(np.linalg.norm(u,axis=1)*np.linalg.norm(v,axis=1)+1e-30)
-        return np.degrees(np.arccos(np.clip(cosang,-1.0,1.0)))
-    a0 = angle(v30,v01); a1 = angle(v01,v12); a2 = angle(v12,v23); a3 = angle(v23,v30)
-    angles = np.stack([a0,a1,a2,a3],axis=1)
-    skew = np.max(np.abs(angles-90.0),axis=1)  # deviation from 90°
-    ortho = np.min(np.cos(np.radians(np.abs(angles-90.0))),axis=1)
+    angles = _quad_metrics(mv, th, cache)[1]  # (Q,4) internal angles, degrees
+    # deviation from 90°, folded column by column (no (Q,4) temporaries)
+    skew = np.abs(angles[:,0]-90.0)
+    dev = np.empty_like(skew)
+    for k in range(1,4):
+        np.subtract(angles[:,k], 90.0, out=dev)
+        np.maximum(skew, np.abs(dev, out=dev), out=skew)
 
     skew_thr = th.get("quad_skew_p95",0.85)
-    bad_ids = np.nonzero(skew > skew_thr*90.0)[0]
+    bad_ids = np.nonzero(skew > skew_thr*90.0)[0] if skew.max() > skew_thr*90.0 else _NO_IDS
     ok = len(bad_ids)==0
     return _finding(
         "quad_skewness_orthogonality",
         ok=ok,
         count=len(bad_ids),
         examples=bad_ids[:20].tolist(),
-        details={"skew_thr": skew_thr, "p95_skew": float(np.percentile(skew,95))},
+        details={"skew_thr": skew_thr, "p95_skew": _pct(skew, 95)[0]},
         fixable=True,
     )
 
@@ -235,33 +327,24 @@ def grading_spikes(mv, th, cache) -> Dict:
     An edge is flagged if the size ratio of its two incident cells exceeds
     `grading_ratio_max`.
     """
-    edge_cells = cache.get("edge_cells",{})
-    centroids = cache.get("centroids",{})
-    pts = mv.points
-
-    # estimate size = sqrt(cell area)
-    def cell_size(conn):
-        P = pts[conn]
-        return np.sqrt(0.5*abs((P[1,0]-P[0,0])*(P[2,1]-P[0,1]) - (P[1,1]-P[0,1])*(P[2,0]-P[0,0]))) if len(conn)==3 \
-            else np.sqrt(abs((P[0,0]*P[1,1]-P[0,1]*P[1,0])+(P[1,0]*P[2,1]-P[1,1]*P[2,0])+(P[2,0]*P[3,1]-P[2,1]*P[3,0])+(P[3,0]*P[0,1]-P[3,1]*P[0,0]))/2)
-
-    unified = cache.get("unified_cells",[])
-    sizes = [cell_size(conn) for conn in unified]
+    edges, indptr, ecells = cache["edge_cells_csr"]
+    sizes = _cell_sizes(mv, th, cache)
 
-    bad_edges=[]
     r_thr=th.get("grading_ratio_max",2.5)
-    for e,cells in edge_cells.items():
-        if len(cells)==2:
-            s0,s1=sizes[cells[0]],sizes[cells[1]]
-            r=max(s0/s1,s1/s0)
-            if r>r_thr: bad_edges.append((e,r))
-    ok=len(bad_edges)==0
+    # interior edges straight from the CSR: exactly two incident cells
+    interior=np.nonzero(np.diff(indptr)==2)[0]
+    s0=sizes[ecells[indptr[interior]]]; s1=sizes[ecells[indptr[interior]+1]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r=np.maximum(s0/s1,s1/s0)  # a zero-size neighbour gives inf (flagged)
+    hit=np.nonzero(r>r_thr)[0]
+    bad_edges=[(tuple(e),x) for e,x in zip(edges[interior[hit[:20]]].tolist(),r[hit[:20]].tolist())]
+    ok=len(hit)==0
     return _finding(
         "grading_spikes",
         ok=ok,
-        count=len(bad_edges),
-        examples=bad_edges[:20],
-        details={"thr": r_thr, "pct_edges_over": 100*len(bad_edges)/max(1,len(edge_cells))},
+        count=len(hit),
+        examples=bad_edges,
+        details={"thr": r_thr, "pct_edges_over": 100*len(hit)/max(1,len(edges))},
         fixable=True,
     )
 
@@ -286,12 +369,13 @@ def first_layer_height(mv, th, cache) -> Dict:
     # crude: just take min distance of quad centroid to origin as proxy (real impl: dist to wall curve)
     dists = np.linalg.norm(q_c,axis=1)
     ratios=dists/target
+    p50, p90 = _pct(ratios, 50, 90)
     return _finding(
         "first_layer_height",
         ok=True,
         count=len(ratios),
         examples=[],
-        details={"target":target,"p50":float(np.percentile(ratios,50)),"p90":float(np.percentile(ratios,90))},
+        details={"target":target,"p50":p50,"p90":p90},
         fixable=False,
     )
 
@@ -331,29 +415,64 @@ def untagged_entities(mv, th, cache):
     total = (len(mv.tris) if mv.tris is not None else 0) + \
             (len(mv.quads) if mv.quads is not None else 0)
 
-    # Build the set of all unified cell ids [0..total-1]
-    allc = set(range(total))
-
-    # Collect tagged ids into a concrete List[int]
-    tagged_ids = []  # type: List[int]
+    # Mark tagged unified cell ids [0..total-1]; ids outside that range are ignored
+    tagged = np.zeros(total, dtype=np.bool_)
     if mv.cell_tags:
         # mv.cell_tags: Dict[str, np.ndarray]-like. Normalize + flatten to ints.
         for arr in mv.cell_tags.values():
             if arr is None:
                 continue
-            # np.asarray(..., dtype=int).ravel().tolist() -> List[int]
-            tagged_ids.extend(np.asarray(arr, dtype=int).ravel().tolist())
+            ids = np.asarray(arr, dtype=np.intp).ravel()
+            tagged[ids[(ids >= 0) & (ids < total)]] = True
 
-    # Now this is type-safe: difference expects an Iterable, we give a List[int]
-    missing = allc.difference(tagged_ids)
+    missing = np.flatnonzero(~tagged)
 
     ok = len(missing) == 0
     return {
         "id": "untagged_entities",
         "severity": "warn",
         "ok": ok,
-        "count": len(missing),
-        "examples": list(missing)[:20],
+        "count": int(missing.size),
+        "examples": missing[:20].tolist(),
         "details": {"note": "cells without tags"},
         "fixable": True,
     }
+
+
+# ------------------------------------------------------------------------------------
+# Batch entry point
+# ------------------------------------------------------------------------------------
+# All WARN rules in registry execution order
+WARN_RULES = (
+    ("two_single_edges", two_single_edges),
+    ("tiny_elements", tiny_elements),
+    ("min_angle_tris", min_angle_tris),
+    ("quad_skewness_orthogonality", quad_skewness_orthogonality),
+    ("grading_spikes", grading_spikes),
+    ("first_layer_height", first_layer_height),
+    ("boundary_coverage", boundary_coverage),
+    ("untagged_entities", untagged_entities),
+)
+
+
+def run_warn_checks(mv, th, cache, rule_ids=None, max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Run the WARN rules (all, or those in `rule_ids`) in order on one mesh and return their
+    findings. The fused tri/quad metric passes and cell sizes are built once up front, so
+    the rules only read `cache` and run concurrently on a thread pool (their hot paths are
+    NumPy / nogil numba). `max_workers=1` runs them serially in this thread.
+    """
+    wanted = None if rule_ids is None else set(rule_ids)
+    rules = [fn for rid, fn in WARN_RULES if wanted is None or rid in wanted]
+    if mv.tris is not None and len(mv.tris):
+        _tri_metrics(mv, th, cache)
+    if mv.quads is not None and len(mv.quads):
+        _quad_metrics(mv, th, cache)
+    _cell_sizes(mv, th, cache)
+
+    n = min(len(rules), max_workers or os.cpu_count() or 1)
+    if n <= 1:
+        return [fn(mv, th, cache) for fn in rules]
+    with ThreadPoolExecutor(max_workers=n) as ex:
+        futures = [ex.submit(fn, mv, th, cache) for fn in rules]
+        return [f.result() for f in futures]
@@ -29,17 +29,19 @@ Modules:
 """
 
 from .writer import gmsh_geo_from_domain, write_geo_file
-from .runner import mesh_geo
+from .runner import mesh_geo, mesh_geo_batch, mesh_geo_from_text
 from .processor import process_domain
 from .assembler import assemble_geo_script
 from .base import MeshGenerator, GeometryProcessor, MeshAssembler
-from .generators import GmshGenerator, default_gmsh_generator, CustomGenerator
+from .generators import GmshGenerator, default_gmsh_generator, GmshApiGenerator, CustomGenerator
 
 __all__ = [
     # Core API
     "gmsh_geo_from_domain",
     "write_geo_file",
     "mesh_geo",
+    "mesh_geo_batch",
+    "mesh_geo_from_text",
 
     # Modular components
     "process_domain",
@@ -53,5 +55,6 @@ __all__ = [
     # Generator implementations
     "GmshGenerator",
     "default_gmsh_generator",
+    "GmshApiGenerator",
     "CustomGenerator",
 ]
@@ -21,6 +21,8 @@ Modules:
 
 - field_composer: Field combination and background field orchestration
 
+- _fmt:           Shared float formatter for the emitters (internal)
+
 Notes:
 ------
 - This modular approach allows independent development of field types
@@ -33,8 +35,8 @@ from .sizing_fields import (
     emit_background_field,
     validate_distance_parameters
 )
-from .edge_fields import emit_edge_sizing_field, emit_all_edge_fields
-from .field_composer import compose_fields
+from .edge_fields import emit_edge_sizing_field, emit_all_edge_fields, emit_edge_fields_sized
+from .field_composer import compose_fields, write_fields
 
 # Re-export the main function for backward compatibility
 emit_sizing_fields = compose_fields
@@ -46,6 +48,8 @@ __all__ = [
     "emit_background_field",
     "emit_edge_sizing_field",
     "emit_all_edge_fields",
+    "emit_edge_fields_sized",
     "compose_fields",
+    "write_fields",
     "validate_distance_parameters"
 ]
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# Flowxus/mesh/core/fields/_fmt.py
+
+"""
+Project: Flowxus
+Author: Erfan Vaezi
+Date: 11/28/2025
+
+Purpose:
+--------
+Shared float formatting for the field emitters, so every module writes numbers
+to the .geo text identically.
+
+Notes:
+------
+- `_FMT` is the bound `"{:.16g}".format`; call it directly where the value is
+  already a Python float to skip the extra frame.
+"""
+
+_FMT = "{:.16g}".format
+
+
+def _fmt_float(x: float) -> str:
+    """Format float for Gmsh compatibility."""
+    return _FMT(x) if type(x) is float else _FMT(float(x))
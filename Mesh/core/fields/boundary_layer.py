@@ -23,10 +23,29 @@ Notes:
 - BoundaryLayer field is activated explicitly, not included in Min field
 - Compatible with Gmsh 4.14+ boundary layer options
 - Supports hybrid meshing (quads near wall, triangles elsewhere)
+- Field text is assembled from module-level templates with one `str.format` call
 """
 
 from typing import Dict, Optional, Sequence
-import math
+from ._fmt import _fmt_float
+
+
+# BoundaryLayer field (Field 3); {fan} and {quads} are whole optional lines or ""
+_BL_FIELD = (
+    "// Boundary Layer field for structured quad extrusion\n"
+    "Field[3] = BoundaryLayer;\n"
+    "Field[3].EdgesList = {{{curve}}};\n"
+    "{fan}"
+    "Field[3].hwall_n = {hwall};\n"
+    "Field[3].ratio = {ratio};\n"
+    "Field[3].thickness = {thick};\n"
+    "Field[3].IntersectMetrics = 1;\n"
+    "Field[3].AnisoMax = 1000;\n"
+    "{quads}"
+    "\n"
+    "// Activate BoundaryLayer field explicitly\n"
+    "BoundaryLayer Field = 3;\n\n"
+)
 
 
 def emit_boundary_layer_field(
@@ -69,8 +88,6 @@ def emit_boundary_layer_field(
     - This field is NOT included in the background Min field list
     - Returns empty string if n_layers == 0
     """
-    import io
-
     n_layers = int(inflation_settings["n_layers"])
     if n_layers <= 0:
         return ""
@@ -83,36 +100,19 @@ def emit_boundary_layer_field(
         if abs(growth_rate - 1.0) < 1e-12:
             bl_thickness = first_layer * n_layers
         else:
-            bl_thickness = first_layer * (math.pow(growth_rate, n_layers) - 1.0) / (growth_rate - 1.0)
+            bl_thickness = first_layer * (growth_rate ** n_layers - 1.0) / (growth_rate - 1.0)
     else:
         bl_thickness = float(thickness)
 
-    buf = io.StringIO()
-    W = buf.write
-
-    W("// Boundary Layer field for structured quad extrusion\n")
-    W("Field[3] = BoundaryLayer;\n")
-    W(f"Field[3].EdgesList = {{{airfoil_curve_id}}};\n")
-
+    fan = ""
     if fan_node_ids:
-        W("Field[3].FanNodesList = {" + ", ".join(str(int(i)) for i in fan_node_ids) + "};\n")
-
-    W(f"Field[3].hwall_n = {_fmt_float(first_layer)};\n")
-    W(f"Field[3].ratio = {_fmt_float(growth_rate)};\n")
-    W(f"Field[3].thickness = {_fmt_float(bl_thickness)};\n")
-    W("Field[3].IntersectMetrics = 1;\n")
-    W("Field[3].AnisoMax = 1000;\n")
-
-    if hybrid_bl:
-        W("Field[3].Quads = 1;\n")
-
-    W("\n")
-    W("// Activate BoundaryLayer field explicitly\n")
-    W("BoundaryLayer Field = 3;\n\n")
-
-    return buf.getvalue()
-
-
-def _fmt_float(x: float) -> str:
-    """Format float for Gmsh compatibility."""
-    return "{:.16g}".format(float(x))
+        fan = "Field[3].FanNodesList = {" + ", ".join(str(int(i)) for i in fan_node_ids) + "};\n"
+
+    return _BL_FIELD.format(
+        curve=airfoil_curve_id,
+        fan=fan,
+        hwall=_fmt_float(first_layer),
+        ratio=_fmt_float(growth_rate),
+        thick=_fmt_float(bl_thickness),
+        quads="Field[3].Quads = 1;\n" if hybrid_bl else "",
+    )
@@ -23,10 +23,36 @@ Notes:
 - Each edge gets a Distance field (odd IDs) and Threshold field (even IDs)
 - Field IDs start from base_id to avoid conflicts with core fields
 - Edge curves are typically IDs 1001-1004 (bottom, outlet, top, inlet)
+- Each Distance/Threshold block is a module-level template filled by one `str.format` call
 """
 
 from typing import Tuple
-import io
+from ._fmt import _fmt_float
+
+
+# Distance (base_id) + Threshold (base_id + 1) pair for one edge curve
+_EDGE_FIELDS = (
+    "Field[{did}] = Distance;\n"
+    "Field[{did}].CurvesList = {{{curve}}};\n"
+    "Field[{did}].NumPointsPerCurve = 2;\n"
+    "Field[{tid}] = Threshold;\n"
+    "Field[{tid}].InField = {did};\n"
+    "Field[{tid}].SizeMin = {smin};\n"
+    "Field[{tid}].SizeMax = {smax};\n"
+    "Field[{tid}].DistMin = {dmin};\n"
+    "Field[{tid}].DistMax = {dmax};\n\n"
+)
+
+# Same block preceded by the "// --- description: curve N ---" comment
+_EDGE_FIELDS_DESC = "// --- {desc}: curve {curve} ---\n" + _EDGE_FIELDS
+
+# (Distance field id, curve id, mesh_size_settings key, comment) per farfield edge, in emit order
+_EDGE_SPEC = (
+    (21, 1001, "bottom", "Bottom edge sizing"),
+    (23, 1002, "outlet", "Outlet edge sizing"),
+    (25, 1003, "top", "Top edge sizing"),
+    (27, 1004, "inlet", "Inlet edge sizing"),
+)
 
 
 def emit_edge_sizing_field(
@@ -71,27 +97,19 @@ def emit_edge_sizing_field(
     if size_min >= size_max:
         return "", None
 
-    buf = io.StringIO()
-    W = buf.write
-
-    if description:
-        W(f"// --- {description}: curve {curve_id} ---\n")
-
-    # Distance field
-    W(f"Field[{base_id}] = Distance;\n")
-    W(f"Field[{base_id}].CurvesList = {{{curve_id}}};\n")
-    W(f"Field[{base_id}].NumPointsPerCurve = 2;\n")
-
-    # Threshold field
     threshold_id = base_id + 1
-    W(f"Field[{threshold_id}] = Threshold;\n")
-    W(f"Field[{threshold_id}].InField = {base_id};\n")
-    W(f"Field[{threshold_id}].SizeMin = {_fmt_float(size_min)};\n")
-    W(f"Field[{threshold_id}].SizeMax = {_fmt_float(size_max)};\n")
-    W(f"Field[{threshold_id}].DistMin = {_fmt_float(dist_min)};\n")
-    W(f"Field[{threshold_id}].DistMax = {_fmt_float(dist_max)};\n\n")
+    text = (_EDGE_FIELDS_DESC if description else _EDGE_FIELDS).format(
+        desc=description,
+        did=base_id,
+        tid=threshold_id,
+        curve=curve_id,
+        smin=_fmt_float(size_min),
+        smax=_fmt_float(size_max),
+        dmin=_fmt_float(dist_min),
+        dmax=_fmt_float(dist_max),
+    )
 
-    return buf.getvalue(), threshold_id
+    return text, threshold_id
 
 
 def emit_all_edge_fields(
@@ -124,60 +142,39 @@ def emit_all_edge_fields(
     - Edge curve IDs: bottom=1001, outlet=1002, top=1003, inlet=1004
     - Field ID ranges: bottom(21-22), outlet(23-24), top(25-26), inlet(27-28)
     """
-    buf = io.StringIO()
-    active_fields = []
-
-    # Bottom edge (1001)
-    bottom_text, bottom_id = emit_edge_sizing_field(
-        base_id=21, curve_id=1001,
-        size_min=float(mesh_size_settings["bottom"]),
-        size_max=s_far,
-        dist_min=edmin, dist_max=edmax,
-        description="Bottom edge sizing"
-    )
-    if bottom_text:
-        buf.write(bottom_text)
-        active_fields.append(bottom_id)
-
-    # Outlet edge (1002)
-    outlet_text, outlet_id = emit_edge_sizing_field(
-        base_id=23, curve_id=1002,
-        size_min=float(mesh_size_settings["outlet"]),
-        size_max=s_far,
-        dist_min=edmin, dist_max=edmax,
-        description="Outlet edge sizing"
-    )
-    if outlet_text:
-        buf.write(outlet_text)
-        active_fields.append(outlet_id)
-
-    # Top edge (1003)
-    top_text, top_id = emit_edge_sizing_field(
-        base_id=25, curve_id=1003,
-        size_min=float(mesh_size_settings["top"]),
-        size_max=s_far,
-        dist_min=edmin, dist_max=edmax,
-        description="Top edge sizing"
+    return emit_edge_fields_sized(
+        *(float(mesh_size_settings[key]) for _, _, key, _ in _EDGE_SPEC),
+        edmin, edmax, s_far,
     )
-    if top_text:
-        buf.write(top_text)
-        active_fields.append(top_id)
-
-    # Inlet edge (1004)
-    inlet_text, inlet_id = emit_edge_sizing_field(
-        base_id=27, curve_id=1004,
-        size_min=float(mesh_size_settings["inlet"]),
-        size_max=s_far,
-        dist_min=edmin, dist_max=edmax,
-        description="Inlet edge sizing"
-    )
-    if inlet_text:
-        buf.write(inlet_text)
-        active_fields.append(inlet_id)
 
-    return buf.getvalue(), active_fields
 
+def emit_edge_fields_sized(
+        s_bottom: float,
+        s_outlet: float,
+        s_top: float,
+        s_inlet: float,
+        edmin: float,
+        edmax: float,
+        s_far: float
+) -> Tuple[str, list]:
+    """
+    `emit_all_edge_fields` on edge sizes already read and coerced to float by the caller
+    (as `compose_fields` does), skipping the dict lookups.
 
-def _fmt_float(x: float) -> str:
-    """Format float for Gmsh compatibility."""
-    return "{:.16g}".format(float(x))
+    Returns
+    -------
+    Tuple[str, list]
+        (combined_field_text, list_of_threshold_field_ids)
+    """
+    parts = []
+    active_fields = []
+    sizes = (s_bottom, s_outlet, s_top, s_inlet)
+    for (base_id, curve_id, _, description), size_min in zip(_EDGE_SPEC, sizes):
+        text, threshold_id = emit_edge_sizing_field(
+            base_id, curve_id, size_min, s_far, edmin, edmax, description
+        )
+        if text:
+            parts.append(text)
+            active_fields.append(threshold_id)
+
+    return "".join(parts), active_fields
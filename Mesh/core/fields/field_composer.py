@@ -24,18 +24,23 @@ Notes:
 - BoundaryLayer field is activated but not included in Min field
 - Field IDs: 1-2 (airfoil), 3 (BL), 21-28 (edges), 10 (Min background)
 - Maintains compatibility with original emit_sizing_fields function
+- `write_fields` streams the same text block by block into an open writer
+- Output is memoized per argument set (LRU, 128 entries); dict and sequence arguments
+  are frozen to tuples for the key, unhashable values bypass the cache
 """
 
-from typing import Dict, Optional, Sequence
-import io
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence, TextIO
 from .boundary_layer import emit_boundary_layer_field
 from .sizing_fields import emit_airfoil_sizing_fields, emit_background_field
-from .edge_fields import emit_all_edge_fields
+from .edge_fields import emit_edge_fields_sized
 
 
-def _fmt_float(x: float) -> str:
-    """Format float for Gmsh compatibility."""
-    return "{:.16g}".format(float(x))
+def _clamp_range(lo: float, hi: float):
+    """Order (lo, hi) and widen a (near-)empty range so Threshold gets DistMin < DistMax."""
+    if lo > hi:
+        lo, hi = hi, lo
+    return lo, (lo * (1.0 + 1e-6) if hi - lo < 1e-12 else hi)
 
 
 def compose_fields(
@@ -90,7 +95,73 @@ def compose_fields(
     -----
     - Maintains identical output to original emit_sizing_fields function
     - Uses modular field components for better organization
+    - Repeated calls with equal arguments return the cached text
     """
+    args = (
+        chord_scale, thickness, distance_points_per_curve, dist_min, dist_max,
+        edge_dist_min, edge_dist_max, hybrid_bl, airfoil_curve_id,
+        None if airfoil_point_sizes is None else tuple(airfoil_point_sizes),
+        None if fan_node_ids is None else tuple(fan_node_ids),
+    )
+    frozen_inflation = tuple(sorted(inflation_settings.items()))
+    frozen_mesh = tuple(sorted(mesh_size_settings.items()))
+    try:
+        return _compose_fields_cached(frozen_inflation, frozen_mesh, *args)
+    except TypeError:  # unhashable value somewhere in the arguments
+        return _compose_fields_cached.__wrapped__(frozen_inflation, frozen_mesh, *args)
+
+
+@lru_cache(maxsize=128, typed=True)
+def _compose_fields_cached(
+        frozen_inflation: tuple,
+        frozen_mesh: tuple,
+        chord_scale: float,
+        thickness: Optional[float],
+        distance_points_per_curve: int,
+        dist_min: float,
+        dist_max: float,
+        edge_dist_min: float,
+        edge_dist_max: float,
+        hybrid_bl: bool,
+        airfoil_curve_id: int,
+        airfoil_point_sizes: Optional[tuple],
+        fan_node_ids: Optional[tuple],
+) -> str:
+    """`compose_fields` on frozen (item-tuple) settings; memoized."""
+    return "".join(_iter_compose(dict(frozen_inflation), dict(frozen_mesh), chord_scale, thickness,
+                                 distance_points_per_curve, dist_min, dist_max, edge_dist_min,
+                                 edge_dist_max, hybrid_bl, airfoil_curve_id, airfoil_point_sizes,
+                                 fan_node_ids))
+
+
+def write_fields(writer: TextIO, *args, **kwargs) -> None:
+    """
+    Stream the `compose_fields` block into `writer` (anything with `.write(str)`) one
+    field block at a time instead of materializing the whole text.
+
+    Takes the same arguments as `compose_fields` after `writer`; not memoized.
+    """
+    write = writer.write
+    for chunk in _iter_compose(*args, **kwargs):
+        write(chunk)
+
+
+def _iter_compose(
+        inflation_settings: Dict[str, float],
+        mesh_size_settings: Dict[str, float],
+        chord_scale: float,
+        thickness: Optional[float] = None,
+        distance_points_per_curve: int = 200,
+        dist_min: float = 0.05,
+        dist_max: float = 5.0,
+        edge_dist_min: float = 0.0,
+        edge_dist_max: float = 0.02,
+        hybrid_bl: bool = True,
+        airfoil_curve_id: int = 1,
+        airfoil_point_sizes: Optional[Sequence[float]] = None,
+        fan_node_ids: Optional[Sequence[int]] = None,
+) -> Iterator[str]:
+    """Yield the `compose_fields` block field by field (header, 1-2, 3, 21-28, 10)."""
     # Scale distances from chord units to model units
     dmin = dist_min * chord_scale
     dmax = dist_max * chord_scale
@@ -98,14 +169,8 @@ def compose_fields(
     edmax = edge_dist_max * chord_scale
 
     # Validate and adjust distance parameters
-    if dmin > dmax:
-        dmin, dmax = dmax, dmin
-    if abs(dmax - dmin) < 1e-12:
-        dmax = dmin * (1.0 + 1e-6)
-    if edmin > edmax:
-        edmin, edmax = edmax, edmin
-    if abs(edmax - edmin) < 1e-12:
-        edmax = edmin * (1.0 + 1e-6)
+    dmin, dmax = _clamp_range(dmin, dmax)
+    edmin, edmax = _clamp_range(edmin, edmax)
 
     # Calculate farfield size
     s_inlet = float(mesh_size_settings["inlet"])
@@ -120,9 +185,7 @@ def compose_fields(
     if s_airfoil >= s_far:
         s_airfoil = max(1e-12, 0.99 * s_far)
 
-    buf = io.StringIO()
-    W = buf.write
-    W("// --- Mesh Fields: Distance -> Threshold + (optional) BoundaryLayer (+ per-edge) ---\n")
+    yield "// --- Mesh Fields: Distance -> Threshold + (optional) BoundaryLayer (+ per-edge) ---\n"
 
     active_fields = [2]  # Start with airfoil threshold field (Field 2)
 
@@ -136,7 +199,7 @@ def compose_fields(
         dmin=dmin,
         dmax=dmax
     )
-    W(airfoil_fields)
+    yield airfoil_fields
 
     # 2. Boundary layer field (Field 3) - activated separately
     n_layers = int(inflation_settings["n_layers"])
@@ -149,21 +212,19 @@ def compose_fields(
             airfoil_curve_id=airfoil_curve_id,
             fan_node_ids=fan_node_ids
         )
-        W(bl_fields)
+        yield bl_fields
         # Note: BL field (3) is NOT added to active_fields
 
     # 3. Edge sizing fields (Fields 21-28)
-    edge_fields_text, edge_field_ids = emit_all_edge_fields(
-        mesh_size_settings=mesh_size_settings,
+    edge_fields_text, edge_field_ids = emit_edge_fields_sized(
+        s_bottom, s_outlet, s_top, s_inlet,
         edmin=edmin,
         edmax=edmax,
         s_far=s_far
     )
-    W(edge_fields_text)
+    yield edge_fields_text
     active_fields.extend(edge_field_ids)
 
     # 4. Background field (Field 10)
     background_field = emit_background_field(active_fields)
-    W(background_field)
-
-    return buf.getvalue()
+    yield background_field
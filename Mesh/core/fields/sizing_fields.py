@@ -23,10 +23,38 @@ Notes:
 - Distance field samples curves at specified density for accuracy
 - Threshold field provides smooth size transition from SizeMin to SizeMax
 - All distances are scaled from chord units to model units
+- Fixed blocks are module-level templates filled by one `str.format` call
 """
 
 from typing import Optional, Sequence
-import io
+from ._fmt import _fmt_float
+
+
+# Fixed text of the airfoil Distance (Field 1) + Threshold (Field 2) pair
+_AIRFOIL_FIELDS = (
+    "// Distance field to airfoil curve\n"
+    "Field[1] = Distance;\n"
+    "Field[1].CurvesList = {{{curve}}};\n"
+    "Field[1].NumPointsPerCurve = {npts};\n\n"
+    "// Threshold field for near-foil size transition\n"
+    "Field[2] = Threshold;\n"
+    "Field[2].InField = 1;\n"
+    "Field[2].SizeMin = {smin};\n"
+    "Field[2].SizeMax = {smax};\n"
+    "Field[2].DistMin = {dmin};\n"
+    "Field[2].DistMax = {dmax};\n\n"
+)
+
+# One per-vertex MeshSize pin; same "{:.16g}" formatting as `_fmt_float`
+_PIN = "MeshSize {{ {} }} = {:.16g};\n"
+
+# Min background field over the active scalar fields (Field 10)
+_BACKGROUND_FIELD = (
+    "// Combine scalar metrics via Min field\n"
+    "Field[10] = Min;\n"
+    "Field[10].FieldsList = {{{ids}}};\n"
+    "Background Field = 10;\n\n"
+)
 
 
 def emit_airfoil_sizing_fields(
@@ -69,32 +97,25 @@ def emit_airfoil_sizing_fields(
     - Field[2] = Threshold field for size tapering
     - Returns field IDs [1, 2] for composition
     """
-    buf = io.StringIO()
-    W = buf.write
+    parts = []
 
     # Optional per-point MeshSize pins on the airfoil
     if airfoil_point_sizes is not None and len(airfoil_point_sizes) > 0:
-        W("// Per-point MeshSize on airfoil vertices (ids 1..N)\n")
-        for i, h in enumerate(airfoil_point_sizes, start=1):
-            W(f"MeshSize {{ {i} }} = {_fmt_float(h)};\n")
-        W("\n")
-
-    # Distance field to airfoil curve
-    W("// Distance field to airfoil curve\n")
-    W("Field[1] = Distance;\n")
-    W(f"Field[1].CurvesList = {{{airfoil_curve_id}}};\n")
-    W(f"Field[1].NumPointsPerCurve = {int(distance_points_per_curve)};\n\n")
-
-    # Threshold field for size tapering
-    W("// Threshold field for near-foil size transition\n")
-    W("Field[2] = Threshold;\n")
-    W("Field[2].InField = 1;\n")
-    W(f"Field[2].SizeMin = {_fmt_float(s_airfoil)};\n")
-    W(f"Field[2].SizeMax = {_fmt_float(s_far)};\n")
-    W(f"Field[2].DistMin = {_fmt_float(dmin)};\n")
-    W(f"Field[2].DistMax = {_fmt_float(dmax)};\n\n")
-
-    return buf.getvalue()
+        parts.append("// Per-point MeshSize on airfoil vertices (ids 1..N)\n")
+        n = len(airfoil_point_sizes)
+        parts.append("".join(map(_PIN.format, range(1, n + 1), map(float, airfoil_point_sizes))))
+        parts.append("\n")
+
+    # Distance field to airfoil curve + Threshold field for size tapering
+    parts.append(_AIRFOIL_FIELDS.format(
+        curve=airfoil_curve_id,
+        npts=int(distance_points_per_curve),
+        smin=_fmt_float(s_airfoil),
+        smax=_fmt_float(s_far),
+        dmin=_fmt_float(dmin),
+        dmax=_fmt_float(dmax),
+    ))
+    return "".join(parts)
 
 
 def emit_background_field(active_field_ids: Sequence[int]) -> str:
@@ -114,20 +135,7 @@ def emit_background_field(active_field_ids: Sequence[int]) -> str:
     if not active_field_ids:
         return ""
 
-    buf = io.StringIO()
-    W = buf.write
-
-    W("// Combine scalar metrics via Min field\n")
-    W("Field[10] = Min;\n")
-    W("Field[10].FieldsList = {" + ", ".join(str(fid) for fid in sorted(set(active_field_ids))) + "};\n")
-    W("Background Field = 10;\n\n")
-
-    return buf.getvalue()
-
-
-def _fmt_float(x: float) -> str:
-    """Format float for Gmsh compatibility."""
-    return "{:.16g}".format(float(x))
+    return _BACKGROUND_FIELD.format(ids=", ".join(map(str, sorted(set(active_field_ids)))))
 
 
 def validate_distance_parameters(dmin: float, dmax: float) -> None:
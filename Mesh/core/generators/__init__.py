@@ -15,6 +15,8 @@ Modules:
 --------
 - gmsh_generator:   Gmsh-based mesh generation (current production implementation)
 
+- gmsh_api_generator: In-process Gmsh via its Python API (optional `gmsh` package)
+
 - custom_generator: Placeholder for future custom mesh generation algorithm
 
 Notes:
@@ -25,10 +27,14 @@ Notes:
 """
 
 from .gmsh_generator import GmshGenerator, default_gmsh_generator
+from .gmsh_api_generator import GmshApiGenerator, PersistentGmshSession, finalize_gmsh_api
 from .custom_generator import CustomGenerator
 
 __all__ = [
     "GmshGenerator",
     "default_gmsh_generator",
+    "GmshApiGenerator",
+    "PersistentGmshSession",
+    "finalize_gmsh_api",
     "CustomGenerator",
 ]
@@ -17,6 +17,7 @@ Notes:
 - This file serves as a template for future development
 - Maintains the same abstract interface as GmshGenerator
 - Will be populated when custom meshing algorithm is developed
+- Instantiating the placeholder itself raises NotImplementedError immediately
 """
 
 from ..base import MeshGenerator
@@ -31,6 +32,12 @@ class CustomGenerator(MeshGenerator):
     replace Gmsh while maintaining the same external interface.
     """
 
+    def __new__(cls, *args, **kwargs):
+        # Fail at construction rather than on the first method call
+        if cls is CustomGenerator:
+            raise NotImplementedError("CustomGenerator is not yet implemented")
+        return super().__new__(cls)
+
     def generate_geometry(self, domain, settings: Dict[str, Any]) -> str:
         """
         Generate custom format geometry definition.
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# Flowxus/mesh/core/generators/gmsh_api_generator.py
+
+"""
+Project: Flowxus
+Author: Erfan Vaezi
+Date: 11/28/2025
+
+Purpose:
+--------
+MeshGenerator that drives Gmsh in-process through its Python API (`import gmsh`)
+instead of launching the Gmsh binary for every mesh.
+
+Main Tasks:
+-----------
+    1. Initialize the Gmsh API once per process and reuse it across meshes
+    2. Apply the same settings as GmshGenerator (algo, extra_cli, threads, format)
+    3. Open the .geo, generate the mesh and write the .msh in-process
+    4. Validate the resulting .msh file as GmshGenerator does
+    5. Scope one Gmsh session over a batch of meshes (`PersistentGmshSession`)
+
+Notes:
+------
+- Optional dependency: requires the `gmsh` Python package, imported lazily on the first
+  mesh or session (importing this module does not load it); `generate_mesh` raises
+  RuntimeError if it is missing. Geometry generation is inherited from GmshGenerator.
+- Saves one fork+exec and Gmsh start-up per mesh; worthwhile for sweeps over many
+  small designs. Call `finalize_gmsh_api()` once the batch is done, or run the batch
+  inside `with PersistentGmshSession() as session:`.
+- The Gmsh API is process-global and not thread-safe: calls are serialized by a lock.
+  Use `runner.mesh_geo_batch` with the CLI generator for concurrent meshing.
+- Options are reset to their defaults before each mesh, then set before the .geo is
+  opened, so the .geo script's own options win as they do with the CLI.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+from .gmsh_generator import GmshGenerator, _THREAD_OPTIONS
+
+# The optional `gmsh` module, imported on first use by `_has_gmsh` (loading the Gmsh
+# library is not free, and CLI-only users never need it)
+gmsh = None
+
+# Serializes all use of the (process-global) Gmsh API
+_LOCK = threading.Lock()
+
+# msh_format -> Mesh.MshFileVersion
+_MSH_VERSION = {"msh2": 2.2, "msh4": 4.1}
+
+
+def _has_gmsh() -> bool:
+    """Import the `gmsh` package on first call; True if it is available."""
+    global gmsh
+    if gmsh is None:
+        try:
+            import gmsh as _gmsh  # optional, in-process meshing
+        except Exception:
+            return False
+        gmsh = _gmsh
+    return True
+
+
+def _ensure_initialized() -> None:
+    """Start the Gmsh API session if it is not running yet (caller holds `_LOCK`)."""
+    if not gmsh.isInitialized():
+        # interruptible=False: no SIGINT handler, so this also works off the main thread
+        gmsh.initialize(readConfigFiles=False, interruptible=False)
+
+
+def finalize_gmsh_api() -> None:
+    """End the in-process Gmsh session started by `GmshApiGenerator` (no-op if none)."""
+    if gmsh is None:
+        return  # never imported, so no session
+    with _LOCK:
+        if gmsh.isInitialized():
+            gmsh.finalize()
+
+
+class GmshApiGenerator(GmshGenerator):
+    """
+    Gmsh generator running in-process via the Gmsh Python API.
+
+    Accepts the same settings as GmshGenerator.generate_mesh; `gmsh_bin` is ignored.
+    """
+
+    def generate_mesh(self, input_path: str, output_path: str,
+                      settings: Dict[str, Any]) -> str:
+        """
+        Generate a mesh from a .geo file with the in-process Gmsh API.
+
+        Parameters
+        ----------
+        input_path : str
+            Path to input .geo file
+        output_path : str
+            Path for output .msh file
+        settings : Dict[str, Any]
+            Same keys as GmshGenerator.generate_mesh (dim, algo, extra_cli,
+            msh_format, binary, num_threads)
+
+        Returns
+        -------
+        str
+            Path to generated .msh file
+
+        Raises
+        ------
+        FileNotFoundError
+            If input_path does not exist
+        ValueError
+            If msh_format is not "msh2" or "msh4"
+        RuntimeError
+            If the gmsh package is missing, Gmsh fails, or the output file is invalid
+        """
+        if not _has_gmsh():
+            raise RuntimeError("gmsh Python package not installed; use GmshGenerator (CLI) or install gmsh.")
+
+        # Extract settings with defaults
+        dim = settings.get('dim', 2)
+        algo = settings.get('algo')
+        extra_cli = settings.get('extra_cli') or {}
+        msh_format = settings.get('msh_format', 'msh4')
+        nt = max(1, int(settings.get('num_threads') or os.cpu_count() or 1))
+
+        # Validate input file exists (one stat)
+        try:
+            os.stat(input_path)
+        except OSError:
+            raise FileNotFoundError(f"Geometry file not found: {input_path}") from None
+
+        # Validate mesh format
+        fmt = (msh_format or "msh4").lower()
+        if fmt not in _MSH_VERSION:
+            raise ValueError(f"msh_format must be 'msh2' or 'msh4' (got '{msh_format}')")
+        binary = settings.get('binary')
+        if binary is None:
+            binary = fmt == "msh4"
+
+        # Create output directory if needed (no-op when it exists)
+        out_dir = os.path.dirname(os.path.abspath(output_path))
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+
+        with _LOCK:
+            _ensure_initialized()
+            try:
+                gmsh.clear()
+                gmsh.option.restoreDefaults()
+                gmsh.option.setNumber("General.Terminal", 1)
+                gmsh.option.setNumber("General.Verbosity", 2)
+                gmsh.option.setNumber("Mesh.MshFileVersion", _MSH_VERSION[fmt])
+                gmsh.option.setNumber("Mesh.Binary", 1 if binary else 0)
+
+                # Multithreaded meshing; keys also given in extra_cli take precedence
+                for key in _THREAD_OPTIONS:
+                    if key not in extra_cli:
+                        gmsh.option.setNumber(key, nt)
+                if algo is not None:
+                    gmsh.option.setNumber("Mesh.Algorithm", int(algo))
+                for k, v in extra_cli.items():
+                    if isinstance(v, (int, float)):
+                        gmsh.option.setNumber(str(k), float(v))
+                    else:
+                        gmsh.option.setString(str(k), str(v))
+
+                gmsh.open(input_path)
+                gmsh.model.mesh.generate(abs(int(dim)))
+                gmsh.write(output_path)
+            except Exception as e:
+                raise RuntimeError(f"Gmsh (API) failed on {input_path}: {e}") from e
+            finally:
+                gmsh.clear()
+
+        # Validate output file
+        try:
+            size = os.path.getsize(output_path)
+        except OSError as e:
+            raise RuntimeError(f"Gmsh reported success but mesh file not found: {output_path}") from e
+
+        if size < 200:
+            raise RuntimeError(
+                f"Gmsh wrote an unexpectedly small mesh ({size} bytes). "
+                "This usually means no 2D elements were generated. "
+                "Inspect the .geo (surface definition) and Gmsh output."
+            )
+
+        return output_path
+
+
+class PersistentGmshSession:
+    """
+    Context manager holding one in-process Gmsh session open across many meshes.
+
+    `run` meshes one job (`gmsh.clear()` between jobs, no re-initialization); on exit
+    the session is finalized if this context started it.
+
+    Examples
+    --------
+    >>> with PersistentGmshSession() as session:
+    ...     for geo, msh in jobs:
+    ...         session.run(geo, msh, {"dim": 2})
+    """
+
+    def __init__(self, generator: Optional[GmshApiGenerator] = None):
+        self.generator = generator or GmshApiGenerator()
+        self._started = False
+
+    def __enter__(self) -> "PersistentGmshSession":
+        if not _has_gmsh():
+            raise RuntimeError("gmsh Python package not installed; cannot open a Gmsh session.")
+        with _LOCK:
+            self._started = not gmsh.isInitialized()
+            _ensure_initialized()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._started:
+            finalize_gmsh_api()
+            self._started = False
+
+    def run(self, geo_path: str, msh_path: str, settings: Optional[Dict[str, Any]] = None) -> str:
+        """Mesh `geo_path` into `msh_path` in the open session; returns `msh_path`."""
+        return self.generator.generate_mesh(geo_path, msh_path, settings or {})
@@ -23,15 +23,93 @@ Notes:
 - Maintains identical functionality to original runner.py
 - Implements the MeshGenerator abstract interface
 - Can be used interchangeably with future custom generators
+- The PATH lookup for the Gmsh binary is cached per PATH value; a binary removed or
+  replaced on PATH mid-process is not re-resolved
+- Only the last ~64 KB of Gmsh stdout/stderr are kept (for the failure message)
+- MSH4 output is binary by default (smaller, faster to read with meshio); pass
+  `binary=False` for ASCII
+- Gmsh is run multithreaded (`-nt` plus the thread-cap options), on all cores by default
 """
 
 import os
 import subprocess
-from typing import Dict, List, Any
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from mesh.tools.utils import ensure_exec_on_path
 from ..base import MeshGenerator
 
 
+# Gmsh options that cap its OpenMP thread count; all set to `num_threads`
+_THREAD_OPTIONS = (
+    "General.NumThreads",
+    "Mesh.MaxNumThreads1D",
+    "Mesh.MaxNumThreads2D",
+    "Mesh.MaxNumThreads3D",
+)
+
+
+def _resolve_gmsh(gmsh_bin: Optional[str] = None) -> str:
+    """Gmsh executable: explicit path, else $GMSH_BIN, else PATH lookup (memoized per PATH)."""
+    return gmsh_bin or os.environ.get("GMSH_BIN") or _gmsh_on_path(os.environ.get("PATH", ""))
+
+
+@lru_cache(maxsize=4)
+def _gmsh_on_path(path_env: str) -> str:
+    """`ensure_exec_on_path("gmsh")`, cached on the PATH value it searched."""
+    return ensure_exec_on_path("gmsh")
+
+
+# Gmsh output kept for error messages: the last _TAIL_CHUNKS reads of _TAIL_READ chars
+_TAIL_READ = 4096
+_TAIL_CHUNKS = 16
+
+
+def _drain(stream, tail: deque) -> None:
+    """Read `stream` to EOF, keeping only its last chunks in `tail`."""
+    for chunk in iter(lambda: stream.read(_TAIL_READ), ""):
+        tail.append(chunk)
+    stream.close()
+
+
+def _run_tail(cmd: List[str]) -> Tuple[int, str, str]:
+    """
+    Run `cmd` to completion and return (returncode, stdout tail, stderr tail); both pipes
+    are drained concurrently so memory stays bounded at ~64 KB each however verbose the run.
+    """
+    # close_fds=False lets CPython use posix_spawn instead of fork+exec; fds opened by
+    # Python are non-inheritable (PEP 446), so the child only gets its three std streams
+    # errors="replace": an undecodable byte must not kill a reader thread (the pipe would
+    # then fill and block the child forever)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                            errors="replace", close_fds=False)
+    out: deque = deque(maxlen=_TAIL_CHUNKS)
+    err: deque = deque(maxlen=_TAIL_CHUNKS)
+    readers = [threading.Thread(target=_drain, args=(proc.stdout, out), daemon=True),
+               threading.Thread(target=_drain, args=(proc.stderr, err), daemon=True)]
+    for t in readers:
+        t.start()
+    code = proc.wait()
+    for t in readers:
+        t.join()
+    return code, "".join(out), "".join(err)
+
+
+def _option_args(nt: int, algo: Optional[int], extra_cli: Optional[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Flat `-setnumber`/`-setstring` argv for the thread caps (unless overridden in
+    `extra_cli`), the surface algorithm if given, then every `extra_cli` entry.
+    """
+    for key in _THREAD_OPTIONS:
+        if not extra_cli or key not in extra_cli:
+            yield from ("-setnumber", key, str(nt))
+    if algo is not None:
+        yield from ("-setnumber", "Mesh.Algorithm", str(int(algo)))
+    for k, v in (extra_cli or {}).items():
+        yield from ("-setnumber" if isinstance(v, (int, float)) else "-setstring", str(k), str(v))
+
+
 class GmshGenerator(MeshGenerator):
     """
     Gmsh-specific mesh generator implementation.
@@ -101,6 +179,9 @@ class GmshGenerator(MeshGenerator):
             - extra_cli: Additional Gmsh options
             - gmsh_bin: Explicit Gmsh binary path
             - msh_format: Output format ("msh2" or "msh4")
+            - binary: Write a binary .msh (default: True for msh4, False for msh2)
+            - num_threads: Gmsh threads (default: os.cpu_count()); keys also given
+              in extra_cli take precedence
 
         Returns
         -------
@@ -122,52 +203,48 @@ class GmshGenerator(MeshGenerator):
         extra_cli = settings.get('extra_cli')
         gmsh_bin = settings.get('gmsh_bin')
         msh_format = settings.get('msh_format', 'msh4')
+        nt = max(1, int(settings.get('num_threads') or os.cpu_count() or 1))
 
-        # Validate input file exists
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"Geometry file not found: {input_path}")
+        # Validate input file exists (one stat)
+        try:
+            os.stat(input_path)
+        except OSError:
+            raise FileNotFoundError(f"Geometry file not found: {input_path}") from None
 
-        # Create output directory if needed
+        # Create output directory if needed (no-op when it exists)
         out_dir = os.path.dirname(os.path.abspath(output_path))
-        if out_dir and not os.path.exists(out_dir):
+        if out_dir:
             os.makedirs(out_dir, exist_ok=True)
 
         # Locate Gmsh binary
-        gmsh = gmsh_bin or os.environ.get("GMSH_BIN") or ensure_exec_on_path("gmsh")
+        gmsh = _resolve_gmsh(gmsh_bin)
 
         # Validate mesh format
         fmt = (msh_format or "msh4").lower()
         if fmt not in ("msh2", "msh4"):
             raise ValueError(f"msh_format must be 'msh2' or 'msh4' (got '{msh_format}')")
-
-        # Build Gmsh command
-        cmd: List[str] = [gmsh, f"-{abs(int(dim))}", input_path, "-o", output_path, "-format", fmt]
-
-        # Add algorithm if specified
-        if algo is not None:
-            cmd += ["-setnumber", "Mesh.Algorithm", str(int(algo))]
-
-        # Add extra CLI options
-        if extra_cli:
-            for k, v in extra_cli.items():
-                key = str(k)
-                if isinstance(v, (int, float)):
-                    cmd += ["-setnumber", key, str(v)]
-                else:
-                    cmd += ["-setstring", key, str(v)]
-
-        # Add standard options: save results, no GUI, moderate verbosity
-        cmd += ["-save", "-nopopup", "-v", "2"]
+        binary = settings.get('binary')
+        if binary is None:
+            binary = fmt == "msh4"
+
+        # Build Gmsh command in one go: threads, algorithm, extra options, then batch flags
+        cmd: List[str] = [
+            gmsh, f"-{abs(int(dim))}", input_path, "-o", output_path, "-format", fmt,
+            *(("-bin",) if binary else ()),
+            "-nt", str(nt),
+            *_option_args(nt, algo, extra_cli),
+            "-save", "-nopopup", "-v", "2",  # save results, no GUI, moderate verbosity
+        ]
 
         # Execute Gmsh
-        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        if proc.returncode != 0:
+        code, out_tail, err_tail = _run_tail(cmd)
+        if code != 0:
             msg = (
                 "Gmsh failed (code {}):\n"
                 "CMD: {}\n"
                 "STDOUT:\n{}\n"
                 "STDERR:\n{}"
-            ).format(proc.returncode, " ".join(cmd), proc.stdout, proc.stderr)
+            ).format(code, " ".join(cmd), out_tail, err_tail)
             raise RuntimeError(msg)
 
         # Validate output file
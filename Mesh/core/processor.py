@@ -23,10 +23,55 @@ Notes:
 - This module focuses purely on data processing and validation
 - No Gmsh-specific logic - can be reused by any mesh generator
 - Maintains identical error handling and validation as original writer.py
+- Per-vertex sizes are returned as a closed float64 array
+- CSV-derived sizes are cached per (file, mtime, size, size_map); a rewrite that keeps
+  both mtime and size is not seen until the entry is evicted
 """
 
-from typing import Dict, Optional, Sequence, Callable, Any
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Callable, Any, Tuple
 import csv
+import os
+import numpy as np
+
+
+# Parsed CSV sizes per (abspath, mtime_ns, size, size_map), most recently used last
+_CSV_CACHE: "OrderedDict[Tuple[Any, ...], np.ndarray]" = OrderedDict()
+_CSV_CACHE_SIZE = 64
+
+
+def _csv_sizes(scalars_csv_path: str, size_map: Callable[[Dict[str, str]], float]) -> np.ndarray:
+    """
+    Per-row sizes from `size_map` over the CSV rows (None results dropped), as a read-only
+    float64 array; empty if the file cannot be read or parsed. Memoized until the file's
+    mtime or size changes.
+    """
+    try:
+        st = os.stat(scalars_csv_path)
+    except OSError:
+        return np.empty(0)
+    key = (os.path.abspath(scalars_csv_path), st.st_mtime_ns, st.st_size, size_map)
+    if key in _CSV_CACHE:
+        _CSV_CACHE.move_to_end(key)
+        return _CSV_CACHE[key]
+
+    sizes = []
+    try:
+        with open(scalars_csv_path, "r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                val = size_map(row)
+                if val is not None:
+                    sizes.append(float(val))
+    except Exception:
+        return np.empty(0)
+
+    arr = np.array(sizes, dtype=np.float64)
+    arr.flags.writeable = False
+    _CSV_CACHE[key] = arr
+    if len(_CSV_CACHE) > _CSV_CACHE_SIZE:
+        _CSV_CACHE.popitem(last=False)
+    return arr
 
 
 def process_domain(domain, inflation_settings: Dict[str, float],
@@ -104,31 +149,25 @@ def process_domain(domain, inflation_settings: Dict[str, float],
         chord = float(max(1e-12, bbox["xmax"] - bbox["xmin"]))
     chord_scale = chord if chord > 0.0 else 1.0
 
-    # --- Optional per-vertex airfoil point sizes: ensure a closed list if provided ---
-    point_sizes = airfoil_point_sizes
-    if point_sizes is not None:
-        if len(point_sizes) == N - 1:
-            point_sizes = list(point_sizes) + [point_sizes[0]]
-        elif len(point_sizes) != N:
+    # --- Optional per-vertex airfoil point sizes: ensure a closed float64 array if provided ---
+    point_sizes = None
+    if airfoil_point_sizes is not None:
+        arr = np.asarray(airfoil_point_sizes, dtype=np.float64)
+        if len(arr) == N - 1:
+            point_sizes = np.concatenate([arr, arr[:1]])
+        elif len(arr) == N:
+            point_sizes = arr
+        else:
             raise ValueError(
-                f"airfoil_point_sizes must have length {N} (closed) or {N - 1} (open), got {len(point_sizes)}"
+                f"airfoil_point_sizes must have length {N} (closed) or {N - 1} (open), got {len(arr)}"
             )
 
     # --- Optionally derive per-vertex sizes from a CSV via size_map ---
     if point_sizes is None and scalars_csv_path and size_map:
-        sizes = []
-        try:
-            with open(scalars_csv_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    val = size_map(row)
-                    if val is not None:
-                        sizes.append(float(val))
-        except Exception:
-            sizes = []
-        if sizes and len(sizes) in (N, N - 1):
-            if len(sizes) == N - 1:
-                sizes.append(sizes[0])
+        sizes = _csv_sizes(scalars_csv_path, size_map)
+        if len(sizes) and len(sizes) == N - 1:
+            point_sizes = np.concatenate([sizes, sizes[:1]])
+        elif len(sizes) and len(sizes) == N:
             point_sizes = sizes
 
     # Enable BL only if requested AND there are layers
@@ -23,14 +23,36 @@ Notes:
 - This module serves as a thin wrapper around processor and assembler
 - All external APIs are preserved for zero breaking changes
 - Internal implementation uses the new modular architecture
+- Assembled `.geo` text is memoized (LRU, 32 entries) on the processed domain data;
+  processing and validation still run on every call
 """
 
+import hashlib
 import os
-from typing import Dict, Optional, Sequence, Callable
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Callable, Tuple
+import numpy as np
 from .processor import process_domain
 from .assembler import assemble_geo_script
 
 
+# Assembled .geo text per processed-data key, most recently used last
+_GEO_CACHE: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+_GEO_CACHE_SIZE = 32
+
+
+def _freeze(x: Any) -> Any:
+    """Hashable, type-preserving stand-in for `x` (arrays by content digest)."""
+    if isinstance(x, np.ndarray):
+        a = np.ascontiguousarray(x)
+        return ("nd", a.shape, a.dtype.str, hashlib.blake2b(a.tobytes(), digest_size=16).digest())
+    if isinstance(x, dict):
+        return ("d",) + tuple(sorted((k, _freeze(v)) for k, v in x.items()))
+    if isinstance(x, (list, tuple)):
+        return ("s",) + tuple(_freeze(v) for v in x)
+    return (type(x).__name__, x)
+
+
 def gmsh_geo_from_domain(
         domain,
         inflation_settings: Dict[str, float],
@@ -131,8 +153,21 @@ def gmsh_geo_from_domain(
         size_map=size_map,
     )
 
-    # Assemble GEO script from processed data
-    geo_script = assemble_geo_script(processed_data)
+    # Assemble GEO script from processed data (reused for identical inputs)
+    try:
+        key = _freeze(processed_data)
+        hash(key)
+    except TypeError:  # unhashable value somewhere in the settings
+        return assemble_geo_script(processed_data)
+
+    geo_script = _GEO_CACHE.get(key)
+    if geo_script is None:
+        geo_script = assemble_geo_script(processed_data)
+        _GEO_CACHE[key] = geo_script
+        if len(_GEO_CACHE) > _GEO_CACHE_SIZE:
+            _GEO_CACHE.popitem(last=False)
+    else:
+        _GEO_CACHE.move_to_end(key)
 
     return geo_script
 
@@ -157,11 +192,14 @@ def write_geo_file(geo_text: str, path: str) -> str:
     -----
     This function does no validation of the `.geo` content. It is typically
     followed by a call to the runner (`mesh.gmsh.runner.mesh_geo`) which will
-    invoke the Gmsh binary and report any CLI errors.
+    invoke the Gmsh binary and report any CLI errors. The text is written as UTF-8
+    bytes with "\n" line endings on every platform.
     """
     dirname = os.path.dirname(path)
-    if dirname and not os.path.exists(dirname):
-        os.makedirs(dirname)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(geo_text)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    # Encode once and hand the whole script to a single binary write
+    data = geo_text.encode("utf-8")
+    with open(path, "wb", buffering=max(1 << 20, len(data))) as f:
+        f.write(data)
     return path
@@ -24,6 +24,7 @@ Notes:
     - On Windows, users often put quotes in env vars; os.path.isfile('"C:\\path\\gmsh.exe"') returns False.
 """
 
+import math
 import os
 import shutil
 
@@ -35,6 +36,9 @@ def bl_thickness(first_layer, n_layers, growth_rate):
       thickness = a * (1 - r^N) / (1 - r)    if r != 1
                 = a * N                      if r == 1
 
+    Evaluated in closed form (no per-layer loop) as a * expm1(N*log1p(r-1)) / (r-1),
+    which stays accurate for growth rates just above 1.
+
     Parameters
     ----------
     first_layer : float > 0          (ignored if n_layers == 0)
@@ -62,10 +66,11 @@ def bl_thickness(first_layer, n_layers, growth_rate):
         raise ValueError("growth_rate must be >= 1.0.")
 
     # Guard for near-unity growth rate to avoid cancellation
-    if abs(growth_rate - 1.0) < 1e-12:
+    g = growth_rate - 1.0
+    if g < 1e-12:
         return first_layer * n_layers
 
-    return first_layer * (1.0 - (growth_rate ** n_layers)) / (1.0 - growth_rate)
+    return first_layer * math.expm1(n_layers * math.log1p(g)) / g
 
 
 def ensure_exec_on_path(exe_name):
@@ -14,6 +14,7 @@ Main Tasks:
 ----------
    - check_physical_groups: verify that required Physical group names exist in
      the mesh file (works when `meshio` is installed; otherwise no-ops cleanly).
+   - PhysicalGroupMissing: raised for absent groups, carrying the missing names.
 
 Notes:
 ------
@@ -26,6 +27,17 @@ import os
 from typing import List, Dict, Optional
 
 
+class PhysicalGroupMissing(RuntimeError):
+    """
+    Required physical groups are absent from the mesh; `missing` lists their names
+    (in the order they were required).
+    """
+
+    def __init__(self, missing: List[str], message: str):
+        self.missing = list(missing)
+        super().__init__(message)
+
+
 def check_physical_groups(
     msh_path: str,
     required: List[str],
@@ -53,6 +65,8 @@ def check_physical_groups(
     -----
     - Requires 'meshio'. If not installed, this function returns silently.
     - This is a light check; it doesn't validate exact curve IDs or orientations.
+    - Absent groups raise `PhysicalGroupMissing` (a RuntimeError) with `.missing` set;
+      other failures raise plain RuntimeError.
     """
 
     # Soft dependency on meshio
@@ -96,7 +110,8 @@ def check_physical_groups(
     missing = [name for name in required if name not in groups]
     if missing:
         available = ", ".join(sorted(groups.keys())) or "<none>"
-        raise RuntimeError(
+        raise PhysicalGroupMissing(
+            missing,
             "Missing expected physical groups in '{}': {}. Available: [{}]. "
             "Ensure your .geo defines them correctly."
             .format(msh_path, missing, available)
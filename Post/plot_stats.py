@@ -114,13 +114,12 @@ def _tri_angles(points: np.ndarray, tris: Optional[np.ndarray]) -> np.ndarray:
     P2 = points[tris[:, 2], :2]
 
     def ang(a, b, c):
+        # atan2(|cross|, dot): no division, so a collapsed edge reads 0° instead of a fake 90°
         ba = a - b
         bc = c - b
-        nba = np.einsum("ij,ij->i", ba, ba)
-        nbc = np.einsum("ij,ij->i", bc, bc)
         dot = np.einsum("ij,ij->i", ba, bc)
-        cos = np.clip(dot / (np.sqrt(nba) * np.sqrt(nbc) + 1e-30), -1.0, 1.0)
-        return np.degrees(np.arccos(cos))
+        crs = ba[:, 0] * bc[:, 1] - ba[:, 1] * bc[:, 0]
+        return np.degrees(np.arctan2(np.abs(crs), dot))
 
     A = ang(P1, P0, P2)
     B = ang(P2, P1, P0)
@@ -193,10 +192,8 @@ def _quad_skewness(points: np.ndarray, quads: Optional[np.ndarray]) -> np.ndarra
 
     def angle(u, v):
         dot = np.einsum("ij,ij->i", u, v)
-        nu = np.linalg.norm(u, axis=1)
-        nv = np.linalg.norm(v, axis=1)
-        cos = np.clip(dot / (nu * nv + 1e-30), -1.0, 1.0)
-        return np.degrees(np.arccos(cos))
+        crs = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+        return np.degrees(np.arctan2(np.abs(crs), dot))
 
     a0 = angle(P1 - P0, P3 - P0)
     a1 = angle(P2 - P1, P0 - P1)